@@ -0,0 +1,502 @@
+import argparse
+import bisect
+import hashlib
+import lzma
+import os
+import queue
+import struct
+import sys
+import time
+import zlib
+from collections import namedtuple
+from datetime import datetime
+from difflib import SequenceMatcher
+from threading import Event, Thread
+from config import Config
+from response_cache import file_lock
+from utils import log_error
+
+# File name suffix of snapshot archives
+ARCHIVE_SUFFIX = ".ecar"
+
+# File header: magic, format version, codec id
+MAGIC = b"ECALARC"
+VERSION = 1
+
+# Compression codecs: name -> (id, compress, decompress)
+CODECS = {
+    "lzma": (b"x", lzma.compress, lzma.decompress),
+    "zlib": (b"z", lambda content: zlib.compress(content, 9), zlib.decompress),
+}
+
+# Record header: timestamp, kind, SHA-1 of the snapshot, snapshot size, payload size
+RECORD = struct.Struct("<dB20sII")
+
+# Record kinds: a compressed snapshot, a compressed delta against the previous record,
+# or no payload because the same snapshot is already stored
+FULL, DELTA, SAME = 0, 1, 2
+
+# Delta operations: copy lines of the previous snapshot, or insert literal bytes
+COPY = struct.Struct("<cII")
+INSERT = struct.Struct("<cI")
+
+# A delta whose literal bytes exceed this share of the snapshot is stored as a full record instead
+MAX_DELTA_RATIO = 0.5
+
+# Archive shared by every Fetcher of this process, created on first use
+_default_archive = None
+
+Record = namedtuple("Record", "timestamp kind digest size offset length")
+
+
+def encode_delta(base, content):
+    """
+    Encode a snapshot as line-level edits of the previous one.
+    :param base: The previous snapshot as bytes.
+    :param content: The snapshot as bytes.
+    :return: A tuple (delta, literal_bytes).
+    """
+    base_lines = base.splitlines(keepends=True)
+    lines = content.splitlines(keepends=True)
+    delta = bytearray()
+    literal_bytes = 0
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, base_lines, lines, autojunk=False).get_opcodes():
+        if tag == "equal":
+            delta += COPY.pack(b"C", i1, i2 - i1)
+        elif j2 > j1:
+            literal = b"".join(lines[j1:j2])
+            delta += INSERT.pack(b"I", len(literal)) + literal
+            literal_bytes += len(literal)
+    return bytes(delta), literal_bytes
+
+
+def apply_delta(base, delta):
+    """
+    Rebuild a snapshot from the previous one and a delta (see encode_delta).
+    :param base: The previous snapshot as bytes.
+    :param delta: The decompressed delta.
+    :return: The snapshot as bytes.
+    """
+    base_lines = base.splitlines(keepends=True)
+    parts = []
+    position = 0
+    while position < len(delta):
+        if delta[position:position + 1] == b"C":
+            _, start, count = COPY.unpack_from(delta, position)
+            parts.extend(base_lines[start:start + count])
+            position += COPY.size
+        else:
+            _, length = INSERT.unpack_from(delta, position)
+            position += INSERT.size
+            parts.append(delta[position:position + length])
+            position += length
+    return b"".join(parts)
+
+
+class SnapshotArchive:
+    def __init__(self, path, codec="lzma", delta=True, keyframe_interval=16):
+        """
+        Append-only archive of calendar snapshots in a single file.
+        Identical snapshots are stored once (content-addressed by SHA-1); others are compressed,
+        either whole or as a line delta against the previous snapshot. A full record is written at
+        least every keyframe_interval records, which bounds the work of random access.
+        Appends from several processes are serialized with a lock file next to the archive; each
+        writer first reads the records the others appended. Any number of processes can read it.
+        :param path: Path to the archive file (created on first append).
+        :param codec: "lzma" or "zlib" for new archives; existing archives keep their codec.
+        :param delta: Store snapshots as deltas against the previous one when smaller.
+        :param keyframe_interval: Maximum number of consecutive delta records.
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec}")
+        self.path = path
+        self.codec = codec
+        self.delta = delta
+        self.keyframe_interval = keyframe_interval
+        self.records = []
+        self.timestamps = []
+        # SHA-1 -> index of the first record storing that snapshot
+        self.digests = {}
+        # Consecutive delta records at the end of the archive
+        self.chain = 0
+        # End of the last complete record; a partially written record after it is discarded
+        self.end = None
+        self.file = None
+        self.writable = False
+        # Last decoded snapshot, reused by sequential reads and appends
+        self.cached = None
+        if os.path.exists(path):
+            self.load_index()
+
+    def load_index(self):
+        """
+        Read the record headers appended since the last call (by this or another process),
+        skipping over the payloads.
+        """
+        if self.file is None:
+            self.file = open(self.path, "rb")
+        # Seeking to the end drops buffered bytes, which another writer may have replaced since
+        size = self.file.seek(0, os.SEEK_END)
+        if self.end is None:
+            if size == 0:
+                return  # Created by another process that has not written the header yet
+            self.file.seek(0)
+            header = self.file.read(len(MAGIC) + 2)
+            if len(header) < len(MAGIC) + 2 or not header.startswith(MAGIC):
+                raise ValueError(f"Not a snapshot archive: {self.path}")
+            if header[len(MAGIC)] != VERSION:
+                raise ValueError(f"Unsupported archive version {header[len(MAGIC)]}: {self.path}")
+            self.codec = next(name for name, (codec_id, _, _) in CODECS.items() if codec_id == header[-1:])
+            self.end = len(header)
+
+        offset = self.end
+        while offset + RECORD.size <= size:
+            self.file.seek(offset)
+            timestamp, kind, digest, snapshot_size, length = RECORD.unpack(self.file.read(RECORD.size))
+            if offset + RECORD.size + length > size:
+                break  # Interrupted while writing this record
+            self.add_record(Record(timestamp, kind, digest, snapshot_size, offset + RECORD.size, length))
+            offset += RECORD.size + length
+        self.end = offset
+        if offset < size:
+            log_error(f"Ignoring {size - offset} bytes of an incomplete record in {self.path}")
+
+    def add_record(self, record):
+        """
+        Add a record to the in-memory index.
+        :param record: The Record.
+        """
+        if record.kind != SAME:
+            self.digests.setdefault(record.digest, len(self.records))
+        self.chain = self.chain + 1 if record.kind == DELTA else 0 if record.kind == FULL else self.chain
+        self.records.append(record)
+        self.timestamps.append(record.timestamp)
+
+    def open_for_append(self):
+        """
+        Open the archive file for writing, creating it if needed. Called with the lock held.
+        """
+        if self.file is not None:
+            self.file.close()
+        self.file = open(self.path, "r+b" if os.path.exists(self.path) else "w+b")
+        self.writable = True
+
+    def sync(self):
+        """
+        Bring the index up to date before appending: write the header of a new archive, read the
+        records appended by other processes and drop an incomplete last record. Called with the lock held.
+        """
+        if not self.writable:
+            self.open_for_append()
+        if self.end is None and os.fstat(self.file.fileno()).st_size == 0:
+            self.file.write(MAGIC + bytes([VERSION]) + CODECS[self.codec][0])
+            self.end = self.file.tell()
+        else:
+            self.load_index()
+        self.file.truncate(self.end)
+
+    def append(self, content, timestamp=None, clamp=False):
+        """
+        Add a snapshot to the archive.
+        :param content: The raw HTML content as bytes.
+        :param timestamp: Capture time in seconds since the epoch, defaults to now.
+                          Snapshots must be added in time order.
+        :param clamp: Record a timestamp earlier than the last snapshot (the clock went back, or another
+                      process appended meanwhile) at the time of the last snapshot instead of raising
+                      ValueError. Always done for the default timestamp.
+        :return: The record kind (FULL, DELTA or SAME).
+        """
+        with file_lock(self.path + ".lock"):
+            self.sync()
+            return self.write_record(content, time.time() if timestamp is None else timestamp,
+                                     clamp or timestamp is None)
+
+    def write_record(self, content, timestamp, clamp=False):
+        """
+        Encode a snapshot and write its record at the end of the archive. Called with the lock held.
+        :param content: The raw HTML content as bytes.
+        :param timestamp: Capture time in seconds since the epoch.
+        :param clamp: Clamp a timestamp earlier than the last snapshot instead of raising ValueError.
+        :return: The record kind (FULL, DELTA or SAME).
+        """
+        if self.timestamps and timestamp < self.timestamps[-1]:
+            if not clamp:
+                raise ValueError("Snapshots must be appended in time order")
+            timestamp = self.timestamps[-1]
+
+        digest = hashlib.sha1(content).digest()
+        kind, payload = FULL, b""
+        if digest in self.digests:
+            kind = SAME
+        else:
+            compress = CODECS[self.codec][1]
+            if self.delta and self.records and self.chain < self.keyframe_interval:
+                delta, literal_bytes = encode_delta(self.read(len(self.records) - 1), content)
+                if literal_bytes <= MAX_DELTA_RATIO * len(content):
+                    kind, payload = DELTA, compress(delta)
+            if kind == FULL:
+                payload = compress(content)
+
+        self.file.seek(self.end)
+        self.file.write(RECORD.pack(timestamp, kind, digest, len(content), len(payload)) + payload)
+        self.file.flush()
+        self.add_record(Record(timestamp, kind, digest, len(content), self.end + RECORD.size, len(payload)))
+        self.end += RECORD.size + len(payload)
+        self.cached = (len(self.records) - 1, content)
+        return kind
+
+    def read_payload(self, record):
+        """
+        Read and decompress the payload of a record.
+        :param record: The Record.
+        :return: The decompressed payload.
+        """
+        self.file.seek(record.offset)
+        return CODECS[self.codec][2](self.file.read(record.length))
+
+    def read(self, index):
+        """
+        Get a snapshot by position (random access).
+        :param index: Position of the snapshot in the archive (negative values count from the end).
+        :return: The raw HTML content as bytes.
+        """
+        index = range(len(self.records))[index]
+        # Walk back to a record that decodes on its own, then apply the deltas forward
+        deltas = []
+        position = index
+        while True:
+            if self.cached is not None and self.cached[0] == position:
+                content = self.cached[1]
+                break
+            record = self.records[position]
+            if record.kind == FULL:
+                content = self.read_payload(record)
+                break
+            if record.kind == SAME:
+                position = self.digests[record.digest]
+            else:
+                deltas.append(record)
+                position -= 1
+        for record in reversed(deltas):
+            content = apply_delta(content, self.read_payload(record))
+        self.cached = (index, content)
+        return content
+
+    def find(self, timestamp):
+        """
+        Find the snapshot that was current at a given time.
+        :param timestamp: Seconds since the epoch.
+        :return: Position of the latest snapshot captured at or before the timestamp, or None.
+        """
+        index = bisect.bisect_right(self.timestamps, timestamp) - 1
+        return index if index >= 0 else None
+
+    def get(self, timestamp):
+        """
+        Get the snapshot that was current at a given time.
+        :param timestamp: Seconds since the epoch.
+        :return: A tuple (timestamp, content), or None if the archive starts later.
+        """
+        index = self.find(timestamp)
+        return None if index is None else (self.timestamps[index], self.read(index))
+
+    def iter_snapshots(self, start=0, stop=None):
+        """
+        Stream snapshots in time order, decoding each record once.
+        :param start: Position of the first snapshot.
+        :param stop: Position after the last snapshot, defaults to the end of the archive.
+        :return: Generator of (timestamp, content) tuples.
+        """
+        stop = len(self.records) if stop is None else min(stop, len(self.records))
+        content = None
+        for index in range(start, stop):
+            record = self.records[index]
+            if content is None or record.kind == FULL:
+                content = self.read(index)
+            elif record.kind == DELTA:
+                content = apply_delta(content, self.read_payload(record))
+            elif record.digest != self.records[index - 1].digest:
+                content = self.read(index)
+            yield record.timestamp, content
+
+    def segments(self):
+        """
+        Split the archive at its full records, so each segment can be streamed independently.
+        :return: List of (start, stop) positions.
+        """
+        starts = [index for index, record in enumerate(self.records) if record.kind == FULL] or [0]
+        starts[0] = 0
+        bounds = starts + [len(self.records)]
+        return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+    def stats(self):
+        """
+        Get the size of the archive compared to the snapshots it holds.
+        :return: Dictionary with snapshot, unique snapshot and record counts and sizes in bytes.
+        """
+        return {
+            "snapshots": len(self.records),
+            "unique": len(self.digests),
+            "deltas": sum(1 for record in self.records if record.kind == DELTA),
+            "raw_bytes": sum(record.size for record in self.records),
+            "archive_bytes": self.end or 0,
+        }
+
+    def __len__(self):
+        return len(self.records)
+
+    def close(self):
+        """
+        Close the archive file.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.writable = False
+
+
+class ArchiveWriter:
+    def __init__(self, archives):
+        """
+        Append polled pages to snapshot archives from a background thread, so that diffing and
+        compressing never delay a poll. A failed append is logged and skipped.
+        :param archives: List of SnapshotArchive objects, one per calendar view.
+        """
+        self.archives = archives
+        self.queue = queue.Queue()
+        self.writer = Thread(target=self.write_loop, name="ArchiveWriter", daemon=True)
+        self.writer.start()
+
+    def submit(self, pages, timestamp=None):
+        """
+        Queue the pages of a poll. Returns immediately.
+        :param pages: List of raw HTML contents as bytes, aligned with the archives (None skips a view).
+        :param timestamp: Poll time in seconds since the epoch, defaults to now.
+        """
+        self.queue.put((pages, time.time() if timestamp is None else timestamp))
+
+    def write_loop(self):
+        """
+        Background writer: append queued pages in order.
+        """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if isinstance(item, Event):
+                item.set()
+                continue
+            pages, timestamp = item
+            for archive, content in zip(self.archives, pages):
+                if content is None:
+                    continue
+                try:
+                    # A poll is never lost because the clock went back or another process appended meanwhile
+                    archive.append(content, timestamp, clamp=True)
+                except Exception as e:
+                    log_error(f"Failed to archive snapshot in {archive.path}: {e}")
+
+    def flush(self):
+        """
+        Block until everything queued so far has been appended.
+        """
+        if self.writer.is_alive():
+            flushed = Event()
+            self.queue.put(flushed)
+            flushed.wait()
+
+    def close(self):
+        """
+        Append pending pages, stop the writer and close the archives.
+        """
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+        for archive in self.archives:
+            archive.close()
+
+
+def view_archive_paths(path, count):
+    """
+    Get the archive of each calendar view, so every archive holds the timeline of a single view.
+    :param path: Archive of the first view (e.g., snapshots.ecar).
+    :param count: Number of calendar views.
+    :return: List of paths, e.g. snapshots.ecar, snapshots.1.ecar, snapshots.2.ecar.
+    """
+    root, extension = os.path.splitext(path)
+    return [path] + [f"{root}.{index}{extension or ARCHIVE_SUFFIX}" for index in range(1, count)]
+
+
+def is_archive(path):
+    """
+    Check whether a path names a snapshot archive.
+    :param path: File path.
+    :return: True for archive files.
+    """
+    return path.endswith(ARCHIVE_SUFFIX)
+
+
+def default_archive():
+    """
+    Get the archive configured by SNAPSHOT_ARCHIVE.
+    :return: The shared SnapshotArchive, or None if archiving is disabled.
+    """
+    global _default_archive
+    if _default_archive is None and Config.SNAPSHOT_ARCHIVE:
+        _default_archive = SnapshotArchive(Config.SNAPSHOT_ARCHIVE, codec=Config.SNAPSHOT_ARCHIVE_CODEC)
+    return _default_archive
+
+
+def main():
+    # Snapshot times are parsed from file names like replay.py does
+    from replay import find_snapshots, snapshot_time
+
+    parser = argparse.ArgumentParser(description="Store, list and extract calendar snapshots in an archive.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="Add HTML snapshot files or directories, in capture-time order")
+    add.add_argument("archive")
+    add.add_argument("inputs", nargs="+")
+    add.add_argument("--codec", choices=sorted(CODECS), default="lzma")
+    show = commands.add_parser("list", help="List the snapshots of an archive")
+    show.add_argument("archive")
+    extract = commands.add_parser("extract", help="Write the snapshot current at a time to a file")
+    extract.add_argument("archive")
+    extract.add_argument("time", help="Capture time, e.g. 2024-12-06T17:11:28")
+    extract.add_argument("output")
+    args = parser.parse_args()
+
+    if args.command != "add" and not os.path.exists(args.archive):
+        print(f"No such archive: {args.archive}")
+        sys.exit(1)
+    archive = SnapshotArchive(args.archive, codec=getattr(args, "codec", "lzma"))
+    try:
+        if args.command == "add":
+            paths = sorted((path for path in find_snapshots(args.inputs) if not is_archive(path)),
+                           key=lambda path: (snapshot_time(path), path))
+            for path in paths:
+                with open(path, "rb") as f:
+                    archive.append(f.read(), snapshot_time(path).timestamp())
+            print(f"Added {len(paths)} snapshots to {args.archive}")
+        elif args.command == "list":
+            names = {FULL: "full", DELTA: "delta", SAME: "same"}
+            for record in archive.records:
+                print(f"{datetime.fromtimestamp(record.timestamp)}  {names[record.kind]:5}  "
+                      f"{record.size:>9} -> {record.length:>8} bytes  {record.digest.hex()[:12]}")
+        else:
+            found = archive.get(datetime.fromisoformat(args.time).timestamp())
+            if found is None:
+                print(f"No snapshot at or before {args.time}")
+                sys.exit(1)
+            with open(args.output, "wb") as f:
+                f.write(found[1])
+            print(f"Snapshot of {datetime.fromtimestamp(found[0])} written to {args.output}")
+        stats = archive.stats()
+        print(f"{stats['snapshots']} snapshots ({stats['unique']} unique, {stats['deltas']} deltas): "
+              f"{stats['raw_bytes']} bytes stored in {stats['archive_bytes']}")
+    finally:
+        archive.close()
+
+if __name__ == "__main__":
+    # python3 archive.py add snapshots.ecar sample/
+    # python3 archive.py extract snapshots.ecar 2024-12-06T17:11:28 sample/economic_calendar.html
+    main()
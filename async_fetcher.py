@@ -0,0 +1,153 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from fetcher import Fetcher
+from metrics import metrics
+from utils import log_error
+
+
+# (parser_mode, target_timezone) -> parse-only Fetcher, created once per worker process
+_parsers = {}
+
+
+def get_parser(parser_mode="full", target_timezone=None):
+    """
+    Get the parse-only Fetcher of this process for a parser mode and timezone, creating it on first use.
+    :param parser_mode: The Fetcher parser mode ("full" or "table").
+    :param target_timezone: The target timezone for output times, or None to keep published times.
+    :return: A Fetcher without a URL.
+    """
+    key = (parser_mode, target_timezone)
+    parser = _parsers.get(key)
+    if parser is None:
+        parser = _parsers[key] = Fetcher(None, target_timezone=target_timezone, parser_mode=parser_mode)
+    return parser
+
+
+def parse_calendar(html, parser_mode="full", target_timezone=None):
+    """
+    Parse raw calendar HTML into Data objects. Runs in a worker process.
+    :param html: The raw HTML content as bytes.
+    :param parser_mode: The Fetcher parser mode ("full" or "table").
+    :param target_timezone: The target timezone for output times, or None to keep published times.
+    :return: List of Data objects, or None if the calendar table is not found.
+    """
+    fetcher = get_parser(parser_mode, target_timezone)
+    rows = fetcher.find_rows(html)
+    if rows is None:
+        return None
+    return fetcher.extract_data(rows)
+
+
+class AsyncFetcher:
+    def __init__(self, urls, target_timezone=None, parser_mode="full", max_concurrency=4, max_workers=None):
+        """
+        Initialize AsyncFetcher with several calendar views to fetch concurrently.
+        :param urls: List of calendar URLs (e.g., today, tomorrow, this week, country filters).
+        :param target_timezone: The target timezone for output times (e.g., "UTC"), or None to keep published times.
+        :param parser_mode: The Fetcher parser mode ("full" or "table").
+        :param max_concurrency: Maximum number of requests in flight at once.
+        :param max_workers: Number of parser worker processes (defaults to the CPU count).
+        """
+        self.urls = list(urls)
+        self.parser_mode = parser_mode
+        self.target_timezone = target_timezone
+        self.max_concurrency = max_concurrency
+        self.max_workers = max_workers
+        # One Fetcher per view so each keeps its own keep-alive session and revalidation state
+        self.fetchers = [Fetcher(url, target_timezone=target_timezone, parser_mode=parser_mode) for url in self.urls]
+        self.executor = None
+        # Raw page of each view in the last fetch_all, None for views that returned no rows
+        self.last_pages = [None] * len(self.urls)
+
+    def get_executor(self):
+        """
+        Get the parser worker pool, creating it on first use.
+        :return: A ProcessPoolExecutor.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    async def fetch_view(self, fetcher, semaphore):
+        """
+        Fetch a single calendar view and parse it in the worker pool.
+        :param fetcher: The Fetcher for this view.
+        :param semaphore: Semaphore bounding the number of concurrent requests.
+        :return: List of Data objects for this view.
+        """
+        async with semaphore:
+            html = await asyncio.to_thread(fetcher.fetch_raw_html)
+        if not html:
+            return []
+
+        # Skip parsing when the view has not changed since the last fetch
+        if not fetcher.content_changed and fetcher.last_dataset is not None:
+            return fetcher.last_dataset
+
+        loop = asyncio.get_running_loop()
+        # Parsing and extraction both run in the worker, so they are timed together
+        with metrics.stage("parse_extract"):
+            dataset = await loop.run_in_executor(self.get_executor(), parse_calendar, html,
+                                                 self.parser_mode, self.target_timezone)
+        if dataset is None:
+            log_error(f"Economic calendar table not found at {fetcher.base_url}.")
+            return []
+
+        fetcher.last_dataset = dataset
+        return dataset
+
+    async def fetch_all(self):
+        """
+        Fetch all calendar views concurrently and merge them into one dataset.
+        :return: Deduplicated list of Data objects.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        datasets = await asyncio.gather(
+            *(self.fetch_view(fetcher, semaphore) for fetcher in self.fetchers),
+            return_exceptions=True,
+        )
+
+        self.last_pages = [
+            fetcher.last_html if dataset and not isinstance(dataset, Exception) else None
+            for fetcher, dataset in zip(self.fetchers, datasets)
+        ]
+
+        results = []
+        for url, dataset in zip(self.urls, datasets):
+            if isinstance(dataset, Exception):
+                log_error(f"Error fetching {url}: {dataset}")
+                continue
+            results.append(dataset)
+        return self.merge(results)
+
+    def merge(self, datasets):
+        """
+        Merge datasets from several views, dropping duplicate events.
+        Events are identified by their id and release date and time.
+        :param datasets: List of lists of Data objects.
+        :return: Merged list of Data objects sorted by release date and time.
+        """
+        merged = {}
+        for dataset in datasets:
+            for d in dataset:
+                key = (d.id, d.datetime or d.time)
+                if key not in merged:
+                    merged[key] = d
+        return sorted(merged.values(), key=lambda d: d.datetime or "")
+
+    def fetch_data(self):
+        """
+        Fetch and merge all calendar views (blocking wrapper around fetch_all).
+        :return: Deduplicated list of Data objects.
+        """
+        return asyncio.run(self.fetch_all())
+
+    def close(self):
+        """
+        Shut down the parser worker pool and close the HTTP sessions.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        for fetcher in self.fetchers:
+            fetcher.close()
@@ -0,0 +1,222 @@
+import argparse
+import contextlib
+import glob
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from tabulate import tabulate
+from fetcher import Fetcher, find_calendar_table
+from processor import SignalProcessor
+from utils import prettify_dataset
+from renderer import TableRenderer
+from config import Config
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DIR = os.path.join(BASE_DIR, "sample")
+DEFAULT_BASELINE = os.path.join(BASE_DIR, "benchmark_baseline.json")
+DEFAULT_SCALE_SOURCE = os.path.join(SAMPLE_DIR, "economic_calendar_20241205_152616.html")
+
+STAGES = [
+    "html_load", "html_load_table_mode", "table_location", "find_rows_table_mode", "extract_data",
+    "_parse_value", "add_pn_indicator", "classify_signal", "classify_batch", "aggregate_signals",
+    "prettify_dataset", "table_renderer_first", "table_renderer_repeat",
+]
+
+
+def percentile(samples, fraction):
+    """
+    Get a percentile of a list of samples (nearest rank).
+    :param samples: List of numbers.
+    :param fraction: Percentile as a fraction (e.g., 0.99).
+    :return: The percentile value.
+    """
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def scale_calendar(html, factor):
+    """
+    Build a synthetic calendar by repeating the rows of the calendar table.
+    :param html: Raw HTML of a snapshot.
+    :param factor: How many times to repeat the table body.
+    :return: Raw HTML with factor times as many rows.
+    """
+    start, end = find_calendar_table(html)
+    body_start = html.index(b"<tbody", start)
+    body_start = html.index(b">", body_start) + 1
+    body_end = html.rindex(b"</tbody>", body_start, end)
+    body = html[body_start:body_end]
+    return html[:body_start] + body * factor + html[body_end:]
+
+
+def time_stage(timings, stage, function, *args):
+    """
+    Run a stage, record its duration and return its result.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    timings.setdefault(stage, []).append(time.perf_counter() - start)
+    return result
+
+
+def run_once(file_path, timings):
+    """
+    Run every pipeline stage once on a snapshot file.
+    :param file_path: Path to the snapshot file.
+    :param timings: Dictionary of stage name to list of durations, updated in place.
+    :return: Number of rows extracted.
+    """
+    fetcher = Fetcher(None, parser_mode="full")
+    table_fetcher = Fetcher(None, parser_mode="table")
+    processor = SignalProcessor()
+
+    soup = time_stage(timings, "html_load", fetcher.load_html_from_file, file_path)
+    rows = time_stage(timings, "table_location", lambda: soup.find(
+        'table', {"id": "economicCalendarData"}).find_all('tr', {"class": "js-event-item"}))
+    time_stage(timings, "html_load_table_mode", table_fetcher.load_html_from_file, file_path)
+
+    with open(file_path, "rb") as f:
+        html = f.read()
+    time_stage(timings, "find_rows_table_mode", table_fetcher.find_rows, html)
+
+    dataset = time_stage(timings, "extract_data", fetcher.extract_data, rows)
+
+    value_strings = [cell.text.strip() for row in rows for cell in row.find_all('td', {"class": ["act", "fore", "prev"]})]
+    time_stage(timings, "_parse_value", lambda: [fetcher._parse_value(value) for value in value_strings])
+
+    time_stage(timings, "add_pn_indicator", processor.add_pn_indicator, dataset)
+    time_stage(timings, "classify_signal", lambda: [processor.classify_signal(d) for d in dataset])
+    time_stage(timings, "classify_batch", processor.classify_batch, dataset)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        time_stage(timings, "aggregate_signals", processor.aggregate_signals, dataset)
+        time_stage(timings, "prettify_dataset", prettify_dataset, dataset)
+        renderer = TableRenderer(devnull, in_place=False)
+        time_stage(timings, "table_renderer_first", renderer.render, dataset)
+        time_stage(timings, "table_renderer_repeat", renderer.render, dataset)
+    return len(dataset)
+
+
+def run_benchmark(inputs, repeat=5):
+    """
+    Benchmark every stage on every input.
+    :param inputs: List of (name, file_path) tuples.
+    :param repeat: Number of runs per input.
+    :return: Dictionary of input name to stage name to statistics.
+    """
+    results = {}
+    for name, file_path in inputs:
+        timings = {}
+        rows = 0
+        for _ in range(repeat):
+            rows = run_once(file_path, timings)
+        results[name] = {
+            stage: {
+                "rows": rows,
+                "p50_ms": percentile(samples, 0.5) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+                "rows_per_s": rows / percentile(samples, 0.5) if percentile(samples, 0.5) > 0 else 0.0,
+            }
+            for stage, samples in timings.items()
+        }
+    return results
+
+
+def compare(results, baseline, tolerance=0.25, noise_ms=1.0):
+    """
+    Compare p50 latencies against a baseline.
+    :param results: Benchmark results from run_benchmark.
+    :param baseline: Baseline results in the same format.
+    :param tolerance: Allowed relative slowdown (0.25 = 25%).
+    :param noise_ms: Absolute slowdown below which differences are ignored.
+    :return: List of (input, stage, baseline_ms, current_ms) regressions.
+    """
+    regressions = []
+    for name, stages in results.items():
+        for stage, stats in stages.items():
+            reference = baseline.get(name, {}).get(stage)
+            if not reference:
+                continue
+            current, previous = stats["p50_ms"], reference["p50_ms"]
+            if current > previous * (1 + tolerance) and current - previous > noise_ms:
+                regressions.append((name, stage, previous, current))
+    return regressions
+
+
+def build_inputs(sample_dir, scales, scale_source, temp_dir):
+    """
+    Collect the sample snapshots and write the synthetic scaled-up calendars.
+    :return: List of (name, file_path) tuples.
+    """
+    inputs = [(os.path.basename(path), path) for path in sorted(glob.glob(os.path.join(sample_dir, "*.html")))]
+    with open(scale_source, "rb") as f:
+        html = f.read()
+    for factor in scales:
+        path = os.path.join(temp_dir, f"synthetic_{factor}x.html")
+        with open(path, "wb") as f:
+            f.write(scale_calendar(html, factor))
+        inputs.append((f"synthetic_{factor}x", path))
+    return inputs
+
+
+def main():
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Benchmark the fetch-to-render pipeline stages.")
+    parser.add_argument("--sample-dir", default=SAMPLE_DIR, help="Directory of snapshot files")
+    parser.add_argument("--scale", type=int, nargs="*", default=[10, 100], help="Synthetic row multipliers")
+    parser.add_argument("--scale-source", default=DEFAULT_SCALE_SOURCE, help="Snapshot used for synthetic calendars")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per input")
+    parser.add_argument("--baseline", help=f"Baseline file to compare against (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    # Rendering stages only do work when the table is printed
+    Config.PRINT_TABLE = True
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        inputs = build_inputs(args.sample_dir, args.scale, args.scale_source, temp_dir)
+        results = run_benchmark(inputs, repeat=args.repeat)
+
+    table = []
+    for name, stages in results.items():
+        for stage in STAGES:
+            stats = stages[stage]
+            table.append([name, stage, stats["rows"], f"{stats['p50_ms']:.2f}", f"{stats['p99_ms']:.2f}",
+                          f"{stats['rows_per_s']:.0f}"])
+    print(tabulate(table, headers=["Input", "Stage", "Rows", "p50 (ms)", "p99 (ms)", "Rows/s"], tablefmt="grid"))
+
+    baseline_file = args.baseline or DEFAULT_BASELINE
+    if args.save_baseline:
+        with open(baseline_file, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"Baseline saved to {baseline_file}")
+        return
+
+    if not os.path.exists(baseline_file):
+        print(f"No baseline at {baseline_file}; run with --save-baseline to create one.")
+        if args.baseline:
+            # A baseline asked for by name must be compared against, not silently skipped
+            sys.exit(1)
+        return
+
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print(tabulate(
+            [[name, stage, f"{previous:.2f}", f"{current:.2f}", f"{(current / previous - 1) * 100:+.0f}%"]
+             for name, stage, previous, current in regressions],
+            headers=["Input", "Stage", "Baseline p50 (ms)", "Current p50 (ms)", "Change"], tablefmt="grid",
+        ))
+        print(f"{len(regressions)} stage(s) regressed beyond {args.tolerance:.0%}.")
+        sys.exit(1)
+    print("No regressions against the baseline.")
+
+if __name__ == "__main__":
+    # python3 benchmark.py --save-baseline   (then: python3 benchmark.py)
+    main()
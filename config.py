@@ -4,6 +4,20 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv(override=True)
 
+def parse_interval(raw):
+    """
+    Parse an interval string such as "500ms", "3s", "1.5s" or "5m".
+    :param raw: The interval string (lowercase).
+    :return: A tuple (value, unit) with unit "seconds" or "minutes", or (None, None) if invalid.
+    """
+    if raw.endswith("ms"):  # Milliseconds
+        return float(raw[:-2]) / 1000, "seconds"
+    if raw.endswith("s"):  # Seconds
+        return float(raw[:-1]), "seconds"
+    if raw.endswith("m"):  # Minutes
+        return float(raw[:-1]), "minutes"
+    return None, None
+
 class Config:
     # Read TARGET_TIMEZONE from .env file, default to UTC if not found
     TARGET_TIMEZONE = os.getenv("TARGET_TIMEZONE", "UTC")
@@ -24,25 +38,74 @@ class Config:
     # Read BASE_URL from .env file
     BASE_URL = os.getenv("BASE_URL", "https://www.investing.com/economic-calendar/")
 
+    # Read CALENDAR_URLS (comma-separated calendar views fetched concurrently), default to BASE_URL only
+    raw_calendar_urls = os.getenv("CALENDAR_URLS", "")
+    CALENDAR_URLS = [url.strip() for url in raw_calendar_urls.split(",") if url.strip()] or [BASE_URL]
+
+    # Read MIRROR_URLS (comma-separated alternate endpoints serving the same calendar as BASE_URL)
+    raw_mirror_urls = os.getenv("MIRROR_URLS", "")
+    MIRROR_URLS = [url.strip() for url in raw_mirror_urls.split(",") if url.strip()]
+
+    # Wait this long for the fastest source before also asking the next one ("0ms" asks all at once),
+    # empty to derive it from the fastest source's recent latencies
+    hedge_delay_raw = os.getenv("HEDGE_DELAY", "").lower()
+    hedge_delay_value, hedge_delay_unit = parse_interval(hedge_delay_raw) if hedge_delay_raw else (None, None)
+    HEDGE_DELAY = hedge_delay_value * 60 if hedge_delay_unit == "minutes" else hedge_delay_value
+
+    # Read CACHE_DIR (derived data kept between runs: compiled event catalog, replay rows), default to .cache
+    # next to the code, empty to disable
+    CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+    # Share fetched pages between processes on this host through an on-disk cache, empty to disable
+    RESPONSE_CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR", "")
+
+    # Reuse a cached page for this long (e.g., "2s", "1m") instead of fetching it again
+    response_cache_ttl_raw = os.getenv("RESPONSE_CACHE_TTL", "2s").lower()
+    response_cache_ttl_value, response_cache_ttl_unit = parse_interval(response_cache_ttl_raw)
+    RESPONSE_CACHE_TTL = response_cache_ttl_value * 60 if response_cache_ttl_unit == "minutes" \
+        else response_cache_ttl_value
+
+    # Size limit of the cached pages in MB; least recently used pages are evicted first
+    RESPONSE_CACHE_SIZE_MB = int(os.getenv("RESPONSE_CACHE_SIZE_MB", 64))
+
+    # Maximum number of calendar views fetched at once
+    FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", 4))
+
+    # Read EVENT_DATA_FILE (event metadata catalog), default to event_data.json next to the code
+    EVENT_DATA_FILE = os.getenv("EVENT_DATA_FILE") or None
+
+    # Archive file of fetched pages (compressed and deduplicated), used instead of HTML files when
+    # saving samples and recording every poll of main.py; empty to disable
+    SNAPSHOT_ARCHIVE = os.getenv("SNAPSHOT_ARCHIVE", "")
+
+    # Compression of new snapshot archives: "lzma" (smaller) or "zlib" (faster)
+    SNAPSHOT_ARCHIVE_CODEC = os.getenv("SNAPSHOT_ARCHIVE_CODEC", "lzma").lower()
+
+    # Read HISTORY_DB (SQLite file recording observed values), default to empty (disabled)
+    HISTORY_DB = os.getenv("HISTORY_DB", "")
+
     # Parse default interval
     default_interval_raw = os.getenv("SCHEDULE_INTERVAL_DEFAULT", "10s").lower()
-    DEFAULT_INTERVAL_VALUE, DEFAULT_INTERVAL_UNIT = None, None
-    if default_interval_raw.endswith("s"):  # Seconds
-        DEFAULT_INTERVAL_VALUE = int(default_interval_raw[:-1])
-        DEFAULT_INTERVAL_UNIT = "seconds"
-    elif default_interval_raw.endswith("m"):  # Minutes
-        DEFAULT_INTERVAL_VALUE = int(default_interval_raw[:-1])
-        DEFAULT_INTERVAL_UNIT = "minutes"
-
-    # Parse critical interval
+    DEFAULT_INTERVAL_VALUE, DEFAULT_INTERVAL_UNIT = parse_interval(default_interval_raw)
+
+    # Parse critical interval (sub-second values such as "500ms" or "0.5s" are allowed)
     critical_interval_raw = os.getenv("SCHEDULE_INTERVAL_CRITICAL", "3s").lower()
-    CRITICAL_INTERVAL_VALUE, CRITICAL_INTERVAL_UNIT = None, None
-    if critical_interval_raw.endswith("s"):  # Seconds
-        CRITICAL_INTERVAL_VALUE = int(critical_interval_raw[:-1])
-        CRITICAL_INTERVAL_UNIT = "seconds"
-    elif critical_interval_raw.endswith("m"):  # Minutes
-        CRITICAL_INTERVAL_VALUE = int(critical_interval_raw[:-1])
-        CRITICAL_INTERVAL_UNIT = "minutes"
+    CRITICAL_INTERVAL_VALUE, CRITICAL_INTERVAL_UNIT = parse_interval(critical_interval_raw)
+
+    # Parse warm-up lead time: how long before a critical time to warm up the connection and state
+    warmup_lead_raw = os.getenv("WARMUP_LEAD", "20s").lower()
+    WARMUP_LEAD_VALUE, WARMUP_LEAD_UNIT = parse_interval(warmup_lead_raw)
+
+    # Poll at the critical interval around every pending release in the fetched calendar (True or False)
+    ADAPTIVE_POLLING = os.getenv("ADAPTIVE_POLLING", "True").lower() == "true"
+
+    # Start fast polling this long before a pending release
+    release_lead_raw = os.getenv("RELEASE_LEAD", "5s").lower()
+    RELEASE_LEAD_VALUE, RELEASE_LEAD_UNIT = parse_interval(release_lead_raw)
+
+    # Stop fast polling if the actual value has not appeared this long after the release time
+    release_timeout_raw = os.getenv("RELEASE_TIMEOUT", "3m").lower()
+    RELEASE_TIMEOUT_VALUE, RELEASE_TIMEOUT_UNIT = parse_interval(release_timeout_raw)
 
     # Read PRINT_TABLE and convert to boolean
     PRINT_TABLE = os.getenv("PRINT_TABLE", "False").lower() == "true"
@@ -53,7 +116,29 @@ class Config:
         None if raw_currencies.upper() == "ALL" else raw_currencies.split(",")
     )
 
+    # JSON file of named output profiles (currencies, importance, timezone, colors, sink) served from
+    # a single fetch; empty to print one table with the settings above
+    PROFILES_FILE = os.getenv("PROFILES_FILE", "")
+
     # Use colors in the output table
     USE_COLORS = os.getenv("USE_COLORS", "True").lower() == "true"
 
-    IMPORTANCE_FILTER = int(os.getenv('IMPORTANCE_FILTER', 1))
\ No newline at end of file
+    IMPORTANCE_FILTER = int(os.getenv('IMPORTANCE_FILTER', 1))
+
+    # Parser mode for the fetched HTML: "full" parses the whole page, "table" only the calendar table
+    PARSER_MODE = os.getenv("PARSER_MODE", "table").lower()
+
+    # Record per-stage latencies and counters for each poll (True or False)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "False").lower() == "true"
+
+    # Write metrics to this file after every poll (*.json for JSON, Prometheus text otherwise), empty to disable
+    METRICS_FILE = os.getenv("METRICS_FILE") or None
+
+    # Serve metrics on http://127.0.0.1:<port>/metrics and /metrics.json, 0 to disable
+    METRICS_PORT = int(os.getenv("METRICS_PORT", 0))
+
+    # Publish signals to local subscribers: "host:port" or "unix:/path/to/socket", empty to disable
+    PUBLISH_ADDRESS = os.getenv("PUBLISH_ADDRESS", "")
+
+    # Maximum number of messages queued per subscriber before the oldest are dropped
+    PUBLISH_QUEUE_SIZE = int(os.getenv("PUBLISH_QUEUE_SIZE", 1000))
@@ -10,7 +10,15 @@ class SignalLevel(Enum):
     STRONG_SELL = "Strong Sell"
     NO_SIGNAL = "No Signal"
 
+class ChangeType(Enum):
+    NEW = "New"
+    RELEASED = "Released"
+    UPDATED = "Updated"
+    REMOVED = "Removed"
+
 class Value:
+    __slots__ = ("value", "unit", "color")
+
     def __init__(self, value, unit, color):
         """
         Represents a value with an associated color (e.g., redFont, greenFont).
@@ -27,9 +35,13 @@ class Value:
 
 # Data class contains the actual, previous, forecast values and pn_indicator for a given currency
 class Data:
+    __slots__ = ("time", "datetime", "currency", "event", "id", "importance",
+                 "actual", "previous", "forecast", "pn_indicator", "signal")
+
     def __init__(self, time: str, currency: str, event: str, id: str, importance: int,
-                 actual: Value, previous: Value, forecast: Value):
+                 actual: Value, previous: Value, forecast: Value, datetime: str = None):
         self.time = time
+        self.datetime = datetime  # Full release date and time as published (e.g., "2024/12/05 08:30:00")
         self.currency = currency
         self.event = event
         self.id = id
@@ -60,4 +72,23 @@ class Data:
         Set the signal for the data.
         :param signal: The signal as a string.
         """
-        self.signal = signal
\ No newline at end of file
+        self.signal = signal
+
+# RowChange describes one row that differs between two consecutive snapshots
+class RowChange:
+    def __init__(self, change_type: ChangeType, data: Data, previous: Data = None):
+        """
+        Represents a change of a single row between two polls.
+        :param change_type: The kind of change (ChangeType).
+        :param data: The current Data row (the removed row for ChangeType.REMOVED).
+        :param previous: The Data row from the previous snapshot, if any.
+        """
+        self.change_type = change_type
+        self.data = data
+        self.previous = previous
+
+    def __str__(self):
+        return f"{self.change_type.value}: {self.data.id} ({self.data.time} {self.data.currency}) Signal: {self.data.signal}"
+
+    def __repr__(self):
+        return self.__str__()
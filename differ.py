@@ -0,0 +1,106 @@
+from data import ChangeType, RowChange
+
+
+class RowDiffer:
+    def __init__(self, processor):
+        """
+        Initialize the RowDiffer with the processor used to classify changed rows.
+        :param processor: The SignalProcessor used for P/N lookup and signal classification.
+        """
+        self.processor = processor
+        # Previous snapshot: row key -> (fingerprint, Data)
+        self.snapshot = {}
+        # Generation of the event metadata the snapshot was classified with
+        self.generation = None
+
+    def row_keys(self, dataset):
+        """
+        Build a stable key for each row. Rows are keyed on the event id; repeated ids
+        (e.g. the same auction on several days of a weekly view) get an occurrence index.
+        :param dataset: List of Data objects.
+        :return: List of keys in the same order as the dataset.
+        """
+        seen = {}
+        keys = []
+        for d in dataset:
+            occurrence = seen.get(d.id, 0)
+            seen[d.id] = occurrence + 1
+            keys.append((d.id, occurrence))
+        return keys
+
+    def fingerprint(self, d):
+        """
+        Build a comparable tuple of the values and colors of a row.
+        :param d: The Data object.
+        :return: Tuple of (value, unit, color) for actual, forecast and previous.
+        """
+        return tuple(
+            (v.value, v.unit, v.color) if v else None
+            for v in (d.actual, d.forecast, d.previous)
+        )
+
+    def update(self, dataset):
+        """
+        Diff the dataset against the previous snapshot. Only new or changed rows are
+        re-classified; unchanged rows inherit P/N indicator and signal from the snapshot.
+        After the event metadata is reloaded, unchanged rows whose P/N indicator was edited
+        are re-classified too and reported as updated.
+        :param dataset: List of Data objects from the latest poll.
+        :return: List of RowChange objects, in dataset order followed by removed rows.
+        """
+        generation = self.processor.metadata_generation()
+        reloaded = generation != self.generation
+        snapshot = {}
+        changed = []
+        for key, d in zip(self.row_keys(dataset), dataset):
+            fingerprint = self.fingerprint(d)
+            previous = self.snapshot.pop(key, None)
+            snapshot[key] = (fingerprint, d)
+
+            if previous is None:
+                changed.append((ChangeType.NEW, d, None))
+                continue
+
+            previous_fingerprint, previous_data = previous
+            if previous_data is d or previous_fingerprint == fingerprint:
+                if not reloaded or self.processor.pn_indicator(d.id) == previous_data.pn_indicator:
+                    d.set_pn_indicator(previous_data.pn_indicator)
+                    d.set_signal(previous_data.signal)
+                    continue
+                changed.append((ChangeType.UPDATED, d, previous_data))
+                continue
+
+            previous_actual = previous_fingerprint[0][0] if previous_fingerprint[0] else None
+            actual = fingerprint[0][0] if fingerprint[0] else None
+            if previous_actual is None and actual is not None:
+                changed.append((ChangeType.RELEASED, d, previous_data))
+            else:
+                changed.append((ChangeType.UPDATED, d, previous_data))
+
+        # Re-classify only the rows that changed
+        changed_rows = self.processor.add_pn_indicator([d for _, d, _ in changed])
+        self.processor.classify_batch(changed_rows)
+
+        changes = [RowChange(change_type, d, previous) for change_type, d, previous in changed]
+        changes.extend(RowChange(ChangeType.REMOVED, d) for _, d in self.snapshot.values())
+
+        self.snapshot = snapshot
+        self.generation = generation
+        return changes
+
+    def signals(self):
+        """
+        Get the signals of all rows in the current snapshot.
+        :return: List of signal strings.
+        """
+        return [d.signal for _, d in self.snapshot.values()]
+
+    def overall_signal(self):
+        """
+        Aggregate the signals of the current snapshot.
+        :return: The overall signal, or None if the snapshot is empty.
+        """
+        signals = self.signals()
+        if not signals:
+            return None
+        return self.processor.most_common_signal(signals)
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import marshal
+import os
+import time
+from threading import Lock
+from config import Config
+from utils import log_error, log_info
+
+# Default catalog location, next to this module rather than the working directory
+DEFAULT_EVENT_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "event_data.json")
+
+# Bump when the compiled cache layout changes
+CACHE_VERSION = 1
+
+
+def event_number(event_id):
+    """
+    Get the numeric suffix of an event id (e.g., 'unemployment-rate-300' -> 300).
+    :param event_id: The event id from the calendar link.
+    :return: The number as int, or None if the id has no numeric suffix.
+    """
+    if not event_id:
+        return None
+    suffix = event_id.rsplit("-", 1)[-1]
+    return int(suffix) if suffix.isdigit() else None
+
+
+class EventIndex:
+    def __init__(self, path=None, check_interval=1.0, cache_dir=None):
+        """
+        Lazily loaded index over the event metadata catalog (event_data.json).
+        The parsed catalog is kept in a compiled cache file and reloaded when the JSON changes.
+        :param path: Path to the catalog JSON, defaults to event_data.json next to this module.
+        :param check_interval: Minimum seconds between checks of the file for changes.
+        :param cache_dir: Directory of the compiled cache, defaults to Config.CACHE_DIR (empty to disable).
+        """
+        self.path = path or DEFAULT_EVENT_DATA_FILE
+        cache_dir = Config.CACHE_DIR if cache_dir is None else cache_dir
+        self.cache_path = None
+        if cache_dir:
+            # Named after the catalog path, so catalogs with the same file name do not share a cache
+            digest = hashlib.sha1(os.path.abspath(self.path).encode()).hexdigest()[:12]
+            self.cache_path = os.path.join(cache_dir, "event_index",
+                                           f"{os.path.basename(self.path)}.{digest}.marshal")
+        self.check_interval = check_interval
+        self.lock = Lock()
+
+        self.signature = None
+        self.checked_at = None
+        # Incremented on every (re)load, so callers can tell when lookups they kept are stale
+        self.generation = 0
+        self.events = {}
+        self.by_number = {}
+        self.by_currency_importance = {}
+
+    def file_signature(self):
+        """
+        Get the (mtime, size) signature of the catalog file.
+        :return: A tuple, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self, force=False):
+        """
+        Load the catalog on first use and reload it if the file has changed.
+        File checks are throttled to once per check_interval unless force is True.
+        """
+        now = time.monotonic()
+        if not force and self.checked_at is not None and now - self.checked_at < self.check_interval:
+            return
+        with self.lock:
+            self.checked_at = now
+            signature = self.file_signature()
+            if signature is None or signature == self.signature:
+                return
+            events = self.load_compiled(signature)
+            if events is None:
+                events = self.load_json()
+                if events is None:
+                    return
+                self.save_compiled(signature, events)
+            self.build_indexes(events)
+            self.generation += 1
+            if self.signature is not None:
+                log_info(f"Reloaded {len(events)} events from {self.path}")
+            self.signature = signature
+
+    def load_json(self):
+        """
+        Parse the catalog JSON.
+        :return: Dictionary of event id to metadata, or None if the file cannot be parsed.
+        """
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            log_error(f"Failed to load event data from {self.path}: {e}")
+            return None
+
+    def load_compiled(self, signature):
+        """
+        Load the compiled cache if it matches the catalog file.
+        :param signature: The current (mtime, size) signature of the catalog file.
+        :return: Dictionary of event id to metadata, or None if the cache is missing or stale.
+        """
+        if self.cache_path is None:
+            return None
+        try:
+            with open(self.cache_path, "rb") as f:
+                version, cached_signature, events = marshal.load(f)
+        except Exception:
+            return None
+        if version != CACHE_VERSION or tuple(cached_signature) != signature:
+            return None
+        return events
+
+    def save_compiled(self, signature, events):
+        """
+        Write the compiled cache atomically. Failures are ignored: the cache is optional.
+        :param signature: The (mtime, size) signature of the catalog file.
+        :param events: Dictionary of event id to metadata.
+        """
+        if self.cache_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                marshal.dump((CACHE_VERSION, signature, events), f)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            log_error(f"Failed to write event data cache {self.cache_path}: {e}")
+
+    def build_indexes(self, events):
+        """
+        Build the secondary indexes and swap them in.
+        :param events: Dictionary of event id to metadata.
+        """
+        by_number = {}
+        by_currency_importance = {}
+        for event_id, event in events.items():
+            number = event_number(event_id)
+            if number is not None:
+                by_number[number] = event_id
+            key = (event.get("currency"), event.get("importance"))
+            by_currency_importance.setdefault(key, []).append(event_id)
+        self.events, self.by_number, self.by_currency_importance = events, by_number, by_currency_importance
+
+    def get(self, event_id):
+        """
+        Look up event metadata by id. Falls back to the numeric id suffix,
+        so events whose slug changed are still resolved.
+        :param event_id: The event id (e.g., 'unemployment-rate-300').
+        :return: Metadata dictionary, or None if unknown.
+        """
+        self.refresh()
+        event = self.events.get(event_id)
+        if event is None:
+            matched_id = self.by_number.get(event_number(event_id))
+            if matched_id is not None:
+                event = self.events.get(matched_id)
+        return event
+
+    def find(self, currency=None, importance=None):
+        """
+        Get the ids of events by currency and/or importance.
+        :param currency: Currency code (e.g., 'USD'), or None for any.
+        :param importance: Importance level (1-3), or None for any.
+        :return: List of event ids.
+        """
+        self.refresh()
+        return [
+            event_id
+            for (event_currency, event_importance), event_ids in self.by_currency_importance.items()
+            if (currency is None or event_currency == currency)
+            and (importance is None or event_importance == importance)
+            for event_id in event_ids
+        ]
+
+    def __len__(self):
+        self.refresh()
+        return len(self.events)
+
+    def __contains__(self, event_id):
+        return self.get(event_id) is not None
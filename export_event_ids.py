@@ -1,61 +1,166 @@
+import argparse
 import json
-import sys
-from config import Config
-from fetcher import Fetcher
+import os
+from concurrent.futures import ProcessPoolExecutor
+from archive import SnapshotArchive, is_archive
+from event_index import event_number
+from replay import DEFAULT_CACHE_DIR, find_snapshots, load_rows, snapshot_time
+from utils import log_error
 
-def export_event_ids(input_html, output_json):
+
+def event_entry(d):
     """
-    Export event IDs, names, and currency from the parsed data using Fetcher's read_data method to a JSON template.
-    :param input_html: Path to the input HTML file.
-    :param output_json: Path to save the JSON template.
+    Build the catalog entry of an event.
+    :param d: The Data object.
+    :return: Dictionary with the catalog fields; pn_indicator is left for curation.
     """
-    # Initialize Fetcher
-    fetcher = Fetcher(Config.BASE_URL, target_timezone=Config.TARGET_TIMEZONE)
+    return {
+        # Remove the specific month and year from the event name
+        "event": (d.event or "Unknown Event").split("(")[0].strip(),
+        "currency": d.currency or "USD",  # Default to 'USD' if not found
+        "pn_indicator": "",
+        "importance": d.importance,
+        "link": f"https://www.investing.com/economic-calendar/{d.id}",
+    }
+
 
-    # Get data from the sample HTML using Fetcher's read_data method
-    rows = fetcher.read_data(input_html)  # Pass the input file as an argument
+def scan_snapshot(file_path, cache_dir=None):
+    """
+    Collect the events of one snapshot, or of every snapshot of an archive. Runs in a worker process.
+    :param file_path: Path to the snapshot file or archive.
+    :param cache_dir: Directory of the parsed-rows cache shared with replay.py, or None to disable caching.
+    :return: Dictionary of event id to catalog entry, in calendar order.
+    """
+    if not is_archive(file_path):
+        dataset, _ = load_rows(file_path, cache_dir)
+        return {d.id: event_entry(d) for d in dataset or [] if d.id}
 
-    # Create a dictionary for event data
     events = {}
-    for row in rows:
-        try:
-            # Extract event_id, event_name, and currency
-            event_id = row.get('id', None)
-            event_name = row.get('event', 'Unknown Event')
-            currency = row.get('currency', 'USD')  # Default to 'USD' if not found
-            importance = row.get('importance', 1)  # Default to 1 if not found
-
-            # Remove the specific month and year from the event name
-            event_name = event_name.split("(")[0].strip()
-
-            if event_id:
-                # Add to the dictionary with the desired structure, including currency
-                events[event_id] = {
-                    "event": event_name,
-                    "currency": currency,
-                    "pn_indicator": "",
-                    "importance": importance,
-                    "link": f"https://www.investing.com/economic-calendar/{event_id}",
-                }
-        except Exception as e:
-            print(f"Error extracting event data: {e}")
-
-    # Save the event data to a JSON file
-    with open(output_json, "w") as json_file:
-        json.dump(events, json_file, indent=4)
-    print(f"Event data exported to {output_json}")
+    archive = SnapshotArchive(file_path)
+    try:
+        for _, html in archive.iter_snapshots():
+            dataset, _ = load_rows(file_path, cache_dir, html=html)
+            events.update((d.id, event_entry(d)) for d in dataset or [] if d.id)
+    finally:
+        archive.close()
+    return events
 
-if __name__ == "__main__":
-    # python3 export_event_ids.py sample/economic_calendar.html event_data_template.json
 
-    # Ensure that the input HTML file and output JSON file are provided
-    if len(sys.argv) != 3:
-        print("Usage: python3 export_event_ids.py <input_html_file> <output_json_file>")
-        sys.exit(1)
+def scan_snapshots(paths, workers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Collect the events of many snapshots across a process pool, deduplicated by id.
+    When an event appears in several snapshots, the most recent snapshot wins.
+    :param paths: List of snapshot file paths.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param cache_dir: Directory of the parsed-rows cache, or None to disable caching.
+    :return: Dictionary of event id to catalog entry.
+    """
+    paths = sorted(paths, key=lambda path: (snapshot_time(path), path))
+    if len(paths) == 1:
+        return scan_snapshot(paths[0], cache_dir)
+
+    events = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(scan_snapshot, path, cache_dir) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                events.update(future.result())
+            except Exception as e:
+                log_error(f"Failed to scan {path}: {e}")
+    return events
+
+
+def merge_events(catalog, events):
+    """
+    Merge scanned events into a catalog. Existing entries keep their curated values
+    (pn_indicator, names) and only gain missing fields; an event whose slug was renamed
+    is matched by its numeric id. New events are appended.
+    :param catalog: Dictionary of event id to entry, updated in place.
+    :param events: Dictionary of event id to entry from scan_snapshots.
+    :return: List of the added event ids.
+    """
+    numbers = {event_number(event_id): event_id for event_id in catalog}
+    numbers.pop(None, None)
+
+    added = []
+    for event_id, entry in events.items():
+        known = event_id if event_id in catalog else numbers.get(event_number(event_id))
+        if known is None:
+            catalog[event_id] = entry
+            added.append(event_id)
+            continue
+        for field, value in entry.items():
+            catalog[known].setdefault(field, value)
+    return added
+
+
+def load_catalog(path):
+    """
+    Load an existing catalog.
+    :param path: Path to the catalog JSON.
+    :return: Dictionary of event id to entry (empty if the file does not exist).
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_catalog(path, catalog):
+    """
+    Write a catalog atomically, so readers (EventIndex) never see a partial file.
+    :param path: Path to the catalog JSON.
+    :param catalog: Dictionary of event id to entry.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(catalog, f, indent=4)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def export_event_ids(inputs, output_json, workers=None, cache_dir=DEFAULT_CACHE_DIR, pattern="*.html"):
+    """
+    Export event IDs, names, and currency from saved snapshots into a JSON catalog,
+    merging with the catalog already at output_json.
+    :param inputs: Snapshot file, or list of snapshot files and directories.
+    :param output_json: Path of the catalog (e.g., event_data.json or event_data_template.json).
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param cache_dir: Directory of the parsed-rows cache, or None to disable caching.
+    :param pattern: Glob pattern for snapshot files inside directories.
+    :return: List of the added event ids, or None if the existing catalog cannot be read.
+    """
+    paths = find_snapshots([inputs] if isinstance(inputs, str) else inputs, pattern)
+    try:
+        catalog = load_catalog(output_json)
+    except Exception as e:
+        # Never overwrite a curated catalog that could not be read
+        log_error(f"Failed to load {output_json}: {e}")
+        return None
+
+    added = merge_events(catalog, scan_snapshots(paths, workers, cache_dir)) if paths else []
+    write_catalog(output_json, catalog)
+    print(f"Scanned {len(paths)} snapshots: {len(added)} new events, {len(catalog)} in {output_json}")
+    return added
 
-    # Get input HTML file and output JSON file from command line arguments
-    input_html = sys.argv[1]
-    output_json = sys.argv[2]
 
-    # Export event IDs
-    export_event_ids(input_html, output_json)
+def main():
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Build the event catalog from saved calendar snapshots.")
+    parser.add_argument("inputs", nargs="+", help="Snapshot files or directories (e.g., sample/)")
+    parser.add_argument("output", help="Catalog JSON to merge into (e.g., event_data_template.json)")
+    parser.add_argument("--pattern", default="*.html", help="Glob pattern for files inside directories")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse snapshots")
+    args = parser.parse_args()
+
+    export_event_ids(args.inputs, args.output, workers=args.workers,
+                     cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR, pattern=args.pattern)
+
+if __name__ == "__main__":
+    # python3 export_event_ids.py sample/economic_calendar.html event_data_template.json
+    # python3 export_event_ids.py sample/ archive/ event_data.json --workers 8
+    main()
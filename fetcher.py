@@ -1,97 +1,301 @@
 import os
-import urllib.request
-from urllib.error import HTTPError
+import hashlib
+import mmap
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import urllib3
 from bs4 import BeautifulSoup
-from utils import log_error
+from utils import log_error, get_converter
+from config import Config
+from metrics import metrics, NO_OP
+from response_cache import default_cache
+from archive import default_archive
 from datetime import datetime
-from pytz import timezone
 import re
 import data
 
+# Parser modes: "full" builds a tree of the whole page, "table" only parses the calendar table
+PARSER_MODES = ("full", "table")
+
+# Byte patterns used to locate the calendar table without parsing the whole document
+CALENDAR_TABLE_START = re.compile(rb"<table\b[^>]*\bid\s*=\s*[\"']?economicCalendarData\b", re.IGNORECASE)
+# Opening or closing table tag, used to find the end of the calendar table past any nested tables
+TABLE_TAG = re.compile(rb"<(/?)table\b[^>]*>", re.IGNORECASE)
+
+# Day-separator row of the calendar table, where multi-day pages are split into chunks
+DAY_ROW = re.compile(rb"<tr\b[^>]*>\s*<td\b[^>]*\bclass\s*=\s*[\"']?theDay\b", re.IGNORECASE)
+
+# Read size when streaming a cancellable response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Numeric value with an optional unit (any letter or '%'), e.g. '194K', '-2%', '1.5B'
+VALUE_PATTERN = re.compile(r"([-+]?\d*\.?\d+)([a-zA-Z%]*)")
+
+
+@lru_cache(maxsize=4096)
+def parse_number(value_str):
+    """
+    Parse a value string and extract the numeric value and unit. Results are cached by string.
+    :param value_str: The value string to parse (e.g., '194K', '-2%', '1.5B').
+    :return: A tuple containing the numeric value (as float) and the unit (as str), or (None, None) if invalid.
+    """
+    if not value_str or value_str == "&nbsp;":
+        return None, None
+    match = VALUE_PATTERN.match(value_str.strip())
+    if match:
+        return float(match.group(1)), match.group(2) or ""
+    return None, None
+
+
+def parse_text(cell):
+    return cell.text.strip()
+
+
+def parse_event(cell):
+    """
+    Read the event name and id (last part of the link, e.g. 'unemployment-rate-300') of the event cell.
+    :return: A tuple (event, id).
+    """
+    link = cell.find('a')
+    event_id = link.get("href", "").split("/")[-1] if link else None
+    return cell.text.strip(), event_id
+
+
+def parse_importance(cell):
+    """
+    Count the filled bull icons of the sentiment cell.
+    """
+    return len(cell.find_all("i", {"class": "grayFullBullishIcon"}))
+
+
+def parse_value_cell(cell):
+    """
+    Read a value cell (actual, forecast or previous) with its color.
+    :return: A Value object.
+    """
+    value, unit = parse_number(cell.text.strip())
+    color_class = cell.get("class", [])
+    color = "neutral"  # Default
+    if "redFont" in color_class:
+        color = "negative"
+    elif "greenFont" in color_class:
+        color = "positive"
+    elif "bold" in color_class and "blackFont" in color_class:
+        color = "equal"
+    return data.Value(value, unit, color)
+
+
+# Declarative schema of a calendar row: (field, cell classes in order of preference, parser, default).
+# A class containing spaces must equal the cell's whole class attribute; otherwise it is one of its classes.
+ROW_SCHEMA = (
+    ("time", ("first left time", "time"), parse_text, None),
+    ("currency", ("flagCur",), parse_text, None),
+    ("event", ("event",), parse_event, ("Unknown Event", None)),
+    ("importance", ("sentiment",), parse_importance, 0),
+    ("actual", ("bold",), parse_value_cell, None),
+    ("forecast", ("fore",), parse_value_cell, None),
+    ("previous", ("prev",), parse_value_cell, None),
+)
+
+
+class RowExtractor:
+    def __init__(self, schema=ROW_SCHEMA):
+        """
+        Compile a row schema into a single-pass extractor: each row's cells are walked once and
+        dispatched to fields by class, in document order, so the first matching cell wins.
+        :param schema: Tuple of (field, classes, parser, default) entries.
+        """
+        self.schema = schema
+        # Class (or whole class attribute) -> list of (field index, preference) it can fill
+        self.by_class = {}
+        self.by_class_attribute = {}
+        for index, (_, classes, _, _) in enumerate(schema):
+            for preference, class_name in enumerate(classes):
+                target = self.by_class_attribute if " " in class_name else self.by_class
+                target.setdefault(class_name, []).append((index, preference))
+
+    def find_cells(self, row):
+        """
+        Walk the cells of a row once and pick the cell of each field.
+        :param row: An HTML row of the economic calendar table.
+        :return: List of cells (or None) in schema order.
+        """
+        cells = [None] * len(self.schema)
+        preferences = [None] * len(self.schema)
+        for cell in row.find_all('td'):
+            classes = cell.get("class")
+            if not classes:
+                continue
+            matches = self.by_class_attribute.get(" ".join(classes), [])
+            for class_name in classes:
+                matches = matches + self.by_class.get(class_name, [])
+            for index, preference in matches:
+                if preferences[index] is None or preference < preferences[index]:
+                    cells[index], preferences[index] = cell, preference
+        return cells
+
+    def extract_rows(self, rows):
+        """
+        Extract rows into Data objects, skipping rows that cannot be parsed.
+        :param rows: List of HTML rows of the economic calendar table.
+        :return: List of Data objects, with published times.
+        """
+        extracted_data = []
+        for row in rows:
+            try:
+                extracted_data.append(self.extract(row))
+            except Exception as e:
+                log_error(f"Error parsing row: {e}")
+        return extracted_data
+
+    def extract(self, row):
+        """
+        Extract one row into a Data object.
+        :param row: An HTML row of the economic calendar table.
+        :return: A Data object.
+        """
+        values = {
+            field: parser(cell) if cell is not None else default
+            for (field, _, parser, default), cell in zip(self.schema, self.find_cells(row))
+        }
+        event, event_id = values["event"]
+        return data.Data(
+            time=values["time"],
+            currency=values["currency"],
+            event=event,
+            id=event_id,
+            importance=values["importance"],
+            actual=values["actual"],
+            forecast=values["forecast"],
+            previous=values["previous"],
+            # Release date and time from the row attributes
+            datetime=row.get("data-event-datetime"),
+        )
+
+
+# Shared extractor compiled from ROW_SCHEMA
+ROW_EXTRACTOR = RowExtractor()
+
+
+def find_calendar_table(html):
+    """
+    Locate the economic calendar table in raw HTML with a byte search, without parsing the page.
+    Tables nested in the calendar table are skipped by counting table tags; tags inside comments or
+    scripts are counted too, which the calendar markup does not contain.
+    :param html: The raw HTML content as bytes or a memory map.
+    :return: A tuple (start, end) spanning the opening <table> tag to its closing tag, or None if not found.
+    """
+    start = CALENDAR_TABLE_START.search(html)
+    if not start:
+        return None
+    depth = 1
+    for tag in TABLE_TAG.finditer(html, start.end()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return start.start(), tag.end()
+    return None
+
+
+def read_calendar_table(file_path):
+    """
+    Read only the calendar table of a saved page. The file is memory-mapped and the table is
+    located with a byte search (see find_calendar_table), so the rest of the page is never copied into memory.
+    :param file_path: Path to the HTML file.
+    :return: The bytes from the opening <table> tag to its closing tag, or None if not found.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            bounds = find_calendar_table(mapped)
+            return mapped[bounds[0]:bounds[1]] if bounds else None
+
+
+def split_calendar_table(table):
+    """
+    Split the calendar table at its day-separator rows. Every chunk holds whole rows, so the
+    chunks can be parsed independently; the table header stays with the first day.
+    :param table: The calendar table as bytes (see Fetcher._slice_calendar_table).
+    :return: List of byte chunks in document order.
+    """
+    starts = [match.start() for match in DAY_ROW.finditer(table)][1:]
+    bounds = [0] + starts + [len(table)]
+    return [table[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def extract_chunk(chunk):
+    """
+    Parse a chunk of the calendar table and extract its rows. Runs in a worker process.
+    :param chunk: Bytes of whole table rows.
+    :return: List of Data objects, with published times.
+    """
+    rows = BeautifulSoup(chunk, "html.parser").find_all('tr', {"class": "js-event-item"})
+    return ROW_EXTRACTOR.extract_rows(rows)
+
+
 class Fetcher:
-    def __init__(self, base_url, target_timezone="UTC"):
+    def __init__(self, base_url, target_timezone=None, parser_mode="full", base_timezone=None, cache=None):
         """
         Initialize Fetcher with the base URL and target timezone.
-        :param base_url: The URL of the economic calendar on Investing.com.
-        :param target_timezone: The target timezone for output times (e.g., "UTC").
+        :param base_url: The URL of the economic calendar on Investing.com, or None for a Fetcher that only
+                         parses pages (no HTTP session or response cache is set up).
+        :param target_timezone: The target timezone for output times (e.g., "UTC"), or None to keep published times.
+        :param parser_mode: "full" to parse the whole page, "table" to parse only the calendar table.
+        :param base_timezone: The timezone of the published times, defaults to Config.BASE_TIMEZONE.
+        :param cache: ResponseCache shared with other processes, defaults to the one configured by RESPONSE_CACHE_DIR.
         """
+        if parser_mode not in PARSER_MODES:
+            raise ValueError(f"Unknown parser mode: {parser_mode}")
         self.base_url = base_url
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.target_timezone = target_timezone
+        self.base_timezone = base_timezone or Config.BASE_TIMEZONE
+        self.parser_mode = parser_mode
+        self.converter = None
+        if target_timezone and target_timezone != self.base_timezone:
+            self.converter = get_converter(self.base_timezone, target_timezone)
+
+        # Pooled keep-alive session reused across fetches (one TLS handshake per connection)
+        self.http = None
+        if base_url is not None:
+            self.http = urllib3.PoolManager(
+                maxsize=2,
+                headers={**self.headers, **urllib3.make_headers(accept_encoding="gzip,deflate", keep_alive=True)},
+                retries=urllib3.Retry(total=2, redirect=5, raise_on_status=False),
+            )
+
+        # Revalidation state of the last successful fetch
+        self.etag = None
+        self.last_modified = None
+        self.last_digest = None
+        self.last_html = None
+        self.last_dataset = None
+        self.content_changed = True
+
+        # Shared on-disk response cache (None when disabled)
+        self.cache = cache if cache is not None or base_url is None else default_cache()
+
+    def close(self):
+        """
+        Close the pooled connections of the HTTP session. A later fetch opens new ones.
+        """
+        if self.http is not None:
+            self.http.clear()
 
     def extract_data(self, rows):
         """
         Extract relevant information from the rows, including importance level and value colors.
+        Each row is read in a single pass over its cells (see ROW_EXTRACTOR).
         :param rows: List of HTML rows from the economic calendar table.
         :return: List of dictionaries containing extracted data.
         """
-        extracted_data = []
-        for row in rows:
-            try:
-                # Extract currency
-                currency_cell = row.find('td', {"class": "flagCur"})
-                currency = currency_cell.text.strip() if currency_cell else None
-
-                # Extract time
-                time_cell = row.find('td', {"class": "first left time"}) or row.find('td', {"class": "time"})
-                time = time_cell.text.strip() if time_cell else None
-
-                # Extract event
-                event_cell = row.find('td', {"class": "event"})
-                event = event_cell.text.strip() if event_cell else "Unknown Event"
-                event_link = event_cell.find('a') if event_cell else None
-
-                # Extract event ID from the link
-                id = None
-                if event_link:
-                    href = event_link.get("href", "")
-                    id = href.split("/")[-1]  # Extract the last part of the URL (e.g., 'unemployment-rate-300')
-
-                # Extract importance level
-                importance_cell = row.find('td', {"class": "sentiment"})
-                if importance_cell:
-                    importance = len(importance_cell.find_all("i", {"class": "grayFullBullishIcon"}))
-                else:
-                    importance = 0  # Default to 0 if importance level is missing
-
-                # Extract values with colors
-                def parse_value(cell):
-                    if not cell:
-                        return None
-                    value, unit = self._parse_value(cell.text.strip())
-                    color_class = cell.get("class", [])
-                    color = "neutral"  # Default
-                    if "redFont" in color_class:
-                        color = "negative"
-                    elif "greenFont" in color_class:
-                        color = "positive"
-                    elif "bold" in color_class and "blackFont" in color_class:
-                        color = "equal"
-                    return data.Value(value, unit, color)
-
-                actual_cell = row.find('td', {"class": "bold"})
-                forecast_cell = row.find('td', {"class": "fore"})
-                previous_cell = row.find('td', {"class": "prev"})
-
-                actual = parse_value(actual_cell)
-                forecast = parse_value(forecast_cell)
-                previous = parse_value(previous_cell)
-
-                # Append parsed data
-                extracted_data.append(data.Data(
-                    time=time, 
-                    currency=currency,
-                    event=event,
-                    id=id,
-                    importance=importance,
-                    actual=actual,
-                    forecast=forecast,
-                    previous=previous,
-                ))
-            except Exception as e:
-                log_error(f"Error parsing row: {e}")
+        extracted_data = ROW_EXTRACTOR.extract_rows(rows)
+
+        # Normalize event times to the target timezone in one batch
+        if self.converter:
+            self.converter.convert_dataset(extracted_data)
 
         return extracted_data
 
@@ -101,66 +305,208 @@ class Fetcher:
         :param value_str: The value string to parse (e.g., '194K', '-2%', '1.5B').
         :return: A tuple containing the numeric value (as float) and the unit (as str), or (None, None) if invalid.
         """
-        try:
-            if not value_str or value_str == "&nbsp;":
-                return None, None
-
-            # Match a number with an optional unit (any letter or '%')
-            import re
-            match = re.match(r"([-+]?\d*\.?\d+)([a-zA-Z%]*)", value_str.strip())
-            if match:
-                number = float(match.group(1))  # Numeric value
-                unit = match.group(2) or ""  # Unit (e.g., '%', 'K', 'B') or empty string
-                return number, unit
-            return None, None
-        except Exception as e:
-            print(f"Error parsing value: {e}")
-            return None, None
+        return parse_number(value_str)
 
 
-    def fetch_html(self, save_sample=False):
+    def fetch_raw_html(self, save_sample=False, cancel=None):
         """
-        Fetch HTML content from the base URL.
+        Fetch raw HTML content from the base URL, through the shared response cache if one is configured.
         :param save_sample: If True, save fetched HTML content to a file.
-        :return: BeautifulSoup object containing the parsed HTML.
+        :param cancel: Optional threading.Event; when given, the body is streamed and the
+                       download is abandoned as soon as the event is set. Cancellable requests bypass the cache.
+        :return: The raw (decompressed) HTML content as bytes, or None if fetching fails or is cancelled.
+        """
+        if self.cache is not None and cancel is None:
+            return self.fetch_cached(save_sample)
+        return self.fetch_upstream(save_sample, cancel)
+
+    def fetch_cached(self, save_sample=False):
+        """
+        Fetch raw HTML content through the shared response cache: a page fetched by any process
+        within the freshness window is reused instead of being requested again.
+        :param save_sample: If True, save HTML content fetched upstream to a file.
+        :return: The raw HTML content as bytes, or None if fetching fails.
+        """
+        def fetch():
+            html = self.fetch_upstream(save_sample)
+            if html is None:
+                return None
+            return html, {"etag": self.etag, "last_modified": self.last_modified}
+
+        result = self.cache.fetch(self.base_url, fetch)
+        if result is None:
+            return None
+        html, meta = result
+        digest = bytes.fromhex(meta["digest"])
+        if html is not self.last_html:
+            # Served from the cache: adopt its validators so they always match last_html
+            self.content_changed = digest != self.last_digest
+            self.last_digest = digest
+            self.last_html = html
+            self.etag = meta.get("etag")
+            self.last_modified = meta.get("last_modified")
+        return html
+
+    def request_headers(self):
+        """
+        Build the headers of the next request: the session defaults (User-Agent, gzip/deflate,
+        keep-alive) plus the validators of the previous response.
+        Per-request headers replace the pool defaults in urllib3, so the defaults are copied in.
+        :return: Dictionary of request headers.
+        """
+        headers = dict(self.http.headers)
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def fetch_upstream(self, save_sample=False, cancel=None):
+        """
+        Fetch raw HTML content from the base URL over the keep-alive session.
+        Sends ETag / If-Modified-Since validators from the previous response; on a
+        304 response or a byte-identical body, content_changed is set to False and
+        the previous HTML is returned.
+        :param save_sample: If True, save fetched HTML content to a file.
+        :param cancel: Optional threading.Event; when given, the body is streamed and the
+                       download is abandoned as soon as the event is set.
+        :return: The raw (decompressed) HTML content as bytes, or None if fetching fails or is cancelled.
         """
         try:
-            req = urllib.request.Request(self.base_url, headers=self.headers)
-            response = urllib.request.urlopen(req)
-            html = response.read()
+            # Cancellable (hedged) requests are timed by their caller
+            with metrics.stage("fetch") if cancel is None else NO_OP:
+                response = self.http.request("GET", self.base_url, headers=self.request_headers(), decode_content=True,
+                                             preload_content=cancel is None)
+                html = self._read_body(response, cancel)
+            # Bytes received on the wire (compressed), not the decoded body size
+            metrics.increment("bytes_downloaded", response.tell())
+            metrics.increment("fetches")
 
-            # Optionally save fetched HTML to a file
-            if save_sample:
-                file_path = f"sample/economic_calendar_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-                self.save_html_to_file(html, file_path)
+            if response.status == 304 and self.last_html is not None:
+                self.content_changed = False
+                return self.last_html
+            if response.status >= 400:
+                log_error(f"HTTP Error: {response.status}")
+                return None
+            if html is None:
+                return None
+
+            digest = hashlib.sha1(html).digest()
+            self.content_changed = digest != self.last_digest
+            self.last_digest = digest
+            self.last_html = html
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
 
-            soup = BeautifulSoup(html, "html.parser")
+            # Optionally save fetched HTML to a file or the snapshot archive
+            if save_sample:
+                self.record_sample(html)
 
-            return soup
-        except HTTPError as e:
-            log_error(f"HTTP Error: {e.code}")
+            return html
         except Exception as e:
             log_error(f"Error fetching data: {e}")
-        return []
-    
+        return None
+
+    def _read_body(self, response, cancel=None):
+        """
+        Read the response body, optionally abandoning it when a cancel event is set.
+        An abandoned connection is closed rather than returned to the pool half-read.
+        :param response: The urllib3 response.
+        :param cancel: Optional threading.Event.
+        :return: The decompressed body as bytes, or None if cancelled.
+        """
+        if cancel is None:
+            return response.data
+        chunks = []
+        for chunk in response.stream(STREAM_CHUNK_SIZE, decode_content=True):
+            if cancel.is_set():
+                response.close()
+                response.release_conn()
+                return None
+            chunks.append(chunk)
+        response.release_conn()
+        return b"".join(chunks)
+
+    def fetch_html(self, save_sample=False):
+        """
+        Fetch HTML content from the base URL.
+        :param save_sample: If True, save fetched HTML content to a file.
+        :return: BeautifulSoup object containing the parsed HTML.
+        """
+        html = self.fetch_raw_html(save_sample)
+        if html is None:
+            return []
+        return BeautifulSoup(html, "html.parser")
+
     def fetch_data(self, save_sample=False):
         """
         Fetch and process economic calendar data.
         :param save_sample: If True, save fetched HTML content to a file.
         :return: List of dictionaries containing event data filtered for US indices.
         """
-        soup = self.fetch_html(save_sample)
-        if not soup:
+        html = self.fetch_raw_html(save_sample)
+        if not html:
             return []
 
-        table = soup.find('table', {"id": "economicCalendarData"})
-        if not table:
+        # Skip parsing entirely when the page has not changed since the last fetch
+        if not self.content_changed and self.last_dataset is not None:
+            return self.last_dataset
+
+        with metrics.stage("parse"):
+            rows = self.find_rows(html)
+        if rows is None:
             log_error("Economic calendar table not found.")
             return []
 
-        rows = table.find_all('tr', {"class": "js-event-item"})
-        return self.extract_data(rows)
+        with metrics.stage("extract"):
+            self.last_dataset = self.extract_data(rows)
+        return self.last_dataset
+
+    def find_rows(self, html):
+        """
+        Parse raw HTML and return the event rows of the economic calendar table.
+        In "table" parser mode only the calendar table is handed to the parser;
+        the rest of the page (navigation, ads, scripts) is never tokenized.
+        :param html: The raw HTML content as bytes.
+        :return: List of event rows, or None if the calendar table is not found.
+        """
+        if self.parser_mode == "table":
+            fragment = self._slice_calendar_table(html)
+            if fragment is not None:
+                soup = BeautifulSoup(fragment, "html.parser")
+                return soup.find_all('tr', {"class": "js-event-item"})
+            # Fall back to a full parse if the table could not be located by the byte scan
 
+        soup = BeautifulSoup(html, "html.parser")
+        table = soup.find('table', {"id": "economicCalendarData"})
+        if not table:
+            return None
+        return table.find_all('tr', {"class": "js-event-item"})
+
+    def _slice_calendar_table(self, html):
+        """
+        Locate the economic calendar table in raw HTML with a byte search (see find_calendar_table).
+        :param html: The raw HTML content as bytes.
+        :return: The bytes from the opening <table> tag to its closing tag, or None if not found.
+        """
+        bounds = find_calendar_table(html)
+        return html[bounds[0]:bounds[1]] if bounds else None
+
+    def record_sample(self, html):
+        """
+        Save a fetched page: appended to the snapshot archive if SNAPSHOT_ARCHIVE is set,
+        otherwise written to a timestamped file under sample/.
+        :param html: The raw HTML content as bytes.
+        """
+        archive = default_archive()
+        if archive is None:
+            file_path = f"sample/economic_calendar_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            self.save_html_to_file(html, file_path)
+            return
+        try:
+            archive.append(html)
+        except Exception as e:
+            log_error(f"Failed to archive snapshot: {e}")
 
     def save_html_to_file(self, html, file_path="sample/economic_calendar.html"):
         """
@@ -176,42 +522,89 @@ class Fetcher:
         except Exception as e:
             log_error(f"Failed to save HTML content: {e}")
 
+    def read_html(self, file_path):
+        """
+        Read a saved page. In "table" parser mode only the calendar table is read (see read_calendar_table).
+        :param file_path: Path to the HTML file.
+        :return: The raw HTML content as bytes.
+        """
+        if self.parser_mode == "table":
+            table = read_calendar_table(file_path)
+            if table is not None:
+                return table
+            # Fall back to the whole file so that find_rows can try a full parse
+
+        with open(file_path, "rb") as file:
+            return file.read()
+
     def load_html_from_file(self, file_path):
         """
         Load and parse HTML content from a file.
+        In "table" parser mode the result holds only the calendar table.
         :param file_path: Path to the HTML file.
         :return: BeautifulSoup object or None if loading fails.
         """
         try:
-            with open(file_path, "rb") as file:
-                html = file.read()
-            return BeautifulSoup(html, "html.parser")
+            return BeautifulSoup(self.read_html(file_path), "html.parser")
         except Exception as e:
             log_error(f"Failed to load HTML from {file_path}: {e}")
             return None
 
+    def extract_parallel(self, html, workers=None, executor=None):
+        """
+        Parse and extract the calendar table in day chunks across a process pool, then merge
+        the chunks in order. The result is identical to find_rows followed by extract_data.
+        :param html: The raw HTML content as bytes.
+        :param workers: Number of worker processes (defaults to the CPU count).
+        :param executor: Optional ProcessPoolExecutor to reuse across calls.
+        :return: List of Data objects, or None if the calendar table is not found.
+        """
+        table = self._slice_calendar_table(html)
+        if table is None:
+            rows = self.find_rows(html)
+            return None if rows is None else self.extract_data(rows)
+
+        chunks = split_calendar_table(table)
+        if len(chunks) < 2:
+            results = [extract_chunk(chunk) for chunk in chunks]
+        elif executor is not None:
+            results = list(executor.map(extract_chunk, chunks))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(chunks))) as pool:
+                results = list(pool.map(extract_chunk, chunks))
+        extracted_data = [d for chunk_data in results for d in chunk_data]
 
-    def read_data(self, file_path):
+        # Normalize event times to the target timezone in one batch
+        if self.converter:
+            self.converter.convert_dataset(extracted_data)
+
+        return extracted_data
+
+    def read_data(self, file_path, workers=None):
         """
         Read and parse HTML content from a file.
         :param file_path: Path to the HTML file.
-        :return: BeautifulSoup object or None if loading fails.
+        :param workers: Number of worker processes to parse multi-day pages in parallel
+                        (see extract_parallel), or None to parse in this process.
+        :return: List of Data objects, or None if loading fails.
         """
         try:
             # Load the sample HTML
-            soup = self.load_html_from_file(file_path)
-            if not soup:
-                print("Failed to load or parse the sample HTML file.")
-                return
+            html = self.read_html(file_path)
+
+            if workers and workers > 1:
+                dataset = self.extract_parallel(html, workers)
+                if dataset is None:
+                    print("Economic calendar table not found in the sample file.")
+                    return []
+                return dataset
 
             # Simulate the Fetcher processing the loaded HTML
-            table = soup.find('table', {"id": "economicCalendarData"})
-            if not table:
+            rows = self.find_rows(html)
+            if rows is None:
                 print("Economic calendar table not found in the sample file.")
                 return []
 
-            # Extract rows from the table
-            rows = table.find_all('tr', {"class": "js-event-item"})
             return self.extract_data(rows)
 
         except Exception as e:
@@ -220,7 +613,6 @@ class Fetcher:
 
 # Add __main__ function for standalone execution
 if __name__ == "__main__":
-    from config import Config
     base_url = Config.BASE_URL 
     fetcher = Fetcher(base_url) # Use default EST timezone
     print("Fetching data and saving to ./sample/economic_calendar.html...")
@@ -1,30 +1,140 @@
 from fetcher import Fetcher
+from async_fetcher import AsyncFetcher
+from sources import HedgedFetcher
 from processor import SignalProcessor
+from differ import RowDiffer
+from store import EventStore
+from data import ChangeType
 from scheduler import Scheduler
 from config import Config
+from renderer import TableRenderer
+from publisher import SignalPublisher
+from metrics import metrics
+from archive import ArchiveWriter, SnapshotArchive, view_archive_paths
+from profiles import ProfileSet, load_profiles
 from datetime import datetime
 
+# One fetch serves every profile; profiles convert times themselves, so the dataset keeps the published times
+profiles = ProfileSet(load_profiles(Config.PROFILES_FILE)) if Config.PROFILES_FILE else None
+target_timezone = None if profiles else Config.TARGET_TIMEZONE
+
+# Shared across ticks so the HTTP session stays alive between fetches
+if len(Config.CALENDAR_URLS) > 1:
+    fetcher = AsyncFetcher(Config.CALENDAR_URLS, target_timezone=target_timezone,
+                           parser_mode=Config.PARSER_MODE, max_concurrency=Config.FETCH_CONCURRENCY)
+elif Config.MIRROR_URLS:
+    fetcher = HedgedFetcher([Config.CALENDAR_URLS[0]] + Config.MIRROR_URLS, target_timezone=target_timezone,
+                            parser_mode=Config.PARSER_MODE, hedge_delay=Config.HEDGE_DELAY)
+else:
+    fetcher = Fetcher(Config.CALENDAR_URLS[0], target_timezone=target_timezone, parser_mode=Config.PARSER_MODE)
+processor = SignalProcessor()
+differ = RowDiffer(processor)
+# Opened when the scraper starts, so importing this module creates no database or writer thread
+store = None
+archive_writer = None
+renderer = TableRenderer()
+publisher = SignalPublisher(Config.PUBLISH_ADDRESS, Config.PUBLISH_QUEUE_SIZE) if Config.PUBLISH_ADDRESS else None
+metrics.enabled = Config.METRICS_ENABLED
+
+def polled_pages():
+    """
+    Get the raw pages of the last poll, one per calendar view.
+    :return: List of raw HTML contents as bytes (None for views that failed).
+    """
+    if isinstance(fetcher, AsyncFetcher):
+        return fetcher.last_pages
+    return [fetcher.last_html]
+
 def run_task():
     """
     Defines the task to fetch and process data, then output the result.
+    :return: The fetched dataset, used by the scheduler to poll fast around pending releases.
     """
     print(f"[{datetime.now()}] Running task...")  # Add timestamp
-    fetcher = Fetcher(Config.BASE_URL, target_timezone=Config.TARGET_TIMEZONE)
-    processor = SignalProcessor()
 
-    dataset = fetcher.fetch_data()
-    if dataset:
-        # Aggregate and classify signals for the data
-        overall_signal = processor.aggregate_signals(dataset)
-        print(f"Overall Signal: {overall_signal}")
-    else:
-        print("No data fetched.")
+    with metrics.stage("task"):
+        dataset = fetcher.fetch_data()
+        if dataset:
+            # Classify only the rows that changed since the previous poll
+            with metrics.stage("classify"):
+                changes = differ.update(dataset)
+            metrics.set_gauge("rows", len(dataset))
+            metrics.set_gauge("changed_rows", len(changes))
+            metrics.increment("row_changes", len(changes))
+            overall_signal = differ.overall_signal()
+            if publisher and changes:
+                # Push to subscribers before recording and rendering
+                publisher.publish_changes(changes, overall_signal)
+            if store:
+                # Record first observations and every change; unchanged rows carry no new information
+                store.record([change.data for change in changes if change.change_type != ChangeType.REMOVED])
+            with metrics.stage("render"):
+                # Repaints only the table lines that changed since the previous poll
+                if profiles:
+                    profiles.render(dataset)
+                else:
+                    renderer.render(dataset)
+                if changes:
+                    for change in changes:
+                        if change.change_type != ChangeType.NEW:
+                            print(change)
+                else:
+                    print("No changes since the previous poll.")
+                print(f"Overall Signal: {overall_signal}")
+            if archive_writer:
+                # Every poll is recorded off the polling path; an unchanged page only adds a reference
+                archive_writer.submit(polled_pages())
+        else:
+            print("No data fetched.")
 
+    if Config.METRICS_FILE:
+        metrics.write(Config.METRICS_FILE)
     print("Task complete.\n"+'-'*50)
+    return dataset
+
+def warm_up():
+    """
+    Prepare for an upcoming critical time without rendering, publishing or recording: reload event metadata,
+    open and TLS-warm the connection and parse the current page, so the first critical tick only
+    handles changed rows. The fetched rows become the baseline snapshot if there is none yet; an
+    existing snapshot is left alone, so changes found now are still reported by the next tick.
+    :return: The fetched dataset, used by the scheduler to poll fast around pending releases.
+    """
+    print(f"[{datetime.now()}] Warming up for critical time...")
+    processor.warm_up()
+    dataset = fetcher.fetch_data()
+    if dataset and not differ.snapshot:
+        differ.update(dataset)
+    return dataset
 
 if __name__ == "__main__":
-    scheduler = Scheduler(run_task)
+    if Config.HISTORY_DB:
+        store = EventStore(Config.HISTORY_DB)
+    if Config.SNAPSHOT_ARCHIVE:
+        # One archive per calendar view, so each holds the timeline of a single page
+        archive_writer = ArchiveWriter([
+            SnapshotArchive(path, codec=Config.SNAPSHOT_ARCHIVE_CODEC)
+            for path in view_archive_paths(Config.SNAPSHOT_ARCHIVE, len(Config.CALENDAR_URLS))
+        ])
+    scheduler = Scheduler(run_task, warmup_function=warm_up)
+    if metrics.enabled and Config.METRICS_PORT:
+        metrics.serve(Config.METRICS_PORT)
+    if publisher:
+        publisher.start()
     try:
         scheduler.start()
     except KeyboardInterrupt:
         scheduler.stop()
+    finally:
+        if store:
+            store.close()
+        if publisher:
+            publisher.close()
+        if archive_writer:
+            archive_writer.close()
+        if profiles:
+            profiles.close()
+        else:
+            renderer.close()
+        fetcher.close()
+        metrics.close()
@@ -0,0 +1,238 @@
+import bisect
+import json
+import math
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+# Prometheus metric name prefix
+PREFIX = "ecocal"
+
+# Upper bounds (seconds) of the stage latency histogram buckets
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Shared no-op context manager returned by stage() when metrics are disabled
+NO_OP = nullcontext()
+
+
+def percentile(samples, fraction):
+    """
+    Get a percentile of a list of samples (nearest rank).
+    :param samples: List of numbers.
+    :param fraction: Percentile as a fraction (e.g., 0.99).
+    :return: The percentile value, or None if there are no samples.
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class StageTimer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Histogram:
+    def __init__(self, window):
+        """
+        Latency histogram with cumulative buckets and a rolling window of recent samples.
+        :param window: Number of recent samples kept for percentiles.
+        """
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+
+
+class Metrics:
+    def __init__(self, enabled=False, window=1000):
+        """
+        Per-stage latency histograms, counters and gauges for the polling pipeline.
+        When disabled, stage() returns a shared no-op context manager and nothing is recorded.
+        :param enabled: Whether to record metrics.
+        :param window: Number of recent samples per stage kept for percentiles.
+        """
+        self.enabled = enabled
+        self.window = window
+        self.lock = Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+        self.server = None
+
+    def stage(self, name):
+        """
+        Time a pipeline stage: `with metrics.stage("fetch"): ...`
+        :param name: The stage name (e.g., "fetch", "parse", "extract", "classify", "render").
+        :return: A context manager.
+        """
+        if not self.enabled:
+            return NO_OP
+        return StageTimer(self, name)
+
+    def observe(self, name, seconds):
+        """
+        Record a stage duration.
+        :param name: The stage name.
+        :param seconds: Duration in seconds.
+        """
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.window)
+            histogram.observe(seconds)
+
+    def increment(self, name, value=1):
+        """
+        Increase a counter.
+        :param name: The counter name (e.g., "bytes_downloaded").
+        :param value: Amount to add.
+        """
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        """
+        Set a gauge to its latest value.
+        :param name: The gauge name (e.g., "rows").
+        :param value: The value.
+        """
+        if not self.enabled:
+            return
+        with self.lock:
+            self.gauges[name] = value
+
+    def snapshot(self):
+        """
+        Get a JSON-serializable summary of all metrics.
+        :return: Dictionary with stages (count, sum, p50, p99, last), counters and gauges.
+        """
+        with self.lock:
+            stages = {}
+            for name, histogram in self.histograms.items():
+                recent = list(histogram.recent)
+                stages[name] = {
+                    "count": histogram.count,
+                    "sum_seconds": histogram.sum,
+                    "p50_seconds": percentile(recent, 0.5),
+                    "p99_seconds": percentile(recent, 0.99),
+                    "last_seconds": recent[-1] if recent else None,
+                }
+            return {"stages": stages, "counters": dict(self.counters), "gauges": dict(self.gauges)}
+
+    def to_json(self):
+        """
+        Render all metrics as JSON.
+        :return: JSON string.
+        """
+        return json.dumps(self.snapshot(), indent=4)
+
+    def to_prometheus(self):
+        """
+        Render all metrics in the Prometheus text exposition format.
+        :return: Text string.
+        """
+        lines = []
+        with self.lock:
+            name = f"{PREFIX}_stage_duration_seconds"
+            lines.append(f"# HELP {name} Duration of pipeline stages.")
+            lines.append(f"# TYPE {name} histogram")
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS + ("+Inf",), histogram.bucket_counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+            for counter, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {PREFIX}_{counter}_total counter")
+                lines.append(f"{PREFIX}_{counter}_total {value}")
+            for gauge, value in sorted(self.gauges.items()):
+                lines.append(f"# TYPE {PREFIX}_{gauge} gauge")
+                lines.append(f"{PREFIX}_{gauge} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        Write all metrics to a file atomically: JSON for *.json paths, Prometheus text otherwise.
+        :param path: Output file path.
+        """
+        if not self.enabled:
+            return
+        content = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    def serve(self, port, host="127.0.0.1"):
+        """
+        Serve metrics over HTTP in a background thread: /metrics (Prometheus text) and /metrics.json.
+        :param port: Port to listen on (0 picks a free port).
+        :param host: Address to bind, local only by default.
+        :return: The HTTP server.
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics.json":
+                    body, content_type = metrics.to_json(), "application/json"
+                elif self.path == "/metrics":
+                    body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+                body = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+        Thread(target=self.server.serve_forever, name="MetricsServer", daemon=True).start()
+        return self.server
+
+    def close(self):
+        """
+        Stop the metrics HTTP server, if running.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+# Process-wide metrics registry, enabled and exported by main.py according to Config
+metrics = Metrics()
@@ -1,15 +1,34 @@
+from collections import Counter
 from utils import prettify_dataset
-from json import load
 from data import Data, SignalLevel
+from event_index import EventIndex
+from config import Config
+import numpy as np
 
-# Load positivity mapping once at the top
-with open("event_data.json", "r") as f:
-    event_data_json = load(f)
+# Positivity mapping, loaded on first use and reloaded when the file changes
+event_index = EventIndex(Config.EVENT_DATA_FILE)
+
+# Signal codes used by the batch classifier: index into SIGNAL_LEVELS
+SIGNAL_LEVELS = list(SignalLevel)
+STRONG_BUY, BUY, WEAK_BUY, NEUTRAL, WEAK_SELL, SELL, STRONG_SELL, NO_SIGNAL = range(len(SIGNAL_LEVELS))
+SIGNAL_VALUES = np.array([level.value for level in SIGNAL_LEVELS], dtype=object)
 
 
 class SignalProcessor:
-    def __init__(self):
-        pass
+    def __init__(self, threshold=0.1, strong_threshold=0.2):
+        """
+        Initialize the SignalProcessor with its classification thresholds.
+        :param threshold: Relative change above which a Buy/Sell signal is given.
+        :param strong_threshold: Relative change above which a Strong Buy/Strong Sell signal is given.
+        """
+        self.threshold = threshold
+        self.strong_threshold = strong_threshold
+
+    def warm_up(self):
+        """
+        Load (or reload) the event metadata index ahead of time, so the first lookup is cheap.
+        """
+        event_index.refresh(force=True)
 
     def aggregate_signals(self, dataset):
         """
@@ -19,17 +38,99 @@ class SignalProcessor:
         """
         # Add Positive/Negative indicator to each d
         dataset = self.add_pn_indicator(dataset)
-        signals = [self.classify_signal(d) for d in dataset]
+        signals = self.classify_batch(dataset)
 
         # Print prettified dataset with signals
         prettify_dataset(dataset)
 
-        # Aggregate by counting occurrences of each signal
-        signal_counts = {signal: signals.count(signal) for signal in set(signals)}
+        return self.most_common_signal(signals)
+
+    def most_common_signal(self, signals):
+        """
+        Pick the most frequent signal.
+        :param signals: List of signal strings.
+        :return: The signal with the highest count.
+        """
+        # Aggregate by counting occurrences of each signal in a single pass
+        signal_counts = Counter(signals)
         most_common_signal = max(signal_counts, key=signal_counts.get)
 
         return most_common_signal
 
+    def classify_batch(self, dataset):
+        """
+        Classify signals for a whole dataset at once and store them on each row.
+        Gives the same results as calling classify_signal on every row.
+        :param dataset: List of Data objects with P/N indicators set.
+        :return: List of signal strings in dataset order.
+        """
+        def column(attribute):
+            return np.fromiter(
+                (getattr(d, attribute).value if getattr(d, attribute) and getattr(d, attribute).value is not None
+                 else np.nan for d in dataset),
+                dtype=float, count=len(dataset),
+            )
+
+        negative = np.fromiter((d.pn_indicator == "negative" for d in dataset), dtype=bool, count=len(dataset))
+        codes = self.classify_columns(column("actual"), column("forecast"), column("previous"), negative)
+        signals = SIGNAL_VALUES[codes].tolist()
+        for d, signal in zip(dataset, signals):
+            d.set_signal(signal)
+        return signals
+
+    def classify_columns(self, actual, forecast, previous, negative):
+        """
+        Vectorized signal classification over columnar arrays.
+        Missing values are NaN. Mirrors the rules of classify_signal.
+        :param actual: Float array of actual values.
+        :param forecast: Float array of forecast values.
+        :param previous: Float array of previous values.
+        :param negative: Bool array, True where the P/N indicator is "negative".
+        :return: Int array of signal codes (indices into SIGNAL_LEVELS).
+        """
+        actual = np.asarray(actual, dtype=float)
+        forecast = np.asarray(forecast, dtype=float)
+        previous = np.asarray(previous, dtype=float)
+
+        has_actual = ~np.isnan(actual)
+        has_forecast = ~np.isnan(forecast)
+        has_previous = ~np.isnan(previous)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Calculate changes relative to previous
+            delta_prev = np.where(previous != 0, (actual - previous) / previous, 0.0)
+            delta_forecast = np.where(
+                actual != previous,
+                np.where(previous != 0, (actual - forecast) / (actual - previous), 0.0),
+                np.where(actual != 0, (actual - forecast) / actual, 0.0),
+            )
+
+        def by_threshold(delta):
+            return np.select(
+                [delta > self.strong_threshold, delta > self.threshold,
+                 delta < -self.strong_threshold, delta < -self.threshold],
+                [STRONG_BUY, BUY, STRONG_SELL, SELL],
+                default=NEUTRAL,
+            )
+
+        codes = np.where(
+            ~has_forecast,
+            by_threshold(delta_prev),
+            np.select(
+                [forecast > previous, (forecast < previous) & (previous < actual)],
+                [by_threshold(delta_forecast), STRONG_BUY],
+                default=NEUTRAL,
+            ),
+        )
+
+        # Adjust for P/N indicator: mirror Buy <-> Sell around Neutral
+        codes = np.where(negative, STRONG_SELL - codes, codes)
+
+        # Ensure all required values are present
+        codes = np.where(has_actual, codes, NO_SIGNAL)
+        codes = np.where(has_previous, codes, NEUTRAL)
+        return codes
+
     def add_pn_indicator(self, dataset):
         """
         Add Positive/Negative (P/N) indicator to each d based on the event name.
@@ -38,10 +139,25 @@ class SignalProcessor:
         """
         for d in dataset:
             # Match the event name to the positivity mapping
-            pn = event_data_json.get(d.id)
-            pn_indicator = pn.get("pn_indicator").lower() if pn else None
-            d.set_pn_indicator(pn_indicator)
+            d.set_pn_indicator(self.pn_indicator(d.id))
         return dataset
+
+    def pn_indicator(self, event_id):
+        """
+        Look up the Positive/Negative (P/N) indicator of an event in the metadata catalog.
+        :param event_id: The event id.
+        :return: "positive", "negative", or None if the event is unknown.
+        """
+        pn = event_index.get(event_id)
+        return pn.get("pn_indicator").lower() if pn else None
+
+    def metadata_generation(self):
+        """
+        Get the generation of the event metadata, which changes whenever the catalog is (re)loaded.
+        :return: The generation number.
+        """
+        event_index.refresh()
+        return event_index.generation
     
     def classify_signal(self, d: Data):
         """
@@ -74,25 +190,25 @@ class SignalProcessor:
 
             # Determine the signal based on conditions
             if forecast is None:  # No forecast case
-                if delta_prev > 0.2:
+                if delta_prev > self.strong_threshold:
                     signal = SignalLevel.STRONG_BUY.value
-                elif delta_prev > 0.1:
+                elif delta_prev > self.threshold:
                     signal = SignalLevel.BUY.value
-                elif delta_prev < -0.2:
+                elif delta_prev < -self.strong_threshold:
                     signal = SignalLevel.STRONG_SELL.value
-                elif delta_prev < -0.1:
+                elif delta_prev < -self.threshold:
                     signal = SignalLevel.SELL.value
                 else:
                     signal = SignalLevel.NEUTRAL.value
             else:  # Forecast provided case
                 if forecast > previous:  # Forecast is higher than previous
-                    if delta_forecast > 0.2:
+                    if delta_forecast > self.strong_threshold:
                         signal = SignalLevel.STRONG_BUY.value
-                    elif delta_forecast > 0.1:
+                    elif delta_forecast > self.threshold:
                         signal = SignalLevel.BUY.value
-                    elif delta_forecast < -0.2:
+                    elif delta_forecast < -self.strong_threshold:
                         signal = SignalLevel.STRONG_SELL.value
-                    elif delta_forecast < -0.1:
+                    elif delta_forecast < -self.threshold:
                         signal = SignalLevel.SELL.value
                     else:
                         signal = SignalLevel.NEUTRAL.value
@@ -0,0 +1,159 @@
+import json
+import sys
+from datetime import datetime
+from config import Config
+from renderer import TableRenderer
+from utils import get_converter, select_rows, log_error
+
+# Converted times kept per profile; the cache is reset when it grows past this
+MAX_CACHED_TIMES = 4096
+
+# Settings accepted for each profile in the profiles file
+PROFILE_SETTINGS = ("currencies", "importance", "timezone", "colors", "sink")
+
+
+class Profile:
+    def __init__(self, name, currencies=None, importance=1, timezone=None, use_colors=True, sink="stdout",
+                 base_timezone=None):
+        """
+        A named view of the shared dataset with its own currency and importance filters, display
+        timezone, colors and output sink. Profiles never modify the rows they are given, so one
+        fetched and classified dataset (with published times) can serve any number of them.
+        :param name: Name of the profile, shown above its table.
+        :param currencies: List of currency codes, or None for every currency.
+        :param importance: Minimum importance.
+        :param timezone: Display timezone (e.g., "Asia/Tokyo"), or None to keep the published times.
+        :param use_colors: Add color codes to the table.
+        :param sink: "stdout", "stderr", a file path (each changed table is appended) or an open stream.
+        :param base_timezone: The timezone of the published times, defaults to Config.BASE_TIMEZONE.
+        """
+        self.name = name
+        self.currencies = None if currencies is None else frozenset(currencies)
+        self.importance = importance
+        self.timezone = timezone
+        self.use_colors = use_colors
+        self.sink = sink
+        base_timezone = base_timezone or Config.BASE_TIMEZONE
+        self.converter = get_converter(base_timezone, timezone) if timezone and timezone != base_timezone else None
+        # (published time, release date) -> displayed time
+        self.times = {}
+
+    @classmethod
+    def from_settings(cls, name, settings):
+        """
+        Build a profile from its entry in the profiles file; missing settings default to the Config values.
+        :param name: Name of the profile.
+        :param settings: Dictionary with any of currencies ("ALL", "USD,EUR" or a list), importance,
+                         timezone, colors and sink.
+        :return: A Profile.
+        """
+        unknown = set(settings) - set(PROFILE_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown settings for profile {name}: {', '.join(sorted(unknown))}")
+        currencies = settings.get("currencies", Config.PRINT_CURRENCIES)
+        if isinstance(currencies, str):
+            currencies = None if currencies.upper() == "ALL" else [c.strip() for c in currencies.split(",")]
+        return cls(
+            name,
+            currencies=currencies,
+            importance=int(settings.get("importance", Config.IMPORTANCE_FILTER)),
+            timezone=settings.get("timezone", Config.TARGET_TIMEZONE),
+            use_colors=settings.get("colors", Config.USE_COLORS),
+            sink=settings.get("sink", "stdout"),
+        )
+
+    def select(self, dataset):
+        """
+        Keep the rows shown by this profile.
+        :param dataset: List of Data objects.
+        :return: Filtered list of Data objects.
+        """
+        return select_rows(dataset, self.currencies, self.importance)
+
+    def local_time(self, d):
+        """
+        Get the time of a row in the profile's timezone, cached across polls.
+        :param d: The Data object, with its published time.
+        :return: The "HH:MM" time to display (or the published text, e.g. "All Day").
+        """
+        if self.converter is None:
+            return d.time
+        key = (d.time, d.datetime[:10] if d.datetime else None)
+        time = self.times.get(key)
+        if time is None:
+            if len(self.times) >= MAX_CACHED_TIMES:
+                self.times.clear()
+            # data-event-datetime looks like "2024/12/05 08:30:00"
+            date = datetime.strptime(key[1], "%Y/%m/%d").date() if key[1] else None
+            time = self.times[key] = self.converter.convert(d.time, date)
+        return time
+
+
+class ProfileSet:
+    def __init__(self, profiles):
+        """
+        Render one shared dataset for several profiles, each to its own sink.
+        Tables on a shared terminal are printed one after another instead of being repainted in place.
+        :param profiles: List of Profile objects.
+        """
+        self.profiles = profiles
+        self.files = []
+        self.renderers = []
+        on_stdout = sum(1 for profile in profiles if profile.sink in ("stdout", "-"))
+        for profile in profiles:
+            stream = self.open_sink(profile.sink)
+            in_place = False if profile.sink in ("stdout", "-") and on_stdout > 1 else None
+            self.renderers.append(TableRenderer(stream, in_place, profile=profile, title=f"[{profile.name}]"))
+
+    def open_sink(self, sink):
+        """
+        Open the output stream of a profile.
+        :param sink: "stdout" (or "-"), "stderr", a file path or an open stream.
+        :return: A writable text stream.
+        """
+        if not isinstance(sink, str):
+            return sink
+        if sink in ("stdout", "-"):
+            return sys.stdout
+        if sink == "stderr":
+            return sys.stderr
+        stream = open(sink, "a", encoding="utf-8")
+        self.files.append(stream)
+        return stream
+
+    def render(self, dataset):
+        """
+        Render the dataset for every profile. Each profile only filters and formats; rows it has
+        already formatted are reused (see TableRenderer).
+        :param dataset: List of Data objects, with published times. Not modified.
+        :return: Dictionary of profile name to number of table lines written.
+        """
+        written = {}
+        for renderer in self.renderers:
+            try:
+                written[renderer.profile.name] = renderer.render(dataset)
+            except Exception as e:
+                log_error(f"Error rendering profile {renderer.profile.name}: {e}")
+        return written
+
+    def close(self):
+        """
+        Release the terminal and close the file sinks.
+        """
+        for renderer in self.renderers:
+            renderer.close()
+        for stream in self.files:
+            stream.close()
+        self.files = []
+
+
+def load_profiles(path):
+    """
+    Load profiles from a JSON file mapping profile names to their settings, e.g.
+    {"usd": {"currencies": ["USD"], "importance": 2, "timezone": "America/New_York", "sink": "usd.log"}}.
+    :param path: Path to the profiles file.
+    :return: List of Profile objects, in file order.
+    """
+    with open(path) as f:
+        settings = json.load(f)
+    return [Profile.from_settings(name, profile_settings) for name, profile_settings in settings.items()]
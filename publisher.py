@@ -0,0 +1,297 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from collections import OrderedDict
+from threading import Event, Thread
+from data import ChangeType
+from utils import log_error, log_info
+
+# Key under which the overall signal is coalesced
+AGGREGATE_KEY = ("aggregate",)
+
+
+def parse_address(address):
+    """
+    Parse a publisher address: "unix:/path/to/socket", "host:port" or "port".
+    :param address: The address string.
+    :return: A tuple ("unix", path) or ("tcp", (host, port)).
+    """
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def value_message(v):
+    """
+    Convert a Value to a JSON-serializable dictionary.
+    :param v: The Value object, or None.
+    :return: Dictionary with value, unit and color, or None.
+    """
+    if not v:
+        return None
+    return {"value": v.value, "unit": v.unit, "color": v.color}
+
+
+def event_message(change, polled_at):
+    """
+    Build the message published for a changed row.
+    :param change: The RowChange.
+    :param polled_at: Poll timestamp (seconds since the epoch).
+    :return: Dictionary ready to be encoded as JSON.
+    """
+    d = change.data
+    return {
+        "type": "event",
+        "change": change.change_type.value,
+        "id": d.id,
+        "datetime": d.datetime,
+        "time": d.time,
+        "currency": d.currency,
+        "event": d.event,
+        "importance": d.importance,
+        "actual": value_message(d.actual),
+        "forecast": value_message(d.forecast),
+        "previous": value_message(d.previous),
+        "pn_indicator": d.pn_indicator,
+        "signal": d.signal,
+        "polled_at": polled_at,
+    }
+
+
+class Subscriber:
+    def __init__(self, writer, queue_size):
+        """
+        A connected subscriber with its own bounded queue of pending messages.
+        A newer message for an event replaces the pending one (coalesce) and moves to the back of
+        the queue; when the queue is full, the oldest pending message is dropped. The publisher never waits for a subscriber.
+        :param writer: The asyncio StreamWriter of the connection.
+        :param queue_size: Maximum number of pending messages.
+        """
+        self.writer = writer
+        self.queue_size = queue_size
+        self.pending = OrderedDict()
+        self.ready = asyncio.Event()
+        self.coalesced = 0
+        self.dropped = 0
+
+    def push(self, key, payload):
+        """
+        Queue an encoded message for this subscriber.
+        :param key: Coalescing key of the message.
+        :param payload: The encoded message.
+        """
+        if key in self.pending:
+            # The replacement goes last, so an overall signal never arrives before the event behind it
+            self.pending.move_to_end(key)
+            self.coalesced += 1
+        elif len(self.pending) >= self.queue_size:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+        self.pending[key] = payload
+        self.ready.set()
+
+    async def run(self):
+        """
+        Send pending messages as the connection drains. Messages queued while
+        waiting on a slow connection are coalesced and sent together.
+        """
+        try:
+            while True:
+                await self.ready.wait()
+                self.ready.clear()
+                payload = b"".join(self.pending.values())
+                self.pending.clear()
+                self.writer.write(payload)
+                await self.writer.drain()
+        except ConnectionError:
+            pass  # Disconnected; the handler cleans up
+
+
+class SignalPublisher:
+    def __init__(self, address, queue_size=1000):
+        """
+        Local publish/subscribe server pushing signals to subscribers as JSON lines.
+        The server runs its own event loop in a background thread; publishing from the
+        polling loop only hands the messages over and returns immediately.
+        :param address: Listening address: "unix:/path/to/socket", "host:port" or "port".
+        :param queue_size: Maximum number of pending messages per subscriber.
+        """
+        self.address = address
+        self.queue_size = queue_size
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.port = None
+        self.subscribers = set()
+        # Latest message per key, sent to new subscribers so they start from the current state
+        self.latest = OrderedDict()
+
+    def start(self):
+        """
+        Start the server thread and wait until it is listening.
+        """
+        self.loop = asyncio.new_event_loop()
+        started = Event()
+        errors = []
+        self.thread = Thread(target=self.run_loop, args=(self.loop, started, errors), name="SignalPublisher",
+                             daemon=True)
+        self.thread.start()
+        started.wait()
+        if errors:
+            self.loop = None
+            raise errors[0]
+        log_info(f"Publishing signals on {self.address if self.port is None else f'port {self.port}'}")
+
+    def run_loop(self, loop, started, errors):
+        """
+        Body of the server thread.
+        """
+        asyncio.set_event_loop(loop)
+        try:
+            self.server = loop.run_until_complete(self.open_server())
+        except Exception as e:
+            errors.append(e)
+            started.set()
+            loop.close()
+            return
+        started.set()
+        loop.run_forever()
+        loop.close()
+
+    async def open_server(self):
+        """
+        Open the listening socket.
+        :return: The asyncio Server.
+        """
+        kind, target = parse_address(self.address)
+        if kind == "unix":
+            if os.path.exists(target):
+                os.remove(target)  # Stale socket from a previous run
+            return await asyncio.start_unix_server(self.handle, path=target)
+        server = await asyncio.start_server(self.handle, *target)
+        self.port = server.sockets[0].getsockname()[1]
+        return server
+
+    async def handle(self, reader, writer):
+        """
+        Serve one subscriber until it disconnects.
+        """
+        subscriber = Subscriber(writer, self.queue_size)
+        for key, payload in self.latest.items():
+            subscriber.push(key, payload)
+        self.subscribers.add(subscriber)
+        sender = asyncio.create_task(subscriber.run())
+        try:
+            # Subscribers do not send anything; reading only detects the disconnect
+            while not sender.done() and await reader.read(4096):
+                pass
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.subscribers.discard(subscriber)
+            sender.cancel()
+            writer.close()
+
+    def broadcast(self, messages):
+        """
+        Encode messages once and queue them for every subscriber. Runs in the server thread.
+        :param messages: List of (key, message) tuples; removed events are dropped from the current state.
+        """
+        for key, message in messages:
+            payload = json.dumps(message, separators=(",", ":")).encode() + b"\n"
+            if message.get("change") == ChangeType.REMOVED.value:
+                self.latest.pop(key, None)
+            else:
+                self.latest[key] = payload
+                self.latest.move_to_end(key)
+            for subscriber in self.subscribers:
+                subscriber.push(key, payload)
+
+    def publish(self, messages):
+        """
+        Hand messages over to the server thread. Safe to call from any thread; never blocks.
+        :param messages: List of (key, message) tuples.
+        """
+        if self.loop is None or not messages:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.broadcast, messages)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def publish_changes(self, changes, overall_signal, polled_at=None):
+        """
+        Publish the changed rows of a poll followed by the overall signal.
+        :param changes: List of RowChange objects from RowDiffer.update.
+        :param overall_signal: The overall signal string.
+        :param polled_at: Poll timestamp (seconds since the epoch), defaults to now.
+        """
+        polled_at = time.time() if polled_at is None else polled_at
+        messages = [
+            (("event", change.data.id, change.data.datetime or change.data.time), event_message(change, polled_at))
+            for change in changes
+        ]
+        messages.append((AGGREGATE_KEY, {"type": "aggregate", "signal": overall_signal, "polled_at": polled_at}))
+        self.publish(messages)
+
+    def stats(self):
+        """
+        Get per-subscriber backpressure counters.
+        :return: List of dictionaries with pending, coalesced and dropped message counts.
+        """
+        return [
+            {"pending": len(s.pending), "coalesced": s.coalesced, "dropped": s.dropped}
+            for s in list(self.subscribers)
+        ]
+
+    async def shutdown(self):
+        """
+        Stop accepting subscribers and disconnect the current ones.
+        """
+        self.server.close()
+        for subscriber in list(self.subscribers):
+            subscriber.writer.close()
+        await self.server.wait_closed()
+
+    def close(self):
+        """
+        Stop the server and its thread.
+        """
+        if self.loop is None:
+            return
+        loop, self.loop = self.loop, None
+        try:
+            asyncio.run_coroutine_threadsafe(self.shutdown(), loop).result(timeout=5)
+        except Exception as e:
+            log_error(f"Error stopping signal publisher: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self.thread.join()
+        kind, target = parse_address(self.address)
+        if kind == "unix" and os.path.exists(target):
+            os.remove(target)
+
+
+def subscribe(address):
+    """
+    Connect to a publisher and yield the decoded messages.
+    :param address: Publisher address: "unix:/path/to/socket", "host:port" or "port".
+    :return: Generator of message dictionaries.
+    """
+    kind, target = parse_address(address)
+    if kind == "unix":
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(target)
+    else:
+        connection = socket.create_connection(target)
+    with connection, connection.makefile("rb") as stream:
+        for line in stream:
+            yield json.loads(line)
+
+if __name__ == "__main__":
+    # python3 publisher.py 127.0.0.1:8765   (prints every message published by main.py)
+    for message in subscribe(sys.argv[1] if len(sys.argv) > 1 else "127.0.0.1:8765"):
+        print(message)
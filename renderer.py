@@ -0,0 +1,292 @@
+import math
+import shutil
+import sys
+from functools import lru_cache
+from config import Config
+from utils import filter_rows, format_row, TABLE_HEADERS
+
+# Lines kept free below the table for the per-poll messages printed after it
+RESERVED_LINES = 10
+
+# ANSI escape sequences used for in-place repaints
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+RESET_SCROLL_REGION = "\x1b[r"
+
+
+def move_to(line):
+    """
+    Build the escape sequence that moves the cursor to the start of a screen line.
+    :param line: Zero-based line number from the top of the screen.
+    :return: ANSI escape sequence.
+    """
+    return f"\x1b[{line + 1};1H"
+
+
+def scroll_region(top, bottom):
+    """
+    Build the escape sequence that restricts scrolling to a range of screen lines.
+    Lines outside the region stay in place however much is printed; the cursor moves home.
+    :param top: Zero-based first line of the region.
+    :param bottom: Zero-based last line of the region.
+    :return: ANSI escape sequence.
+    """
+    return f"\x1b[{top + 1};{bottom + 1}r"
+
+
+def after_point(text):
+    """
+    Count the characters after the decimal point (or exponent) of a displayed number, as tabulate does.
+    :param text: Number as displayed.
+    :return: Number of characters after the point, -1 if there is none.
+    """
+    try:
+        int(text)
+        return -1
+    except ValueError:
+        pass
+    position = text.rfind(".")
+    position = text.lower().rfind("e") if position < 0 else position
+    return len(text) - position - 1 if position >= 0 else -1
+
+
+@lru_cache(maxsize=4096)
+def cell_number(text):
+    """
+    Read a non-empty cell the way tabulate does when deciding whether its column is numeric.
+    Results are cached by text.
+    :param text: Plain cell text.
+    :return: A tuple (is_int, text as displayed in a float column, characters after its point),
+             or None if the cell is not a number.
+    """
+    try:
+        int(text)
+        is_int = True
+    except ValueError:
+        is_int = False
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    if (math.isinf(number) or math.isnan(number)) and text.lower() not in ("inf", "-inf", "nan"):
+        return None
+    shown = format(number, "g")
+    return is_int, shown, after_point(shown)
+
+
+def column_kind(texts):
+    """
+    Decide how tabulate lays out a column: text is left-aligned, numbers are aligned on the decimal point.
+    Empty cells do not count, so a column of numbers with gaps is still numeric.
+    :param texts: Plain cell texts of the column.
+    :return: int or float for numeric columns, None for text columns.
+    """
+    numbers = [cell_number(text) for text in texts if text]
+    if not numbers or None in numbers:
+        return None
+    return int if all(number[0] for number in numbers) else float
+
+
+def shown_number(text, kind):
+    """
+    Get a numeric cell as displayed in its column.
+    :param text: Plain cell text.
+    :param kind: Column kind, int or float.
+    :return: A tuple (displayed text, characters after its point).
+    """
+    if kind is int or not text:
+        return text, -1
+    return cell_number(text)[1:]
+
+
+class TableRenderer:
+    def __init__(self, stream=None, in_place=None, profile=None, title=None):
+        """
+        Incremental renderer of the output table. Formatted rows are cached by content and the
+        previous frame is kept, so each poll only formats new or changed rows and, on a terminal,
+        only repaints the lines that differ. Does nothing when PRINT_TABLE is False.
+        :param stream: Output stream, defaults to sys.stdout.
+        :param in_place: Repaint changed lines in place; defaults to whether the stream is a terminal.
+        :param profile: Optional Profile whose filters, timezone and colors replace the Config settings;
+                        the table is then always rendered.
+        :param title: Optional line printed above the table.
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.in_place = self.stream.isatty() if in_place is None else in_place
+        self.profile = profile
+        self.title = title
+        # Row fingerprint -> (plain cells, styled cells)
+        self.cells = {}
+        # Row fingerprint -> table line, valid for the current column widths
+        self.lines = {}
+        self.widths = None
+        # Per column: None for text, else (int or float, characters after the point to align on)
+        self.alignments = None
+        self.border = None
+        self.header = None
+        # Lines of the previously painted frame, None before the first render
+        self.frame = None
+        # Terminal height when the frame was pinned above a scroll region, None when not pinned
+        self.pinned = None
+
+    def fingerprint(self, d):
+        """
+        Build a comparable tuple of everything displayed for a row.
+        :param d: The Data object.
+        :return: Tuple of the displayed fields, starting with the displayed time.
+        """
+        time = self.profile.local_time(d) if self.profile else d.time
+        return (
+            time, d.currency, d.importance, d.event, d.signal, d.pn_indicator,
+            *((v.value, v.unit, v.color) if v else None for v in (d.actual, d.forecast, d.previous)),
+        )
+
+    def set_layout(self, widths, alignments):
+        """
+        Switch to new column widths and alignments, invalidating the cached lines.
+        :param widths: List of column widths.
+        :param alignments: List with None for text columns and (kind, decimals) for numeric ones.
+        """
+        self.widths = widths
+        self.alignments = alignments
+        self.lines = {}
+        self.border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+        # Numeric columns have right-aligned headers
+        self.header = "| " + " | ".join(
+            header.ljust(width) if alignment is None else header.rjust(width)
+            for header, width, alignment in zip(TABLE_HEADERS, widths, alignments)
+        ) + " |"
+
+    def format_line(self, plain, styled):
+        """
+        Lay out one table line with the current column widths and alignments.
+        :param plain: Cells without color codes, used for padding.
+        :param styled: Cells as displayed.
+        :return: The table line.
+        """
+        cells = []
+        for text, cell, width, alignment in zip(plain, styled, self.widths, self.alignments):
+            if alignment is None:
+                cells.append(cell + " " * (width - len(text)))
+                continue
+            kind, decimals = alignment
+            shown, after = shown_number(text, kind)
+            if shown != text:
+                cell = cell.replace(text, shown)
+            # Pad after the number so the decimal points line up, then flush right
+            padding = " " * (decimals - after)
+            cells.append(" " * (width - len(shown) - len(padding)) + cell + padding)
+        return "| " + " | ".join(cells) + " |"
+
+    def build_frame(self, dataset):
+        """
+        Build the table lines for the dataset, reusing cached rows and lines.
+        :param dataset: List of Data objects to display.
+        :return: List of table lines.
+        """
+        cells = {}
+        fingerprints = []
+        for d in dataset:
+            fingerprint = self.fingerprint(d)
+            if fingerprint not in cells:
+                cells[fingerprint] = self.cells.get(fingerprint) or (
+                    format_row(d, self.profile.use_colors, fingerprint[0]) if self.profile else format_row(d))
+            fingerprints.append(fingerprint)
+        self.cells = cells
+
+        # Headers get two extra columns of padding, as in tabulate's grid format
+        widths = []
+        alignments = []
+        for header, texts in zip(TABLE_HEADERS, zip(*(plain for plain, _ in cells.values()))):
+            kind = column_kind(texts)
+            if kind is None:
+                widths.append(max(len(header) + 2, *map(len, texts)))
+                alignments.append(None)
+                continue
+            shown = [shown_number(text, kind) for text in texts]
+            decimals = max(after for _, after in shown)
+            widths.append(max(len(header) + 2, *(len(text) + decimals - after for text, after in shown)))
+            alignments.append((kind, decimals))
+        if widths != self.widths or alignments != self.alignments:
+            self.set_layout(widths, alignments)
+
+        lines = {}
+        frame = [self.border, self.header, self.border.replace("-", "=")]
+        if self.title is not None:
+            frame.insert(0, self.title)
+        for fingerprint in fingerprints:
+            line = lines.get(fingerprint)
+            if line is None:
+                line = lines[fingerprint] = self.lines.get(fingerprint) or self.format_line(*cells[fingerprint])
+            frame.append(line)
+            frame.append(self.border)
+        self.lines = lines
+        return frame
+
+    def render(self, dataset):
+        """
+        Render the dataset, writing only what changed since the previous frame.
+        On a terminal, the frame is pinned to the top of the screen and the lines below it become a
+        scroll region for the messages printed between polls, so however much is printed, the frame
+        stays where it was painted and changed lines can be rewritten in place.
+        :param dataset: List of Data objects.
+        :return: Number of table lines written.
+        """
+        if self.profile is None and not Config.PRINT_TABLE:
+            return 0
+
+        dataset = self.profile.select(dataset) if self.profile else filter_rows(dataset)
+        if not dataset:
+            if self.frame != []:
+                self.frame = []
+                self.stream.write(self.unpin())
+                print("No rows to display after applying currency filter.", file=self.stream)
+            return 0
+
+        frame = self.build_frame(dataset)
+        height = shutil.get_terminal_size().lines
+        if frame == self.frame and (not self.in_place or self.pinned in (None, height)):
+            written = []
+        elif self.in_place and self.frame and len(frame) == len(self.frame) and self.pinned == height:
+            written = [i for i, (line, previous) in enumerate(zip(frame, self.frame)) if line != previous]
+        else:
+            written = range(len(frame))
+
+        if not written:
+            output = []
+        elif not self.in_place:
+            output = ["\n".join(frame), "\n"]
+        elif len(written) < len(frame):
+            # Rewrite the changed lines, then return to the message area
+            output = [SAVE_CURSOR] + [move_to(i) + frame[i] + CLEAR_LINE for i in written] + [RESTORE_CURSOR]
+        else:
+            output = [self.unpin(), CLEAR_SCREEN, "\n".join(frame), "\n"]
+            if len(frame) + RESERVED_LINES <= height:
+                output.append(scroll_region(len(frame), height - 1) + move_to(len(frame)))
+                self.pinned = height
+        self.stream.write("".join(output))
+        self.stream.flush()
+
+        self.frame = frame
+        return len(written)
+
+    def unpin(self):
+        """
+        Release the scroll region below a pinned frame.
+        :return: ANSI escape sequence to write, empty if the frame is not pinned.
+        """
+        if self.pinned is None:
+            return ""
+        self.pinned = None
+        return RESET_SCROLL_REGION
+
+    def close(self):
+        """
+        Give the whole terminal back, with the cursor below the output.
+        """
+        if self.pinned is not None:
+            height = self.pinned
+            self.stream.write(self.unpin() + move_to(height - 1) + "\n")
+            self.stream.flush()
@@ -0,0 +1,233 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import pickle
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from tabulate import tabulate
+from fetcher import Fetcher
+from archive import ARCHIVE_SUFFIX, SnapshotArchive, is_archive
+from processor import SignalProcessor
+from config import Config
+from utils import log_error
+
+# Default location of the parsed-rows cache, None when CACHE_DIR is empty
+DEFAULT_CACHE_DIR = os.path.join(Config.CACHE_DIR, "replay") if Config.CACHE_DIR else None
+
+# Bump when extraction changes, so cached rows from older code are not reused
+CACHE_VERSION = 1
+
+# Archives opened by this worker process, kept open across segments
+_archives = {}
+
+# Snapshot files saved by Fetcher.save_html_to_file carry their timestamp in the name
+SNAPSHOT_TIMESTAMP = re.compile(r"(\d{8})_(\d{6})")
+
+
+def snapshot_time(file_path):
+    """
+    Get the capture time of a snapshot from its file name, or its modification time.
+    :param file_path: Path to the snapshot file.
+    :return: A datetime.
+    """
+    match = SNAPSHOT_TIMESTAMP.search(os.path.basename(file_path))
+    if match:
+        return datetime.strptime("".join(match.groups()), "%Y%m%d%H%M%S")
+    return datetime.fromtimestamp(os.path.getmtime(file_path))
+
+
+def load_rows(file_path, cache_dir=None, html=None):
+    """
+    Parse a snapshot into Data rows, using a cache keyed by the file's content hash.
+    :param file_path: Path to the snapshot file.
+    :param cache_dir: Directory of the parsed-rows cache, or None to disable caching.
+    :param html: Content of the snapshot if it is not read from file_path (e.g., from an archive).
+    :return: A tuple (dataset, cache_hit). The dataset is None if the file cannot be parsed.
+    """
+    if html is None:
+        with open(file_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha1").hexdigest()
+    else:
+        digest = hashlib.sha1(html).hexdigest()
+
+    cache_path = os.path.join(cache_dir, f"{digest}.v{CACHE_VERSION}.pickle") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f), True
+        except Exception as e:
+            log_error(f"Ignoring unreadable cache entry {cache_path}: {e}")
+
+    fetcher = Fetcher(None, parser_mode="table")
+    if html is None:
+        dataset = fetcher.read_data(file_path)
+    else:
+        rows = fetcher.find_rows(html)
+        dataset = [] if rows is None else fetcher.extract_data(rows)
+    if cache_path and dataset is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(dataset, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    return dataset, False
+
+
+def summarize(file_name, captured_at, dataset, cache_hit, threshold, strong_threshold):
+    """
+    Aggregate the signals of one snapshot.
+    :param file_name: Name of the snapshot, shown in the timeline.
+    :param captured_at: Capture time as a datetime.
+    :param dataset: List of Data objects, or None if the snapshot could not be parsed.
+    :param cache_hit: Whether the rows came from the parsed-rows cache.
+    :param threshold: Buy/Sell threshold passed to SignalProcessor.
+    :param strong_threshold: Strong Buy/Strong Sell threshold passed to SignalProcessor.
+    :return: Dictionary summarizing the snapshot.
+    """
+    result = {
+        "file": file_name,
+        "time": captured_at.isoformat(sep=" "),
+        "rows": 0,
+        "cached": cache_hit,
+        "overall_signal": None,
+        "signal_counts": {},
+    }
+    if not dataset:
+        return result
+
+    processor = SignalProcessor(threshold=threshold, strong_threshold=strong_threshold)
+    signals = processor.classify_batch(processor.add_pn_indicator(dataset))
+    result["rows"] = len(dataset)
+    result["overall_signal"] = processor.most_common_signal(signals)
+    result["signal_counts"] = dict(Counter(signals))
+    return result
+
+
+def replay_file(file_path, cache_dir=None, threshold=0.1, strong_threshold=0.2):
+    """
+    Load one snapshot and aggregate its signals. Runs in a worker process.
+    :param file_path: Path to the snapshot file.
+    :param cache_dir: Directory of the parsed-rows cache, or None to disable caching.
+    :param threshold: Buy/Sell threshold passed to SignalProcessor.
+    :param strong_threshold: Strong Buy/Strong Sell threshold passed to SignalProcessor.
+    :return: List with the summary of the snapshot.
+    """
+    dataset, cache_hit = load_rows(file_path, cache_dir)
+    return [summarize(file_path, snapshot_time(file_path), dataset, cache_hit, threshold, strong_threshold)]
+
+
+def replay_segment(archive_path, start, stop, cache_dir=None, threshold=0.1, strong_threshold=0.2):
+    """
+    Stream a segment of an archive and aggregate the signals of each snapshot. Runs in a worker process.
+    :param archive_path: Path to the snapshot archive.
+    :param start: Position of the first snapshot of the segment.
+    :param stop: Position after the last snapshot of the segment.
+    :param cache_dir: Directory of the parsed-rows cache, or None to disable caching.
+    :param threshold: Buy/Sell threshold passed to SignalProcessor.
+    :param strong_threshold: Strong Buy/Strong Sell threshold passed to SignalProcessor.
+    :return: List of snapshot summaries.
+    """
+    if archive_path not in _archives:
+        _archives[archive_path] = SnapshotArchive(archive_path)
+    results = []
+    for index, (timestamp, html) in enumerate(_archives[archive_path].iter_snapshots(start, stop), start):
+        dataset, cache_hit = load_rows(archive_path, cache_dir, html=html)
+        results.append(summarize(f"{archive_path}#{index}", datetime.fromtimestamp(timestamp), dataset, cache_hit,
+                                 threshold, strong_threshold))
+    return results
+
+
+def replay(paths, workers=None, cache_dir=DEFAULT_CACHE_DIR, threshold=0.1, strong_threshold=0.2):
+    """
+    Replay snapshots across a process pool and build a signal timeline.
+    Archives are split at their full records and each segment is streamed by one worker.
+    :param paths: List of snapshot file and archive paths.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param cache_dir: Directory of the parsed-rows cache, or None to disable caching.
+    :param threshold: Buy/Sell threshold passed to SignalProcessor.
+    :param strong_threshold: Strong Buy/Strong Sell threshold passed to SignalProcessor.
+    :return: List of snapshot summaries sorted by capture time.
+    """
+    jobs = []
+    for path in paths:
+        if not is_archive(path):
+            jobs.append((path, replay_file, (path,)))
+            continue
+        try:
+            archive = SnapshotArchive(path)
+        except Exception as e:
+            log_error(f"Failed to open archive {path}: {e}")
+            continue
+        jobs.extend((path, replay_segment, (path, start, stop)) for start, stop in archive.segments())
+        archive.close()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(function, *args, cache_dir, threshold, strong_threshold)
+            for _, function, args in jobs
+        ]
+        results = []
+        for (path, _, _), future in zip(jobs, futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                log_error(f"Failed to replay {path}: {e}")
+    return sorted(results, key=lambda result: (result["time"], result["file"]))
+
+
+def find_snapshots(inputs, pattern="*.html"):
+    """
+    Expand directories and files into a sorted list of snapshot paths.
+    :param inputs: List of directories or files.
+    :param pattern: Glob pattern for snapshot files inside directories; archives are always included.
+    :return: List of file paths.
+    """
+    paths = []
+    for path in inputs:
+        if os.path.isdir(path):
+            paths.extend(glob.glob(os.path.join(path, "**", pattern), recursive=True))
+            paths.extend(glob.glob(os.path.join(path, "**", "*" + ARCHIVE_SUFFIX), recursive=True))
+        else:
+            paths.append(path)
+    return sorted(set(paths))
+
+
+def main():
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Replay economic calendar snapshots and build a signal timeline.")
+    parser.add_argument("inputs", nargs="+", help="Snapshot files, archives or directories (e.g., sample/)")
+    parser.add_argument("--pattern", default="*.html", help="Glob pattern for files inside directories")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Parsed-rows cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse snapshots")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Buy/Sell threshold")
+    parser.add_argument("--strong-threshold", type=float, default=0.2, help="Strong Buy/Strong Sell threshold")
+    parser.add_argument("--output", help="Write the timeline as JSON to this file")
+    args = parser.parse_args()
+
+    paths = find_snapshots(args.inputs, args.pattern)
+    if not paths:
+        print("No snapshot files found.")
+        return
+
+    timeline = replay(paths, workers=args.workers, cache_dir=None if args.no_cache else args.cache_dir,
+                      threshold=args.threshold, strong_threshold=args.strong_threshold)
+
+    print(tabulate(
+        [[r["time"], os.path.basename(r["file"]), r["rows"], "yes" if r["cached"] else "no", r["overall_signal"]]
+         for r in timeline],
+        headers=["Time", "Snapshot", "Rows", "Cached", "Overall Signal"], tablefmt="grid",
+    ))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(timeline, f, indent=4)
+        print(f"Timeline written to {args.output}")
+
+if __name__ == "__main__":
+    # python3 replay.py sample/ --threshold 0.15
+    main()
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from config import Config
+from metrics import metrics
+from utils import log_error
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, processes may fetch the same URL concurrently
+    fcntl = None
+
+# Default cache shared by every Fetcher of this process, created on first use
+_default_cache = None
+
+
+def url_key(url):
+    """
+    Get the file-system key of a URL.
+    :param url: The requested URL.
+    :return: Hex digest of the URL.
+    """
+    return hashlib.sha1(url.encode()).hexdigest()
+
+
+@contextmanager
+def file_lock(path, blocking=True):
+    """
+    Hold an exclusive advisory lock on a lock file, shared between processes.
+    :param path: Path to the lock file (created if missing).
+    :param blocking: Wait for the lock; otherwise yield False if another process holds it.
+    :return: Context manager yielding True if the lock is held.
+    """
+    with open(path, "a") as f:
+        if fcntl is None:
+            yield True
+            return
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def write_atomic(path, content):
+    """
+    Write a file through a temporary file so readers never see it half-written.
+    :param path: Destination path.
+    :param content: Bytes to write.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+class ResponseCache:
+    def __init__(self, directory, ttl=2.0, max_bytes=64 * 1024 * 1024):
+        """
+        On-disk response cache shared by every process on the host.
+        Bodies are stored once per content hash under objects/; each URL has a small entry under
+        entries/ pointing to its latest body, with the fetch time and revalidation headers.
+        Concurrent misses for a URL are serialized with a per-URL lock file, so within the
+        freshness window only one process fetches upstream and the others reuse its response.
+        :param directory: Cache directory (created if missing).
+        :param ttl: Freshness window in seconds.
+        :param max_bytes: Size limit of the stored bodies; least recently used bodies are evicted.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(directory, "objects")
+        self.entries_dir = os.path.join(directory, "entries")
+        self.locks_dir = os.path.join(directory, "locks")
+        for path in (self.objects_dir, self.entries_dir, self.locks_dir):
+            os.makedirs(path, exist_ok=True)
+
+    def get(self, url):
+        """
+        Get the cached response of a URL if it is still fresh.
+        :param url: The requested URL.
+        :return: A tuple (body, meta) with meta["digest"] the hex content hash, or None on a miss.
+        """
+        try:
+            with open(os.path.join(self.entries_dir, url_key(url) + ".json")) as f:
+                meta = json.load(f)
+            if time.time() - meta["stored_at"] >= self.ttl:
+                return None
+            object_path = os.path.join(self.objects_dir, meta["digest"])
+            with open(object_path, "rb") as f:
+                body = f.read()
+            os.utime(object_path)  # Mark as recently used for eviction
+            return body, meta
+        except (FileNotFoundError, ValueError, KeyError):
+            return None  # Missing, evicted, or written by an incompatible version
+
+    def put(self, url, body, meta=None):
+        """
+        Store a response and evict least recently used bodies above the size limit.
+        :param url: The requested URL.
+        :param body: The response body as bytes.
+        :param meta: Optional JSON-serializable dictionary stored with the entry (e.g., ETag).
+        :return: The stored meta, including digest and stored_at.
+        """
+        digest = hashlib.sha1(body).hexdigest()
+        object_path = os.path.join(self.objects_dir, digest)
+        if os.path.exists(object_path):
+            os.utime(object_path)
+        else:
+            write_atomic(object_path, body)
+        meta = {**(meta or {}), "url": url, "digest": digest, "stored_at": time.time()}
+        write_atomic(os.path.join(self.entries_dir, url_key(url) + ".json"), json.dumps(meta).encode())
+        self.evict()
+        return meta
+
+    def fetch(self, url, fetch_function):
+        """
+        Get a fresh response from the cache, or fetch and store it. Only one process fetches a
+        given URL at a time; processes waiting on the lock reuse its response.
+        :param url: The requested URL.
+        :param fetch_function: Called on a miss; returns (body, meta) or None if fetching fails.
+        :return: A tuple (body, meta), or None if fetching fails.
+        """
+        cached = self.get(url)
+        if cached is None:
+            with file_lock(os.path.join(self.locks_dir, url_key(url) + ".lock")):
+                cached = self.get(url)  # Filled by another process while we waited
+                if cached is None:
+                    metrics.increment("response_cache_misses")
+                    result = fetch_function()
+                    if result is None:
+                        return None
+                    body, meta = result
+                    try:
+                        return body, self.put(url, body, meta)
+                    except OSError as e:
+                        log_error(f"Failed to store response for {url}: {e}")
+                        return body, {**(meta or {}), "digest": hashlib.sha1(body).hexdigest()}
+        metrics.increment("response_cache_hits")
+        return cached
+
+    def evict(self):
+        """
+        Remove least recently used bodies until the cache fits max_bytes.
+        Skipped if another process is already evicting.
+        """
+        with file_lock(os.path.join(self.directory, "evict.lock"), blocking=False) as locked:
+            if not locked:
+                return
+            objects = []
+            for entry in os.scandir(self.objects_dir):
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                objects.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in objects)
+            for _, size, path in sorted(objects):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)  # Entries pointing to it become misses
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+
+def default_cache():
+    """
+    Get the response cache configured by RESPONSE_CACHE_DIR.
+    :return: The shared ResponseCache, or None if caching is disabled.
+    """
+    global _default_cache
+    if _default_cache is None and Config.RESPONSE_CACHE_DIR:
+        try:
+            _default_cache = ResponseCache(Config.RESPONSE_CACHE_DIR, ttl=Config.RESPONSE_CACHE_TTL,
+                                           max_bytes=Config.RESPONSE_CACHE_SIZE_MB * 1024 * 1024)
+        except OSError as e:
+            log_error(f"Response cache disabled, cannot use {Config.RESPONSE_CACHE_DIR}: {e}")
+            Config.RESPONSE_CACHE_DIR = ""
+    return _default_cache
@@ -1,21 +1,184 @@
+import bisect
+import math
 import time
 from datetime import datetime, timedelta
-from threading import Thread
+from threading import Event
 from config import Config
+from utils import get_timezone, log_error
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# Length of the fast-polling window that starts at each critical time
+CRITICAL_WINDOW = timedelta(minutes=1)
+
+# How far ahead the critical-window timeline is precomputed
+TIMELINE_HORIZON = timedelta(days=7)
+
+
+def is_pending_release(d):
+    """
+    Check whether a row is a scheduled release whose actual value has not been published yet.
+    Rows without forecast or previous values (speeches, holidays) never get an actual and are skipped.
+    :param d: The Data object.
+    :return: True if the actual value is still expected.
+    """
+    if d.actual and d.actual.value is not None:
+        return False
+    if not d.time or len(d.time) != 5 or d.time[2] != ":":
+        return False  # "All Day", "Tentative"
+    return any(v and v.value is not None for v in (d.forecast, d.previous))
 
 
 class Scheduler:
-    def __init__(self, task_function):
+    def __init__(self, task_function, critical_times=None, warmup_function=None, adaptive=None):
         """
         Initialize the Scheduler with a task function and interval configurations.
-        :param task_function: The function to execute at intervals.
+        :param task_function: The function to execute at intervals. If it returns the latest dataset,
+                              its pending releases become fast-polling windows (see update_releases).
+        :param critical_times: List of {"day", "time"} dictionaries, defaults to Config.CRITICAL_TIMES.
+        :param warmup_function: Optional function run once ahead of each critical window.
+        :param adaptive: Derive fast-polling windows from the dataset, defaults to Config.ADAPTIVE_POLLING.
         """
         self.task_function = task_function
+        self.warmup_function = warmup_function
+        self.warmup_lead = timedelta(
+            seconds=self.get_interval_in_seconds(Config.WARMUP_LEAD_VALUE, Config.WARMUP_LEAD_UNIT)
+        )
+        self.warmed_window = None
         self.default_interval = Config.DEFAULT_INTERVAL_VALUE
         self.default_unit = Config.DEFAULT_INTERVAL_UNIT
         self.critical_interval = Config.CRITICAL_INTERVAL_VALUE
         self.critical_unit = Config.CRITICAL_INTERVAL_UNIT
+        self.critical_times = self.parse_critical_times(
+            Config.CRITICAL_TIMES if critical_times is None else critical_times
+        )
         self.running = False
+        self.stop_event = Event()
+
+        # Fast polling around the pending releases of the latest dataset
+        self.adaptive = Config.ADAPTIVE_POLLING if adaptive is None else adaptive
+        self.release_lead = timedelta(
+            seconds=self.get_interval_in_seconds(Config.RELEASE_LEAD_VALUE, Config.RELEASE_LEAD_UNIT)
+        )
+        self.release_timeout = timedelta(
+            seconds=self.get_interval_in_seconds(Config.RELEASE_TIMEOUT_VALUE, Config.RELEASE_TIMEOUT_UNIT)
+        )
+        # Sorted (start, end) datetimes of the release windows
+        self.release_windows = []
+        self.release_ends = []
+        # Published release datetime string -> local datetime
+        self.release_times = {}
+
+        # Sorted (start, end) datetimes of upcoming critical windows
+        self.timeline = []
+        self.timeline_ends = []
+        self.timeline_until = None
+
+    def parse_critical_times(self, critical_times):
+        """
+        Parse critical times once into (weekday, time) pairs.
+        :param critical_times: List of {"day", "time"} dictionaries (day name, H:M:S).
+        :return: List of (weekday index or None for every day, datetime.time) tuples.
+        """
+        parsed = []
+        for critical in critical_times:
+            day = critical["day"].strip().lower()
+            weekday = WEEKDAYS.index(day) if day in WEEKDAYS else None
+            parsed.append((weekday, datetime.strptime(critical["time"].strip(), "%H:%M:%S").time()))
+        return parsed
+
+    def build_timeline(self, now):
+        """
+        Precompute the critical windows between now and the timeline horizon, sorted by start.
+        :param now: The current datetime.
+        """
+        windows = []
+        for offset in range(-1, TIMELINE_HORIZON.days + 1):
+            date = (now + timedelta(days=offset)).date()
+            for weekday, critical_time in self.critical_times:
+                if weekday is not None and weekday != date.weekday():
+                    continue
+                start = datetime.combine(date, critical_time)
+                if start + CRITICAL_WINDOW > now:
+                    windows.append((start, start + CRITICAL_WINDOW))
+        self.timeline = sorted(windows)
+        self.timeline_ends = [end for _, end in self.timeline]
+        self.timeline_until = now + TIMELINE_HORIZON
+
+    def next_window(self, now=None):
+        """
+        Get the critical or release window that is active now or starts next.
+        :param now: The current datetime (defaults to datetime.now()).
+        :return: A (start, end) tuple, or None if there are no upcoming windows.
+        """
+        now = now or datetime.now()
+        windows = [window for window in (self.next_critical_window(now), self.next_release_window(now)) if window]
+        return min(windows) if windows else None
+
+    def next_critical_window(self, now):
+        """
+        Get the critical window that is active now or starts next.
+        :param now: The current datetime.
+        :return: A (start, end) tuple, or None if there are no critical times.
+        """
+        if not self.critical_times:
+            return None
+        if self.timeline_until is None or now >= self.timeline_until:
+            self.build_timeline(now)
+        index = bisect.bisect_right(self.timeline_ends, now)
+        if index >= len(self.timeline):
+            self.build_timeline(now)
+            index = bisect.bisect_right(self.timeline_ends, now)
+        return self.timeline[index] if index < len(self.timeline) else None
+
+    def next_release_window(self, now):
+        """
+        Get the release window that is active now or starts next.
+        :param now: The current datetime.
+        :return: A (start, end) tuple, or None if no release is pending.
+        """
+        index = bisect.bisect_right(self.release_ends, now)
+        return self.release_windows[index] if index < len(self.release_windows) else None
+
+    def release_time(self, event_datetime):
+        """
+        Convert a published release date and time to local time, cached by string.
+        :param event_datetime: Release date and time in the base timezone (e.g., "2024/12/06 08:30:00").
+        :return: A naive local datetime, or None if it cannot be parsed.
+        """
+        if event_datetime not in self.release_times:
+            try:
+                published = datetime.strptime(event_datetime, "%Y/%m/%d %H:%M:%S")
+                localized = get_timezone(Config.BASE_TIMEZONE).localize(published, is_dst=False)
+                self.release_times[event_datetime] = localized.astimezone().replace(tzinfo=None)
+            except Exception as e:
+                log_error(f"Invalid release time {event_datetime}: {e}")
+                self.release_times[event_datetime] = None
+        return self.release_times[event_datetime]
+
+    def update_releases(self, dataset, now=None):
+        """
+        Derive fast-polling windows from the latest dataset: each release at or above IMPORTANCE_FILTER
+        whose actual value is still empty opens a window from release_lead before its time until the
+        actual appears (it is no longer pending in a later dataset) or release_timeout has passed.
+        :param dataset: List of Data objects from the latest poll.
+        :param now: The current datetime (defaults to datetime.now()).
+        """
+        now = now or datetime.now()
+        releases = set()
+        published = set()
+        for d in dataset:
+            if d.importance < Config.IMPORTANCE_FILTER or not d.datetime or not is_pending_release(d):
+                continue
+            published.add(d.datetime)
+            release = self.release_time(d.datetime)
+            if release is not None and release + self.release_timeout > now:
+                releases.add(release)
+        # Forget conversions of releases that are no longer pending
+        self.release_times = {key: self.release_times[key] for key in published}
+        self.release_windows = [(release - self.release_lead, release + self.release_timeout)
+                                for release in sorted(releases)]
+        self.release_ends = [end for _, end in self.release_windows]
 
     def get_interval_in_seconds(self, interval_value, interval_unit):
         """
@@ -30,43 +193,111 @@ class Scheduler:
             return interval_value * 60
         return 10  # Default fallback to 10 seconds if invalid
 
-    def is_critical_time(self):
+    def is_critical_time(self, now=None):
         """
-        Check if the current time is within 1 minute of any critical time (H:M:S format).
+        Check if the current time is within the window of any critical time on its weekday.
+        :param now: The current datetime (defaults to datetime.now()).
         :return: True if in critical time, False otherwise.
         """
-        now = datetime.now()
-        for critical in Config.CRITICAL_TIMES:
-            critical_time = datetime.strptime(critical["time"], "%H:%M:%S").replace(
-                year=now.year, month=now.month, day=now.day
-            )
-            # Allow a 1-minute window
-            if critical_time <= now < critical_time + timedelta(minutes=1):
-                return True
-        return False
+        now = now or datetime.now()
+        window = self.next_window(now)
+        return window is not None and window[0] <= now < window[1]
 
-    def get_current_interval(self):
+    def get_current_interval(self, now=None):
         """
         Get the current interval in seconds based on whether it's critical time.
+        :param now: The current datetime (defaults to datetime.now()).
         :return: Interval in seconds.
         """
-        if self.is_critical_time():
+        if self.is_critical_time(now):
             return self.get_interval_in_seconds(self.critical_interval, self.critical_unit)
         return self.get_interval_in_seconds(self.default_interval, self.default_unit)
 
+    def next_deadline(self, deadline, interval, tick_wall, tick_monotonic):
+        """
+        Compute the monotonic deadline of the next run.
+        Runs stay on a fixed grid, so task runtime does not add drift; missed ticks are
+        skipped, and a critical window starting before the next tick pulls the run forward.
+        :param deadline: Monotonic deadline of the run that just started.
+        :param interval: Current interval in seconds.
+        :param tick_wall: Wall-clock datetime at the start of the run.
+        :param tick_monotonic: Monotonic time at the start of the run.
+        :return: Monotonic time of the next run.
+        """
+        deadline += interval
+
+        window = self.next_window(tick_wall)
+        if window is not None and window[0] > tick_wall:
+            window_start = tick_monotonic + (window[0] - tick_wall).total_seconds()
+            deadline = min(deadline, window_start)
+
+        now = time.monotonic()
+        if deadline < now:
+            deadline += math.ceil((now - deadline) / interval) * interval
+        return deadline
+
+    def next_warmup(self, now=None):
+        """
+        Get the time of the pending warm-up for the next critical window.
+        :param now: The current datetime (defaults to datetime.now()).
+        :return: A (warmup_time, window) tuple, or None if no warm-up is pending.
+        """
+        if self.warmup_function is None:
+            return None
+        window = self.next_window(now)
+        if window is None or window == self.warmed_window or (now or datetime.now()) >= window[0]:
+            return None
+        return window[0] - self.warmup_lead, window
+
+    def run_warmup(self, now):
+        """
+        Run the warm-up function if the warm-up time of the next critical window has come.
+        :param now: The current datetime.
+        """
+        pending = self.next_warmup(now)
+        if pending and now >= pending[0]:
+            self.warmed_window = pending[1]
+            print("Warming up for critical time...")
+            self.handle_result(self.warmup_function())
+
+    def handle_result(self, result):
+        """
+        Update the release windows from a dataset returned by the task or warm-up function.
+        :param result: The return value of the function.
+        """
+        # A failed fetch returns no rows; keep the windows from the last good dataset
+        if self.adaptive and isinstance(result, list) and result:
+            self.update_releases(result)
+
     def start(self):
         """
         Start the scheduler.
         """
         self.running = True
+        self.stop_event.clear()
+        deadline = time.monotonic()
         while self.running:
-            current_interval = self.get_current_interval()
-            print(f"Running task... (Interval: {current_interval}s)")
-            self.task_function()
-            time.sleep(current_interval)
+            self.run_warmup(datetime.now())
+
+            tick_monotonic = time.monotonic()
+            tick_wall = datetime.now()
+            if tick_monotonic >= deadline:
+                current_interval = self.get_current_interval(tick_wall)
+                print(f"Running task... (Interval: {current_interval}s)")
+                self.handle_result(self.task_function())
+                deadline = self.next_deadline(deadline, current_interval, tick_wall, tick_monotonic)
+
+            # Wake up for whichever comes first: the next run or a pending warm-up
+            wake = deadline
+            now_wall, now_monotonic = datetime.now(), time.monotonic()
+            pending = self.next_warmup(now_wall)
+            if pending:
+                wake = min(wake, now_monotonic + (pending[0] - now_wall).total_seconds())
+            self.stop_event.wait(max(0, wake - time.monotonic()))
 
     def stop(self):
         """
         Stop the scheduler.
         """
         self.running = False
+        self.stop_event.set()
@@ -0,0 +1,249 @@
+import hashlib
+import math
+from abc import ABC, abstractmethod
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from fetcher import Fetcher, CALENDAR_TABLE_START
+from metrics import metrics
+from utils import log_error
+
+# Hedge delay used until the primary source has enough latency samples
+DEFAULT_HEDGE_DELAY = 0.5
+
+# Minimum samples before the hedge delay is derived from a source's own latencies
+MIN_SAMPLES = 5
+
+# Latency (seconds) charged to a source for a failed or invalid response
+FAILURE_PENALTY = 10.0
+
+
+def is_calendar(html):
+    """
+    Check that a response contains the economic calendar table.
+    :param html: The raw HTML content as bytes, or None.
+    :return: True if the calendar table is present.
+    """
+    return bool(html) and CALENDAR_TABLE_START.search(html) is not None
+
+
+class Source(ABC):
+    def __init__(self, name, alpha=0.2, window=50):
+        """
+        Base class of calendar sources. Subclasses implement fetch().
+        Tracks a moving average and a window of recent latencies, used to rank sources.
+        :param name: Name of the source, used in logs and stats.
+        :param alpha: Weight of the latest sample in the moving average.
+        :param window: Number of recent latencies kept for the hedge delay.
+        """
+        self.name = name
+        self.alpha = alpha
+        self.latency = None
+        self.recent = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+
+    @abstractmethod
+    def fetch(self, cancel=None):
+        """
+        Fetch the raw calendar HTML.
+        :param cancel: threading.Event set when another source has already answered.
+        :return: The raw HTML content as bytes, or None if fetching fails or is cancelled.
+        """
+
+    def close(self):
+        """
+        Release the resources held by the source, if any.
+        """
+
+    def record(self, seconds, success=True):
+        """
+        Record the outcome of a request.
+        :param seconds: Request duration in seconds.
+        :param success: Whether a valid calendar was received.
+        """
+        if success:
+            self.successes += 1
+            self.recent.append(seconds)
+        else:
+            self.failures += 1
+            seconds = max(seconds, FAILURE_PENALTY)
+        self.update_latency(seconds)
+
+    def abandon(self, seconds):
+        """
+        Record a request abandoned after another source answered first; it was at least this slow.
+        :param seconds: Time waited before abandoning the request.
+        """
+        self.update_latency(max(seconds, self.latency or 0.0))
+
+    def update_latency(self, seconds):
+        """
+        Update the moving-average latency.
+        :param seconds: The latest latency sample.
+        """
+        self.latency = seconds if self.latency is None else self.alpha * seconds + (1 - self.alpha) * self.latency
+
+    def hedge_delay(self, fraction=0.95):
+        """
+        Get how long to wait for this source before hedging: a high percentile of its recent latencies.
+        :param fraction: Percentile as a fraction.
+        :return: Delay in seconds.
+        """
+        if len(self.recent) < MIN_SAMPLES:
+            return DEFAULT_HEDGE_DELAY
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+class HttpSource(Source):
+    def __init__(self, url, name=None, **kwargs):
+        """
+        Calendar source over HTTP(S), with its own keep-alive session and revalidation state.
+        :param url: The calendar URL of this endpoint or mirror.
+        :param name: Name of the source, defaults to the URL.
+        """
+        super().__init__(name or url, **kwargs)
+        self.fetcher = Fetcher(url)
+
+    def fetch(self, cancel=None):
+        return self.fetcher.fetch_raw_html(cancel=cancel)
+
+    def close(self):
+        self.fetcher.close()
+
+
+class HedgedFetcher(Fetcher):
+    def __init__(self, sources, target_timezone=None, parser_mode="full", hedge_delay=None):
+        """
+        Fetcher that requests the calendar from several sources and keeps the first valid response.
+        The fastest source so far (the primary) is asked first; if it has not answered within the
+        hedge delay, or fails, the next source is asked as well. The first response containing the
+        calendar table wins and the other downloads are cancelled.
+        :param sources: List of Source objects or URLs, in order of preference.
+        :param target_timezone: The target timezone for output times (e.g., "UTC"), or None to keep published times.
+        :param parser_mode: "full" to parse the whole page, "table" to parse only the calendar table.
+        :param hedge_delay: Seconds before hedging to the next source (0 asks all sources at once),
+                            or None to use a high percentile of the primary's recent latencies.
+        """
+        self.sources = [HttpSource(source) if isinstance(source, str) else source for source in sources]
+        if not self.sources:
+            raise ValueError("At least one source is required")
+        # Sources hold their own sessions; the base Fetcher only parses the winning page
+        super().__init__(None, target_timezone=target_timezone, parser_mode=parser_mode)
+        self.hedge_delay = hedge_delay
+        # Room for a second request per source while an abandoned one is still winding down
+        self.executor = ThreadPoolExecutor(max_workers=2 * len(self.sources), thread_name_prefix="HedgedFetch")
+        self.last_source = None
+
+    def ranked_sources(self):
+        """
+        Order sources by moving-average latency. Sources without samples come first, in their given
+        order, so every source gets measured.
+        :return: List of Source objects, primary first.
+        """
+        return sorted(self.sources, key=lambda source: -1.0 if source.latency is None else source.latency)
+
+    def fetch_source(self, source, cancel):
+        """
+        Fetch from one source and record its latency. Runs in the thread pool.
+        :return: The raw HTML content as bytes, or None.
+        """
+        start = time.monotonic()
+        try:
+            html = source.fetch(cancel)
+        except Exception as e:
+            log_error(f"Error fetching from {source.name}: {e}")
+            html = None
+        elapsed = time.monotonic() - start
+        if cancel.is_set():
+            return None  # Lost the race, even if it finished: recorded by the caller as abandoned
+        source.record(elapsed, is_calendar(html))
+        return html
+
+    def fetch_raw_html(self, save_sample=False, cancel=None):
+        """
+        Fetch the calendar from the fastest responding source.
+        :param save_sample: If True, save fetched HTML content to a file.
+        :param cancel: Unused; hedged requests manage their own cancellation.
+        :return: The raw HTML content as bytes, or None if no source returned the calendar.
+        """
+        ranked = self.ranked_sources()
+        cancel = Event()
+        completed = queue.Queue()
+        delay = self.hedge_delay if self.hedge_delay is not None else ranked[0].hedge_delay()
+
+        # Source -> start time of its request, while in flight
+        running = {}
+
+        def launch(source):
+            running[source] = time.monotonic()
+            future = self.executor.submit(self.fetch_source, source, cancel)
+            future.add_done_callback(lambda f: completed.put((source, f)))
+            return time.monotonic() + delay
+
+        html = None
+        winner = None
+        launched = 1
+        with metrics.stage("fetch"):
+            deadline = launch(ranked[0])
+            while running:
+                timeout = max(0.0, deadline - time.monotonic()) if launched < len(ranked) else None
+                try:
+                    source, future = completed.get(timeout=timeout)
+                except queue.Empty:
+                    # The primary is slow: hedge to the next source
+                    deadline = launch(ranked[launched])
+                    launched += 1
+                    continue
+                del running[source]
+                result = future.result()
+                if is_calendar(result):
+                    html, winner = result, source
+                    break
+                if launched < len(ranked):
+                    # Failed or invalid: hedge immediately
+                    deadline = launch(ranked[launched])
+                    launched += 1
+            cancel.set()
+
+        # Requests still in flight lost the race; rank their sources accordingly
+        now = time.monotonic()
+        for source, started in running.items():
+            source.abandon(now - started)
+
+        if html is None:
+            log_error("No source returned the economic calendar.")
+            return None
+
+        metrics.increment("hedged_requests", launched - 1)
+        self.last_source = winner
+        digest = hashlib.sha1(html).digest()
+        self.content_changed = digest != self.last_digest
+        self.last_digest = digest
+        self.last_html = html
+
+        if save_sample:
+            self.record_sample(html)
+        return html
+
+    def stats(self):
+        """
+        Get per-source latency and outcome counters.
+        :return: List of dictionaries, primary first.
+        """
+        return [
+            {"source": source.name, "latency": source.latency, "hedge_delay": source.hedge_delay(),
+             "successes": source.successes, "failures": source.failures}
+            for source in self.ranked_sources()
+        ]
+
+    def close(self):
+        """
+        Shut down the request threads and close the sources.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for source in self.sources:
+            source.close()
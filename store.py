@@ -0,0 +1,193 @@
+import os
+import queue
+import sqlite3
+import time
+from threading import Event, Thread
+from utils import log_error
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    event_id TEXT NOT NULL,
+    release_time TEXT,
+    polled_at REAL NOT NULL,
+    currency TEXT,
+    importance INTEGER,
+    actual REAL,
+    actual_unit TEXT,
+    actual_color TEXT,
+    forecast REAL,
+    forecast_unit TEXT,
+    forecast_color TEXT,
+    previous REAL,
+    previous_unit TEXT,
+    previous_color TEXT,
+    signal TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_observations_event ON observations (event_id, polled_at);
+CREATE INDEX IF NOT EXISTS idx_observations_release ON observations (release_time, polled_at);
+"""
+
+INSERT = "INSERT INTO observations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def observation(d, polled_at):
+    """
+    Build an observations row from a Data object.
+    :param d: The Data object.
+    :param polled_at: Poll timestamp (seconds since the epoch).
+    :return: Tuple matching the observations columns.
+    """
+    values = []
+    for v in (d.actual, d.forecast, d.previous):
+        values.extend((v.value, v.unit, v.color) if v else (None, None, None))
+    return (d.id, d.datetime, polled_at, d.currency, d.importance, *values, d.signal)
+
+
+class EventStore:
+    def __init__(self, path, batch_size=500, flush_interval=1.0):
+        """
+        Append-only SQLite store of observed event values.
+        Writes are queued and committed in batches by a background thread, off the polling path.
+        :param path: Path to the SQLite database file.
+        :param batch_size: Maximum number of rows per committed batch.
+        :param flush_interval: Maximum seconds a queued row waits before being committed.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self.connect()
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+
+        self.writer = Thread(target=self.write_loop, name="EventStoreWriter", daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        """
+        Open a connection to the database.
+        :return: A sqlite3 connection.
+        """
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(self, dataset, polled_at=None):
+        """
+        Queue observations for the given rows. Returns immediately.
+        :param dataset: List of Data objects.
+        :param polled_at: Poll timestamp (seconds since the epoch), defaults to now.
+        """
+        polled_at = time.time() if polled_at is None else polled_at
+        rows = [observation(d, polled_at) for d in dataset]
+        if rows:
+            self.queue.put(rows)
+
+    def write_loop(self):
+        """
+        Background writer: collect queued rows and commit them in batches.
+        """
+        connection = self.connect()
+        pending = []
+        running = True
+        while running:
+            flushed = None
+            deadline = time.monotonic() + self.flush_interval
+            while len(pending) < self.batch_size:
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, Event):
+                    flushed = item
+                    break
+                pending.extend(item)
+            if pending:
+                try:
+                    with connection:
+                        connection.executemany(INSERT, pending)
+                except Exception as e:
+                    log_error(f"Failed to write {len(pending)} observations to {self.path}: {e}")
+                pending = []
+            if flushed:
+                flushed.set()
+        connection.close()
+
+    def flush(self):
+        """
+        Block until everything queued so far has been committed.
+        """
+        if self.writer.is_alive():
+            flushed = Event()
+            self.queue.put(flushed)
+            flushed.wait()
+
+    def close(self):
+        """
+        Commit pending writes and stop the writer.
+        """
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+    def query(self, sql, parameters=()):
+        """
+        Run a read query and return rows as dictionaries.
+        :param sql: The SQL query.
+        :param parameters: Query parameters.
+        :return: List of dictionaries.
+        """
+        connection = self.connect()
+        try:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, parameters)]
+        finally:
+            connection.close()
+
+    def history(self, event_id, release_time=None):
+        """
+        Get every observation of an event, oldest first.
+        :param event_id: The event id.
+        :param release_time: Optional release date and time, to select a single occurrence.
+        :return: List of observation dictionaries.
+        """
+        if release_time is None:
+            return self.query("SELECT * FROM observations WHERE event_id = ? ORDER BY polled_at", (event_id,))
+        return self.query(
+            "SELECT * FROM observations WHERE event_id = ? AND release_time = ? ORDER BY polled_at",
+            (event_id, release_time),
+        )
+
+    def first_actual(self, event_id, release_time):
+        """
+        Get the first observation in which the actual value of a release appeared.
+        :param event_id: The event id.
+        :param release_time: The release date and time as published (e.g., "2024/12/06 08:30:00").
+        :return: Observation dictionary, or None if the actual was never observed.
+        """
+        rows = self.query(
+            "SELECT * FROM observations WHERE event_id = ? AND release_time = ? AND actual IS NOT NULL "
+            "ORDER BY polled_at LIMIT 1",
+            (event_id, release_time),
+        )
+        return rows[0] if rows else None
+
+    def releases_between(self, start, end):
+        """
+        Get observations of events released in a time range.
+        :param start: Start release time, inclusive (e.g., "2024/12/06 00:00:00").
+        :param end: End release time, exclusive.
+        :return: List of observation dictionaries ordered by release and poll time.
+        """
+        return self.query(
+            "SELECT * FROM observations WHERE release_time >= ? AND release_time < ? ORDER BY release_time, polled_at",
+            (start, end),
+        )
@@ -0,0 +1,152 @@
+import sys
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive import ArchiveWriter, SnapshotArchive, view_archive_paths, FULL, DELTA, SAME
+from replay import replay, snapshot_time
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+SNAPSHOTS = [os.path.join(SAMPLE_DIR, name) for name in (
+    "economic_calendar_20241205_045400.html", "economic_calendar_20241205_152616.html",
+    "economic_calendar_20241206_171128.html", "economic_calendar_20241206_203831.html",
+)]
+
+def build_archive(path, keyframe_interval=2):
+    """
+    Archive the sample snapshots, polling the last one twice.
+    :return: List of (timestamp, content) tuples in archive order.
+    """
+    snapshots = []
+    for file_path in SNAPSHOTS:
+        with open(file_path, "rb") as f:
+            snapshots.append((snapshot_time(file_path).timestamp(), f.read()))
+    snapshots.append((snapshots[-1][0] + 3, snapshots[-1][1]))
+
+    archive = SnapshotArchive(path, keyframe_interval=keyframe_interval)
+    kinds = [archive.append(content, timestamp) for timestamp, content in snapshots]
+    archive.close()
+    assert kinds == [FULL, DELTA, DELTA, FULL, SAME]
+    return snapshots
+
+def test_archive():
+    """
+    Snapshots are stored compressed and deduplicated, and read back exactly, streamed or by timestamp.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "snapshots.ecar")
+        snapshots = build_archive(path)
+
+        archive = SnapshotArchive(path)
+        stats = archive.stats()
+        assert stats["snapshots"] == 5 and stats["unique"] == 4
+        assert stats["archive_bytes"] < stats["raw_bytes"] / 5
+        print(f"{stats['raw_bytes']} bytes of snapshots stored in {stats['archive_bytes']}")
+
+        assert list(archive.iter_snapshots()) == snapshots
+        for index in reversed(range(len(snapshots))):
+            assert archive.read(index) == snapshots[index][1]
+        assert archive.get(snapshots[2][0] + 60) == snapshots[2]
+        assert archive.get(snapshots[0][0] - 1) is None
+        assert archive.segments() == [(0, 3), (3, 5)]
+        archive.close()
+
+        # A record cut short by a crash is ignored, then overwritten by the next append
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 10)
+        archive = SnapshotArchive(path)
+        assert len(archive) == 5
+        assert archive.append(snapshots[0][1], snapshots[-1][0] + 3) == SAME
+        archive.close()
+        assert list(SnapshotArchive(path).iter_snapshots())[-1] == (snapshots[-1][0] + 3, snapshots[0][1])
+
+def append_in_process(path, contents):
+    """
+    Append snapshots to a shared archive from a worker process.
+    :return: Number of snapshots appended.
+    """
+    archive = SnapshotArchive(path)
+    for content in contents:
+        archive.append(content)
+    archive.close()
+    return len(contents)
+
+def test_concurrent_writers():
+    """
+    Writers in several processes, each holding the archive open, never overwrite each other's records.
+    """
+    contents = []
+    for file_path in SNAPSHOTS:
+        with open(file_path, "rb") as f:
+            contents.append(f.read())
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "snapshots.ecar")
+        # Two writers open before either appends, interleaving their records
+        first, second = SnapshotArchive(path), SnapshotArchive(path)
+        first.append(contents[0], 100)
+        second.append(contents[1], 101)
+        assert first.append(contents[0], 50, clamp=True) == SAME
+        second.append(contents[2])
+        first.close()
+        second.close()
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            appended = sum(executor.map(append_in_process, [path] * 4, [contents] * 4))
+
+        archive = SnapshotArchive(path)
+        snapshots = list(archive.iter_snapshots())
+        archive.close()
+        assert len(snapshots) == 4 + appended
+        assert [content for _, content in snapshots[:4]] == [contents[0], contents[1], contents[0], contents[2]]
+        assert snapshots[2][0] == 101
+        assert sorted(content for _, content in snapshots[4:]) == sorted(contents * 4)
+        assert [timestamp for timestamp, _ in snapshots] == sorted(timestamp for timestamp, _ in snapshots)
+        print(f"{len(snapshots)} snapshots appended by interleaved writers read back intact")
+
+def test_archive_writer():
+    """
+    The background writer appends each view's pages to its own archive and survives a clock going back.
+    """
+    contents = []
+    for file_path in SNAPSHOTS[:2]:
+        with open(file_path, "rb") as f:
+            contents.append(f.read())
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = view_archive_paths(os.path.join(temp_dir, "snapshots.ecar"), 2)
+        assert paths[1] == os.path.join(temp_dir, "snapshots.1.ecar")
+        writer = ArchiveWriter([SnapshotArchive(path) for path in paths])
+        writer.submit([contents[0], contents[1]], 100)
+        writer.submit([contents[0], None], 90)  # Clock stepped back; the second view failed
+        writer.submit([contents[1], contents[1]], 110)
+        writer.flush()
+        writer.close()
+
+        first, second = SnapshotArchive(paths[0]), SnapshotArchive(paths[1])
+        assert list(first.iter_snapshots()) == [(100, contents[0]), (100, contents[0]), (110, contents[1])]
+        assert list(second.iter_snapshots()) == [(100, contents[1]), (110, contents[1])]
+        first.close()
+        second.close()
+        print("Background writer recorded every poll in its view's archive")
+
+def test_replay_archive():
+    """
+    Replaying an archive gives the same timeline as replaying the HTML files it was built from.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "snapshots.ecar")
+        build_archive(path)
+        from_files = replay(SNAPSHOTS, workers=2, cache_dir=None)
+        from_archive = replay([path], workers=2, cache_dir=None)
+        assert [(r["time"], r["rows"], r["signal_counts"]) for r in from_archive[:4]] == \
+            [(r["time"], r["rows"], r["signal_counts"]) for r in from_files]
+        assert from_archive[4]["signal_counts"] == from_archive[3]["signal_counts"]
+        print(f"Replayed {len(from_archive)} archived snapshots")
+
+if __name__ == "__main__":
+    test_archive()
+    test_concurrent_writers()
+    test_archive_writer()
+    test_replay_archive()
@@ -0,0 +1,73 @@
+import sys
+import os
+import time
+from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_fetcher import AsyncFetcher, get_parser
+from fetcher import Fetcher
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+VIEWS = {
+    "/week": "economic_calendar_2024_1125_1129.html",
+    "/today": "economic_calendar_20241205_152616.html",
+    "/today-again": "economic_calendar_20241205_152616.html",
+}
+
+
+class ViewHandler(BaseHTTPRequestHandler):
+    """
+    Serve one sample calendar per path.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        with open(os.path.join(SAMPLE_DIR, VIEWS[self.path]), "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_async_fetcher():
+    """
+    Fetch several views concurrently and verify the merged, deduplicated dataset.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ViewHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    fetcher = AsyncFetcher([base + path for path in VIEWS], parser_mode="table", max_concurrency=2)
+    try:
+        start = time.perf_counter()
+        dataset = fetcher.fetch_data()
+        print(f"Fetched {len(VIEWS)} views: {len(dataset)} rows in {time.perf_counter() - start:.3f}s")
+
+        serial = Fetcher(None, parser_mode="table")
+        week = serial.read_data(os.path.join(SAMPLE_DIR, VIEWS["/week"]))
+        today = serial.read_data(os.path.join(SAMPLE_DIR, VIEWS["/today"]))
+        expected = {(d.id, d.datetime) for d in week + today}
+        assert len(dataset) == len(expected)
+        assert {(d.id, d.datetime) for d in dataset} == expected
+        assert [d.datetime for d in dataset] == sorted(d.datetime for d in dataset)
+
+        # Workers reuse one parser per mode and timezone
+        assert get_parser("table") is get_parser("table") is not get_parser("full")
+
+        # The raw page of every view is kept for the snapshot archives
+        for path, page in zip(VIEWS, fetcher.last_pages):
+            with open(os.path.join(SAMPLE_DIR, VIEWS[path]), "rb") as f:
+                assert page == f.read()
+    finally:
+        fetcher.close()
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    test_async_fetcher()
@@ -0,0 +1,60 @@
+import sys
+import os
+import glob
+import random
+import time
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+from processor import SignalProcessor
+from data import Data, Value
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+
+def random_dataset(size, seed=0):
+    """
+    Build a synthetic dataset covering missing, zero, equal and random values.
+    """
+    rng = random.Random(seed)
+    choices = [None, 0.0, 1.0, -1.0, 2.0, 0.5, 1.1, 1.15, 0.85]
+
+    def value():
+        if rng.random() < 0.1:
+            return None
+        return Value(rng.choice(choices + [round(rng.uniform(-3, 3), 2)]), "", "neutral")
+
+    dataset = []
+    for i in range(size):
+        d = Data("00:00", "USD", "Event", f"event-{i}", 1, value(), value(), value())
+        d.set_pn_indicator(rng.choice(["positive", "negative", None]))
+        dataset.append(d)
+    return dataset
+
+def test_batch_classifier():
+    """
+    Verify that batch classification matches per-row classification.
+    """
+    processor = SignalProcessor()
+    fetcher = Fetcher(None, parser_mode="table")
+
+    for file_path in sorted(glob.glob(os.path.join(SAMPLE_DIR, "*.html"))):
+        dataset = processor.add_pn_indicator(fetcher.read_data(file_path))
+        assert [processor.classify_signal(d) for d in dataset] == processor.classify_batch(dataset), file_path
+
+    dataset = random_dataset(20000)
+    start = time.perf_counter()
+    expected = [processor.classify_signal(d) for d in dataset]
+    row_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    signals = processor.classify_batch(dataset)
+    batch_elapsed = time.perf_counter() - start
+
+    assert signals == expected
+    assert processor.most_common_signal(signals) in set(expected)
+    print(f"{len(dataset)} rows: per-row {row_elapsed:.3f}s, batch {batch_elapsed:.3f}s")
+
+if __name__ == "__main__":
+    test_batch_classifier()
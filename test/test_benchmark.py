@@ -0,0 +1,31 @@
+import sys
+import os
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import build_inputs, run_benchmark, compare, STAGES, DEFAULT_SCALE_SOURCE
+
+def test_benchmark():
+    """
+    Run the benchmark on a small synthetic calendar and check the baseline comparison.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        inputs = build_inputs(temp_dir, [2], DEFAULT_SCALE_SOURCE, temp_dir)
+        results = run_benchmark(inputs, repeat=2)
+
+    stats = results["synthetic_2x"]
+    assert set(stats) == set(STAGES)
+    assert stats["extract_data"]["rows"] == 120
+    assert all(stage["p50_ms"] <= stage["p99_ms"] for stage in stats.values())
+
+    # Identical results never regress; a baseline ten times faster always does
+    assert compare(results, results) == []
+    faster = {name: {stage: dict(s, p50_ms=s["p50_ms"] / 10) for stage, s in stages.items()}
+              for name, stages in results.items()}
+    assert any(stage == "html_load" for _, stage, _, _ in compare(results, faster))
+    print(f"html_load p50 {stats['html_load']['p50_ms']:.2f} ms for {stats['html_load']['rows']} rows")
+
+if __name__ == "__main__":
+    test_benchmark()
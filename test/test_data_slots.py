@@ -0,0 +1,73 @@
+import sys
+import os
+import tracemalloc
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+from data import Data, Value
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "sample", "economic_calendar.html")
+
+
+class PlainValue:
+    """
+    Value without __slots__, for comparison.
+    """
+    def __init__(self, value, unit, color):
+        self.value = value
+        self.unit = unit
+        self.color = color
+
+
+class PlainData:
+    """
+    Data without __slots__, for comparison.
+    """
+    def __init__(self, d):
+        for name in Data.__slots__:
+            setattr(self, name, getattr(d, name))
+
+
+def measure(build):
+    """
+    Measure the memory allocated by a function.
+    :return: A tuple (result, bytes).
+    """
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def copy_value(v, value_class):
+    return value_class(v.value, v.unit, v.color) if v else None
+
+
+def test_data_slots():
+    """
+    Verify that Data and Value rows carry no per-instance __dict__ and take less memory than plain objects.
+    """
+    dataset = Fetcher(None, parser_mode="table").read_data(SAMPLE_FILE)
+    assert dataset and not hasattr(dataset[0], "__dict__") and not hasattr(dataset[0].previous, "__dict__")
+
+    def build(data_class, value_class):
+        def copy():
+            rows = []
+            for d in dataset:
+                row = Data(d.time, d.currency, d.event, d.id, d.importance, copy_value(d.actual, value_class),
+                           copy_value(d.previous, value_class), copy_value(d.forecast, value_class), d.datetime)
+                rows.append(row if data_class is Data else PlainData(row))
+            return rows
+        return copy
+
+    _, slotted_bytes = measure(build(Data, Value))
+    _, plain_bytes = measure(build(PlainData, PlainValue))
+    assert slotted_bytes < plain_bytes
+    print(f"{len(dataset)} rows: {slotted_bytes} bytes with __slots__, {plain_bytes} bytes without")
+
+if __name__ == "__main__":
+    test_data_slots()
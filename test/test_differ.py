@@ -0,0 +1,88 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import processor as processor_module
+from fetcher import Fetcher
+from processor import SignalProcessor
+from event_index import EventIndex
+from differ import RowDiffer
+from data import ChangeType, SignalLevel
+from config import Config
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+
+def test_differ():
+    """
+    Diff two snapshots of the same day and verify that only changed rows are reported,
+    with signals identical to a full re-classification.
+    """
+    fetcher = Fetcher(Config.BASE_URL, parser_mode="table")
+    processor = SignalProcessor()
+    differ = RowDiffer(processor)
+
+    earlier = fetcher.read_data(os.path.join(SAMPLE_DIR, "economic_calendar_20241206_171128.html"))
+    later = fetcher.read_data(os.path.join(SAMPLE_DIR, "economic_calendar_20241206_203831.html"))
+
+    changes = differ.update(earlier)
+    assert len(changes) == len(earlier)
+    assert all(change.change_type == ChangeType.NEW for change in changes)
+
+    # Diffing the same snapshot again yields no changes
+    assert differ.update(fetcher.read_data(os.path.join(SAMPLE_DIR, "economic_calendar_20241206_171128.html"))) == []
+
+    changes = differ.update(later)
+    for change in changes:
+        print(change)
+    released = [change for change in changes if change.change_type == ChangeType.RELEASED]
+    assert released and len(changes) < len(later)
+
+    # Signals carried over from the snapshot must match a full classification
+    expected = fetcher.read_data(os.path.join(SAMPLE_DIR, "economic_calendar_20241206_203831.html"))
+    processor.add_pn_indicator(expected)
+    expected_signals = [processor.classify_signal(d) for d in expected]
+    assert [d.signal for d in later] == expected_signals
+    print(f"{len(changes)} of {len(later)} rows changed, {len(released)} released")
+
+def test_catalog_edit():
+    """
+    Editing a P/N indicator in the catalog re-classifies the row on the next update, though its values did not change.
+    """
+    fetcher = Fetcher(Config.BASE_URL, parser_mode="table")
+    sample = os.path.join(SAMPLE_DIR, "economic_calendar_20241206_203831.html")
+    original_index = processor_module.event_index
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "event_data.json")
+        shutil.copy(original_index.path, path)
+        processor_module.event_index = EventIndex(path, check_interval=0)
+        try:
+            differ = RowDiffer(SignalProcessor())
+            differ.update(fetcher.read_data(sample))
+            assert differ.update(fetcher.read_data(sample)) == []
+
+            # A released row of the catalog whose signal depends on its P/N indicator
+            with open(path) as f:
+                events = json.load(f)
+            row = next(d for _, d in differ.snapshot.values() if d.id in events and d.pn_indicator
+                       and d.signal not in (SignalLevel.NEUTRAL.value, SignalLevel.NO_SIGNAL.value))
+            flipped = "negative" if row.pn_indicator == "positive" else "positive"
+            events[row.id]["pn_indicator"] = flipped
+            with open(path, "w") as f:
+                json.dump(events, f, indent=4)
+
+            changes = differ.update(fetcher.read_data(sample))
+            assert [(change.change_type, change.data.id) for change in changes] == [(ChangeType.UPDATED, row.id)]
+            assert changes[0].data.pn_indicator == flipped
+            assert changes[0].data.signal != row.signal
+            print(f"Catalog edit re-classified {row.id}: {row.signal} -> {changes[0].data.signal}")
+        finally:
+            processor_module.event_index = original_index
+
+if __name__ == "__main__":
+    test_differ()
+    test_catalog_edit()
@@ -0,0 +1,49 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_index import EventIndex
+
+EVENT_DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "event_data.json")
+
+def test_event_index():
+    """
+    Verify lazy loading, lookups by renamed slug, secondary indexes, the compiled cache and hot reload.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "event_data.json")
+        shutil.copy(EVENT_DATA_FILE, path)
+        with open(path) as f:
+            events = json.load(f)
+
+        index = EventIndex(path, check_interval=0, cache_dir=os.path.join(temp_dir, "cache"))
+        assert index.signature is None  # Nothing is loaded until first use
+        assert len(index) == len(events)
+        assert os.path.exists(index.cache_path) and index.cache_path.startswith(temp_dir)
+
+        event_id, event = next(iter(events.items()))
+        assert index.get(event_id) == event
+        renamed = "renamed-slug-" + event_id.rsplit("-", 1)[-1]
+        assert index.get(renamed) == event
+        assert index.get("unknown-event") is None
+
+        usd_high = index.find(currency="USD", importance=3)
+        assert usd_high and all(events[i]["currency"] == "USD" and events[i]["importance"] == 3 for i in usd_high)
+
+        # A second index over the same file loads from the compiled cache
+        assert len(EventIndex(path, cache_dir=os.path.join(temp_dir, "cache"))) == len(events)
+
+        # Editing the file is picked up without a restart
+        events[event_id]["pn_indicator"] = "negative" if event["pn_indicator"] != "negative" else "positive"
+        with open(path, "w") as f:
+            json.dump(events, f, indent=4)
+        assert index.get(event_id)["pn_indicator"] == events[event_id]["pn_indicator"]
+        print(f"Event index OK ({len(index)} events, {len(usd_high)} high-importance USD)")
+
+if __name__ == "__main__":
+    test_event_index()
@@ -0,0 +1,48 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export_event_ids import export_event_ids, scan_snapshot
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+SNAPSHOTS = [os.path.join(SAMPLE_DIR, name)
+             for name in ("economic_calendar_20241206_171128.html", "economic_calendar_20241205_152616.html")]
+
+def test_export_event_ids():
+    """
+    Events of several snapshots are deduplicated and merged without touching curated entries.
+    """
+    scanned = {}
+    for path in SNAPSHOTS:
+        scanned.update(scan_snapshot(path))
+    event_id, entry = next(iter(scanned.items()))
+    renamed_id, renamed = list(scanned.items())[1]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, "event_data.json")
+        curated = {
+            event_id: {**entry, "pn_indicator": "Negative", "event": "Curated name"},
+            # Same event under an older slug: matched by its numeric id, not added twice
+            "old-slug-" + renamed_id.rsplit("-", 1)[-1]: {**renamed, "pn_indicator": "positive"},
+        }
+        with open(output, "w") as f:
+            json.dump(curated, f)
+
+        added = export_event_ids(SNAPSHOTS, output, workers=2, cache_dir=None)
+        with open(output) as f:
+            catalog = json.load(f)
+        assert len(added) == len(scanned) - 2
+        assert len(catalog) == len(scanned)
+        assert {key: catalog[key] for key in curated} == curated
+        assert os.listdir(temp_dir) == ["event_data.json"]  # No temporary file left behind
+
+        # Refreshing again finds nothing new
+        assert export_event_ids(SNAPSHOTS, output, cache_dir=None) == []
+        print(f"{len(catalog)} events, {len(curated)} curated entries preserved")
+
+if __name__ == "__main__":
+    test_export_event_ids()
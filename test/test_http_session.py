@@ -0,0 +1,114 @@
+import sys
+import os
+import gzip
+import hashlib
+from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "sample", "economic_calendar_20241205_152616.html")
+
+with open(SAMPLE_FILE, "rb") as f:
+    SAMPLE_HTML = f.read()
+SAMPLE_ETAG = '"' + hashlib.sha1(SAMPLE_HTML).hexdigest() + '"'
+
+
+class CalendarHandler(BaseHTTPRequestHandler):
+    """
+    Serve the sample calendar gzip-compressed with an ETag, answering 304 on revalidation.
+    """
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    accept_encodings = []
+    requests = []
+
+    def do_GET(self):
+        CalendarHandler.connections.add(self.client_address)
+        CalendarHandler.accept_encodings.append(self.headers.get("Accept-Encoding", ""))
+        CalendarHandler.requests.append(self.headers)
+        if self.headers.get("If-None-Match") == SAMPLE_ETAG:
+            self.send_response(304)
+            self.send_header("ETag", SAMPLE_ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = SAMPLE_HTML
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", SAMPLE_ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_http_session():
+    """
+    Verify compressed transfer, ETag revalidation and connection reuse against a local server.
+    """
+    CalendarHandler.connections.clear()
+    CalendarHandler.accept_encodings.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CalendarHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        fetcher = Fetcher(f"http://127.0.0.1:{server.server_port}/", parser_mode="table")
+
+        first = fetcher.fetch_data()
+        assert fetcher.content_changed
+        assert fetcher.last_html == SAMPLE_HTML
+        print(f"First fetch: {len(first)} rows")
+
+        second = fetcher.fetch_data()
+        assert not fetcher.content_changed
+        assert second is first
+        print("Second fetch: not modified, parsing skipped")
+
+        assert all("gzip" in encoding for encoding in CalendarHandler.accept_encodings)
+        assert len(CalendarHandler.connections) == 1
+        print("Both fetches reused a single connection")
+
+        # Closing drops the pooled connection; the session still works afterwards
+        fetcher.close()
+        assert fetcher.fetch_data() is first
+        assert len(CalendarHandler.connections) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_revalidation_headers():
+    """
+    Verify a revalidation request still carries the session headers (gzip, User-Agent) next to its validator.
+    """
+    CalendarHandler.requests.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CalendarHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        fetcher = Fetcher(f"http://127.0.0.1:{server.server_port}/", parser_mode="table")
+        fetcher.fetch_data()
+        fetcher.fetch_data()
+
+        revalidation = CalendarHandler.requests[-1]
+        assert revalidation.get("If-None-Match") == SAMPLE_ETAG
+        assert "gzip" in revalidation.get("Accept-Encoding", "")
+        assert revalidation.get("User-Agent") == fetcher.headers["User-Agent"]
+        print(f"Revalidation headers: {revalidation}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    test_http_session()
+    test_revalidation_headers()
@@ -0,0 +1,100 @@
+import sys
+import os
+import json
+import tempfile
+import urllib.request
+from threading import Thread
+from http.server import ThreadingHTTPServer
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+from metrics import Metrics, NO_OP, metrics
+from test_http_session import CalendarHandler, SAMPLE_HTML
+
+def test_disabled_metrics():
+    """
+    Disabled metrics hand out the shared no-op timer and record nothing.
+    """
+    disabled = Metrics()
+    assert disabled.stage("fetch") is NO_OP
+    with disabled.stage("fetch"):
+        pass
+    disabled.increment("fetches")
+    disabled.set_gauge("rows", 10)
+    assert disabled.snapshot() == {"stages": {}, "counters": {}, "gauges": {}}
+
+def test_metrics_export():
+    """
+    Record stages, counters and gauges and export them as Prometheus text, JSON, a file and over HTTP.
+    """
+    recorder = Metrics(enabled=True, window=3)
+    for seconds in (0.002, 0.004, 0.2, 0.3):
+        recorder.observe("parse", seconds)
+    with recorder.stage("render"):
+        pass
+    recorder.increment("bytes_downloaded", 100)
+    recorder.increment("bytes_downloaded", 50)
+    recorder.set_gauge("rows", 42)
+
+    summary = recorder.snapshot()
+    assert summary["stages"]["parse"]["count"] == 4
+    assert summary["stages"]["parse"]["p99_seconds"] == 0.3
+    assert summary["stages"]["parse"]["p50_seconds"] == 0.2  # Rolling window keeps the last 3 samples
+    assert summary["counters"] == {"bytes_downloaded": 150}
+
+    text = recorder.to_prometheus()
+    print(text)
+    assert 'ecocal_stage_duration_seconds_bucket{stage="parse",le="0.005"} 2' in text
+    assert 'ecocal_stage_duration_seconds_bucket{stage="parse",le="+Inf"} 4' in text
+    assert 'ecocal_stage_duration_seconds_count{stage="render"} 1' in text
+    assert "ecocal_bytes_downloaded_total 150" in text
+    assert "ecocal_rows 42" in text
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "metrics.json")
+        recorder.write(path)
+        with open(path) as f:
+            assert json.load(f)["gauges"]["rows"] == 42
+
+    server = recorder.serve(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+            assert b"ecocal_rows 42" in response.read()
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics.json") as response:
+            assert json.load(response)["counters"]["bytes_downloaded"] == 150
+    finally:
+        recorder.close()
+
+def test_fetcher_metrics():
+    """
+    Fetcher records fetch, parse and extract stages and counts compressed bytes on the wire.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CalendarHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    metrics.enabled = True
+    try:
+        fetcher = Fetcher(f"http://127.0.0.1:{server.server_port}/", parser_mode="table")
+        dataset = fetcher.fetch_data()
+        fetcher.fetch_data()  # Revalidated with 304: fetched but not parsed again
+
+        summary = metrics.snapshot()
+        assert dataset
+        assert summary["stages"]["fetch"]["count"] == 2
+        assert summary["stages"]["parse"]["count"] == 1
+        assert summary["stages"]["extract"]["count"] == 1
+        assert summary["counters"]["fetches"] == 2
+        assert 0 < summary["counters"]["bytes_downloaded"] < len(SAMPLE_HTML)
+        print(json.dumps(summary, indent=4))
+    finally:
+        metrics.enabled = False
+        metrics.histograms.clear()
+        metrics.counters.clear()
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    test_disabled_metrics()
+    test_metrics_export()
+    test_fetcher_metrics()
@@ -0,0 +1,52 @@
+import sys
+import os
+import time
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher, split_calendar_table
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+WEEKLY_FILE = os.path.join(SAMPLE_DIR, "economic_calendar_2024_1125_1129.html")
+DAILY_FILE = os.path.join(SAMPLE_DIR, "economic_calendar_20241206_171128.html")
+
+def row_key(d):
+    """
+    Build a comparable tuple from a Data object.
+    """
+    values = [(v.value, v.unit, v.color) if v else None for v in (d.actual, d.forecast, d.previous)]
+    return (d.time, d.datetime, d.currency, d.event, d.id, d.importance, *values)
+
+def test_split_calendar_table():
+    """
+    A weekly page splits into one chunk per day, covering the whole table.
+    """
+    with open(WEEKLY_FILE, "rb") as f:
+        table = Fetcher(None)._slice_calendar_table(f.read())
+    chunks = split_calendar_table(table)
+    assert len(chunks) == 5
+    assert b"".join(chunks) == table
+
+def test_parallel_parse():
+    """
+    Parsing day chunks across a process pool gives the same rows, in the same order, as the serial parse.
+    """
+    for parser_mode in ("full", "table"):
+        fetcher = Fetcher(None, target_timezone="Asia/Ho_Chi_Minh", parser_mode=parser_mode)
+        for file_path in (WEEKLY_FILE, DAILY_FILE):
+            start = time.perf_counter()
+            serial = fetcher.read_data(file_path)
+            serial_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parallel = fetcher.read_data(file_path, workers=2)
+            parallel_elapsed = time.perf_counter() - start
+
+            assert [row_key(d) for d in serial] == [row_key(d) for d in parallel], file_path
+            print(f"{parser_mode} {os.path.basename(file_path)}: {len(parallel)} rows, "
+                  f"serial {serial_elapsed:.3f}s, parallel {parallel_elapsed:.3f}s")
+
+if __name__ == "__main__":
+    test_split_calendar_table()
+    test_parallel_parse()
@@ -0,0 +1,76 @@
+import sys
+import os
+import glob
+import time
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from fetcher import Fetcher, read_calendar_table
+from config import Config
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+
+def row_key(d):
+    """
+    Build a comparable tuple from a Data object.
+    """
+    values = [(v.value, v.unit, v.color) if v else None for v in (d.actual, d.forecast, d.previous)]
+    return (d.time, d.currency, d.event, d.id, d.importance, *values)
+
+def test_parser_mode():
+    """
+    Verify that the "table" parser mode extracts the same rows as the "full" parser mode.
+    """
+    full_fetcher = Fetcher(Config.BASE_URL, parser_mode="full")
+    table_fetcher = Fetcher(Config.BASE_URL, parser_mode="table")
+
+    for file_path in sorted(glob.glob(os.path.join(SAMPLE_DIR, "*.html"))):
+        start = time.perf_counter()
+        full_rows = full_fetcher.read_data(file_path)
+        full_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table_rows = table_fetcher.read_data(file_path)
+        table_elapsed = time.perf_counter() - start
+
+        assert [row_key(d) for d in full_rows] == [row_key(d) for d in table_rows], file_path
+        print(f"{os.path.basename(file_path)}: {len(table_rows)} rows, "
+              f"full {full_elapsed:.3f}s, table {table_elapsed:.3f}s")
+
+def test_read_calendar_table():
+    """
+    Verify that the memory-mapped pre-scan reads exactly the calendar table, and handles files without one.
+    """
+    fetcher = Fetcher(Config.BASE_URL, parser_mode="table")
+    for file_path in sorted(glob.glob(os.path.join(SAMPLE_DIR, "*.html"))):
+        with open(file_path, "rb") as f:
+            html = f.read()
+        table = read_calendar_table(file_path)
+        assert table == fetcher._slice_calendar_table(html), file_path
+        print(f"{os.path.basename(file_path)}: read {len(table)} of {len(html)} bytes")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        empty_file = os.path.join(temp_dir, "empty.html")
+        open(empty_file, "wb").close()
+        assert read_calendar_table(empty_file) is None
+        assert fetcher.read_data(empty_file) == []
+
+        other_file = os.path.join(temp_dir, "other.html")
+        with open(other_file, "wb") as f:
+            f.write(b"<html><body><table id='other'></table></body></html>")
+        assert read_calendar_table(other_file) is None
+        assert fetcher.read_data(other_file) == []
+
+        # A table nested in a row does not end the calendar table early
+        nested = (b"<table id='economicCalendarData'><tr><td><table><tr><td>1</td></tr></TABLE></td></tr>"
+                  b"<tr><td>2</td></tr></table>")
+        nested_file = os.path.join(temp_dir, "nested.html")
+        with open(nested_file, "wb") as f:
+            f.write(b"<html><body>" + nested + b"<table></table></body></html>")
+        assert read_calendar_table(nested_file) == nested
+
+if __name__ == "__main__":
+    test_parser_mode()
+    test_read_calendar_table()
@@ -0,0 +1,85 @@
+import sys
+import os
+import io
+import json
+import contextlib
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from fetcher import Fetcher
+from processor import SignalProcessor
+from profiles import Profile, ProfileSet, load_profiles
+from utils import prettify_dataset
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "sample", "economic_calendar_20241206_171128.html")
+
+def load_dataset(target_timezone=None):
+    processor = SignalProcessor()
+    dataset = Fetcher(None, target_timezone=target_timezone, parser_mode="table").read_data(SAMPLE_FILE)
+    processor.classify_batch(processor.add_pn_indicator(dataset))
+    return dataset
+
+def test_profiles():
+    """
+    Each profile renders the shared dataset as a single-profile run with its settings would, without modifying it.
+    """
+    saved = Config.PRINT_TABLE, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER, Config.USE_COLORS
+    try:
+        # What a dedicated run for a USD desk in Ho Chi Minh City would print
+        Config.PRINT_TABLE, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER, Config.USE_COLORS = \
+            True, ["USD"], 2, False
+        expected = io.StringIO()
+        with contextlib.redirect_stdout(expected):
+            prettify_dataset(load_dataset("Asia/Ho_Chi_Minh"))
+    finally:
+        Config.PRINT_TABLE, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER, Config.USE_COLORS = saved
+
+    dataset = load_dataset()
+    published = [d.time for d in dataset]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        usd_stream = io.StringIO()
+        log_path = os.path.join(temp_dir, "all.log")
+        profiles = ProfileSet([
+            Profile("usd", currencies=["USD"], importance=2, timezone="Asia/Ho_Chi_Minh", use_colors=False,
+                    sink=usd_stream),
+            Profile("all", importance=1, sink=log_path),
+        ])
+        written = profiles.render(dataset)
+        assert usd_stream.getvalue() == "[usd]\n" + expected.getvalue()
+        assert written["usd"] == len(expected.getvalue().splitlines()) + 1
+        assert [d.time for d in dataset] == published  # The shared dataset is not modified
+
+        # Nothing changed: nothing is written
+        assert profiles.render(dataset) == {"usd": 0, "all": 0}
+        profiles.close()
+        with open(log_path, encoding="utf-8") as f:
+            log = f.read()
+        assert log.startswith("[all]\n") and "EUR" in log and log.count("\n") == written["all"]
+        print(f"Rendered {written} lines from one dataset")
+
+def test_load_profiles():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "profiles.json")
+        with open(path, "w") as f:
+            json.dump({"usd": {"currencies": "USD,CAD", "importance": 2, "timezone": "America/New_York"},
+                       "all": {"currencies": "ALL", "colors": False, "sink": "stderr"}}, f)
+        usd, everything = load_profiles(path)
+        assert (usd.name, usd.currencies, usd.importance, usd.sink) == ("usd", {"USD", "CAD"}, 2, "stdout")
+        assert everything.currencies is None and not everything.use_colors
+        assert everything.timezone == Config.TARGET_TIMEZONE
+
+        with open(path, "w") as f:
+            json.dump({"typo": {"currency": "USD"}}, f)
+        try:
+            load_profiles(path)
+            assert False, "Unknown settings must be rejected"
+        except ValueError as e:
+            print(e)
+
+if __name__ == "__main__":
+    test_profiles()
+    test_load_profiles()
@@ -0,0 +1,91 @@
+import sys
+import os
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+from processor import SignalProcessor
+from differ import RowDiffer
+from publisher import AGGREGATE_KEY, SignalPublisher, Subscriber, subscribe
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+SNAPSHOTS = ["economic_calendar_20241206_171128.html", "economic_calendar_20241206_203831.html"]
+
+def read_until_aggregate(messages):
+    """
+    Collect messages up to and including the next aggregate message.
+    """
+    received = []
+    for message in messages:
+        received.append(message)
+        if message["type"] == "aggregate":
+            return received
+    return received
+
+def check_publisher(address):
+    fetcher = Fetcher(None, parser_mode="table")
+    differ = RowDiffer(SignalProcessor())
+    publisher = SignalPublisher(address)
+    publisher.start()
+    try:
+        if publisher.port:
+            address = f"127.0.0.1:{publisher.port}"
+        first = differ.update(fetcher.read_data(os.path.join(SAMPLE_DIR, SNAPSHOTS[0])))
+        publisher.publish_changes(first, differ.overall_signal(), polled_at=1.0)
+
+        # A subscriber joining late starts from the current state
+        messages = subscribe(address)
+        snapshot = read_until_aggregate(messages)
+        assert len(snapshot) == len(first) + 1
+        assert snapshot[-1] == {"type": "aggregate", "signal": differ.overall_signal(), "polled_at": 1.0}
+
+        # Then receives only what changes
+        second = differ.update(fetcher.read_data(os.path.join(SAMPLE_DIR, SNAPSHOTS[1])))
+        publisher.publish_changes(second, differ.overall_signal(), polled_at=2.0)
+        update = read_until_aggregate(messages)
+        assert len(update) == len(second) + 1
+        released = [m for m in update if m.get("change") == "Released"]
+        assert released and all(m["actual"]["value"] is not None and m["signal"] for m in released)
+        print(f"{address}: {len(snapshot) - 1} events on connect, {len(update) - 1} changes pushed")
+        messages.close()
+    finally:
+        publisher.close()
+
+def test_publisher_tcp():
+    check_publisher("127.0.0.1:0")
+
+def test_publisher_unix_socket():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        check_publisher("unix:" + os.path.join(temp_dir, "signals.sock"))
+
+def test_backpressure():
+    """
+    A subscriber that cannot keep up gets coalesced updates and loses the oldest messages, never blocking the publisher.
+    """
+    subscriber = Subscriber(writer=None, queue_size=2)
+    subscriber.push(("event", "a"), b"a1\n")
+    subscriber.push(("event", "a"), b"a2\n")
+    subscriber.push(("event", "b"), b"b1\n")
+    subscriber.push(("event", "c"), b"c1\n")
+    assert list(subscriber.pending.values()) == [b"b1\n", b"c1\n"]
+    assert subscriber.coalesced == 1 and subscriber.dropped == 1
+
+def test_coalesced_order():
+    """
+    A coalesced message is queued after the messages pushed before it, so the overall signal follows its event.
+    """
+    subscriber = Subscriber(writer=None, queue_size=10)
+    subscriber.push(("event", "a"), b"a\n")
+    subscriber.push(AGGREGATE_KEY, b"aggregate1\n")
+    subscriber.push(("event", "b"), b"b\n")
+    subscriber.push(AGGREGATE_KEY, b"aggregate2\n")
+    assert list(subscriber.pending.values()) == [b"a\n", b"b\n", b"aggregate2\n"]
+    assert subscriber.coalesced == 1
+
+if __name__ == "__main__":
+    test_publisher_tcp()
+    test_publisher_unix_socket()
+    test_backpressure()
+    test_coalesced_order()
@@ -0,0 +1,121 @@
+import sys
+import os
+import io
+import contextlib
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from data import Value
+from fetcher import Fetcher
+from processor import SignalProcessor
+from renderer import TableRenderer, CLEAR_SCREEN, RESET_SCROLL_REGION, RESTORE_CURSOR, SAVE_CURSOR, \
+    move_to, scroll_region
+from utils import prettify_dataset, TABLE_HEADERS
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "sample", "economic_calendar_20241206_171128.html")
+# Its EUR rows of importance 2 and up have unitless Actual values, which tabulate aligns on the decimal point
+NUMERIC_SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   "sample", "economic_calendar_20241205_045400.html")
+
+def load_dataset(file_path=SAMPLE_FILE):
+    processor = SignalProcessor()
+    dataset = Fetcher(None, parser_mode="table").read_data(file_path)
+    processor.classify_batch(processor.add_pn_indicator(dataset))
+    return dataset
+
+def test_renderer():
+    """
+    The first frame matches prettify_dataset; later frames only repaint changed lines.
+    """
+    saved = Config.PRINT_TABLE, Config.PRINT_CURRENCIES
+    Config.PRINT_TABLE, Config.PRINT_CURRENCIES = True, ["USD"]
+    try:
+        dataset = load_dataset()
+        expected = io.StringIO()
+        with contextlib.redirect_stdout(expected):
+            prettify_dataset(dataset)
+
+        # Appending output (log files, pipes): full frames, and only when something changed
+        stream = io.StringIO()
+        renderer = TableRenderer(stream, in_place=False)
+        assert renderer.render(dataset) == len(expected.getvalue().splitlines())
+        assert stream.getvalue() == expected.getvalue()
+        assert renderer.render(dataset) == 0
+        assert stream.getvalue() == expected.getvalue()
+
+        # Terminal: full paint once, pinned above a scroll region for the messages printed between polls
+        os.environ["LINES"] = "200"  # Tall enough for the whole frame
+        stream = io.StringIO()
+        renderer = TableRenderer(stream, in_place=True)
+        renderer.render(dataset)
+        assert stream.getvalue().startswith(CLEAR_SCREEN)
+        assert stream.getvalue().endswith(scroll_region(len(renderer.frame), 199) + move_to(len(renderer.frame)))
+        cells = dict(renderer.cells)
+
+        row = next(d for d in dataset if d.currency == "USD" and d.importance >= Config.IMPORTANCE_FILTER)
+        row.actual = Value(9.9, "%", "positive")
+        stream.seek(0)
+        stream.truncate()
+        assert renderer.render(dataset) == 1
+        # Only the changed line is rewritten, then the cursor goes back to the message area
+        assert stream.getvalue().startswith(SAVE_CURSOR + move_to(3))
+        assert stream.getvalue().endswith(RESTORE_CURSOR)
+        assert "9.9%" in stream.getvalue()
+        # Unchanged rows are reused, not formatted again
+        assert sum(1 for fingerprint, row_cells in renderer.cells.items() if cells.get(fingerprint) is row_cells) \
+            == len(renderer.cells) - 1
+        print(f"Repainted 1 of {len(renderer.frame)} lines")
+        stream.seek(0)
+        stream.truncate()
+        renderer.close()
+        assert stream.getvalue().startswith(RESET_SCROLL_REGION)
+
+        # Terminal too short to keep room for the messages: every changed frame is painted in full
+        os.environ["LINES"] = str(len(renderer.frame) + 5)
+        stream = io.StringIO()
+        renderer = TableRenderer(stream, in_place=True)
+        renderer.render(dataset)
+        row.actual = Value(8.8, "%", "positive")
+        stream.seek(0)
+        stream.truncate()
+        assert renderer.render(dataset) == len(renderer.frame)
+        assert stream.getvalue().startswith(CLEAR_SCREEN) and renderer.pinned is None
+
+        # Nothing is formatted or written when the table is disabled
+        Config.PRINT_TABLE = False
+        stream = io.StringIO()
+        renderer = TableRenderer(stream, in_place=True)
+        assert renderer.render(dataset) == 0
+        assert stream.getvalue() == "" and renderer.cells == {}
+    finally:
+        os.environ.pop("LINES", None)
+        Config.PRINT_TABLE, Config.PRINT_CURRENCIES = saved
+
+def test_renderer_numeric_columns():
+    """
+    Columns holding only numbers are aligned on the decimal point, with a right-aligned header, as in tabulate.
+    """
+    saved = Config.PRINT_TABLE, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER, Config.USE_COLORS
+    Config.PRINT_TABLE, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER = True, ["EUR"], 2
+    try:
+        dataset = load_dataset(NUMERIC_SAMPLE_FILE)
+        for use_colors in (False, True):
+            Config.USE_COLORS = use_colors
+            expected = io.StringIO()
+            with contextlib.redirect_stdout(expected):
+                prettify_dataset(dataset)
+            stream = io.StringIO()
+            renderer = TableRenderer(stream, in_place=False)
+            renderer.render(dataset)
+            assert renderer.alignments[TABLE_HEADERS.index("Actual")] is not None
+            assert stream.getvalue() == expected.getvalue()
+        print(expected.getvalue())
+    finally:
+        Config.PRINT_TABLE, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER, Config.USE_COLORS = saved
+
+if __name__ == "__main__":
+    test_renderer()
+    test_renderer_numeric_columns()
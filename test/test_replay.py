@@ -0,0 +1,34 @@
+import sys
+import os
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from replay import replay, find_snapshots
+from fetcher import Fetcher
+from processor import SignalProcessor
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+
+def test_replay():
+    """
+    Replay the sample snapshots twice; the second run must come from the cache and match a serial run.
+    """
+    paths = find_snapshots([SAMPLE_DIR])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first = replay(paths, workers=2, cache_dir=cache_dir)
+        second = replay(paths, workers=2, cache_dir=cache_dir, threshold=0.05, strong_threshold=0.1)
+    assert not any(r["cached"] for r in first)
+    assert all(r["cached"] for r in second)
+
+    processor = SignalProcessor(threshold=0.05, strong_threshold=0.1)
+    for result in second:
+        dataset = processor.add_pn_indicator(Fetcher(None).read_data(result["file"]))
+        signals = [processor.classify_signal(d) for d in dataset]
+        assert result["rows"] == len(dataset)
+        assert result["signal_counts"] == {s: signals.count(s) for s in set(signals)}
+        print(f"{result['time']} {os.path.basename(result['file'])}: {result['overall_signal']}")
+
+if __name__ == "__main__":
+    test_replay()
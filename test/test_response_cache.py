@@ -0,0 +1,75 @@
+import sys
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from threading import Thread
+from http.server import ThreadingHTTPServer
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+from response_cache import ResponseCache
+from test_http_session import CalendarHandler, SAMPLE_HTML
+
+def fetch_in_process(url, directory):
+    """
+    Fetch through a cache opened by this worker process. Runs in a worker process.
+    """
+    html = Fetcher(url, cache=ResponseCache(directory, ttl=60)).fetch_raw_html()
+    return len(html or b"")
+
+def test_response_cache():
+    """
+    Fetchers in one or several processes share a single upstream fetch within the freshness window.
+    """
+    CalendarHandler.accept_encodings.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CalendarHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            cache = ResponseCache(temp_dir, ttl=60)
+            first = Fetcher(url, parser_mode="table", cache=cache)
+            second = Fetcher(url, parser_mode="table", cache=cache)
+
+            rows = first.fetch_data()
+            assert len(CalendarHandler.accept_encodings) == 1
+            assert len(second.fetch_data()) == len(rows)
+            assert second.last_html == SAMPLE_HTML and second.etag == first.etag
+            assert len(CalendarHandler.accept_encodings) == 1
+            print("Second fetcher served from the cache")
+
+            # Concurrent misses in several processes: one upstream request
+            shared_url = url + "shared"
+            with ProcessPoolExecutor(max_workers=4) as executor:
+                sizes = list(executor.map(fetch_in_process, [shared_url] * 4, [temp_dir] * 4))
+            assert sizes == [len(SAMPLE_HTML)] * 4
+            assert len(CalendarHandler.accept_encodings) == 2
+            print("4 processes, 1 upstream request")
+
+            # Past the freshness window the page is revalidated upstream
+            cache.ttl = 0
+            assert first.fetch_raw_html() == SAMPLE_HTML
+            assert not first.content_changed
+            assert len(CalendarHandler.accept_encodings) == 3
+    finally:
+        server.shutdown()
+
+def test_eviction():
+    """
+    Least recently used bodies are evicted above the size limit; their entries become misses.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(temp_dir, ttl=60, max_bytes=150)
+        cache.put("a", b"a" * 100)
+        cache.put("b", b"b" * 40)
+        assert cache.get("a") is not None
+        os.utime(os.path.join(cache.objects_dir, cache.get("b")[1]["digest"]), (0, 0))  # b is least recently used
+        cache.put("c", b"c" * 40)
+        assert cache.get("b") is None
+        assert cache.get("a")[0] == b"a" * 100 and cache.get("c")[0] == b"c" * 40
+
+if __name__ == "__main__":
+    test_response_cache()
+    test_eviction()
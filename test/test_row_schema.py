@@ -0,0 +1,49 @@
+import sys
+import os
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from fetcher import RowExtractor, ROW_EXTRACTOR, parse_number
+
+ROW_HTML = """
+<table><tr id="eventRowId_1" data-event-datetime="2024/12/06 08:30:00">
+<td class="time">ignored</td>
+<td class="first left time">08:30</td>
+<td class="left flagCur noWrap"><span></span> USD</td>
+<td class="left textNum sentiment noWrap"><i class="grayFullBullishIcon"></i><i class="grayFullBullishIcon"></i><i class="grayEmptyBullishIcon"></i></td>
+<td class="left event"><a href="/economic-calendar/nonfarm-payrolls-227">Nonfarm Payrolls (Nov)</a></td>
+<td class="bold greenFont">227K</td>
+<td class="fore">202K</td>
+<td class="prev redFont">36K</td>
+</tr></table>
+"""
+
+def test_row_schema():
+    """
+    Each field is read from its preferred cell in one pass; missing cells fall back to the schema defaults.
+    """
+    row = BeautifulSoup(ROW_HTML, "html.parser").find("tr")
+    d = ROW_EXTRACTOR.extract(row)
+    assert (d.time, d.currency, d.event, d.id, d.importance) == \
+        ("08:30", "USD", "Nonfarm Payrolls (Nov)", "nonfarm-payrolls-227", 2)
+    assert (d.actual.value, d.actual.unit, d.actual.color) == (227.0, "K", "positive")
+    assert (d.forecast.value, d.forecast.color) == (202.0, "neutral")
+    assert (d.previous.value, d.previous.color) == (36.0, "negative")
+    assert d.datetime == "2024/12/06 08:30:00"
+
+    empty = RowExtractor().extract(BeautifulSoup("<tr><td class='theDay'>Friday</td></tr>", "html.parser").tr)
+    assert (empty.time, empty.event, empty.id, empty.importance, empty.actual) == (None, "Unknown Event", None, 0, None)
+
+def test_parse_number():
+    assert parse_number("-2.5%") == (-2.5, "%")
+    assert parse_number("1.5B") == (1.5, "B")
+    assert parse_number("0.3") == (0.3, "")
+    assert parse_number("&nbsp;") == (None, None)
+    assert parse_number("") == (None, None)
+
+if __name__ == "__main__":
+    test_row_schema()
+    test_parse_number()
+    print("Row schema tests passed")
@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 from threading import Thread
 from scheduler import Scheduler
 from config import Config
+from data import Data, Value
+from utils import get_timezone
 
 
 def mock_task():
@@ -44,5 +46,129 @@ def test_scheduler():
     scheduler_thread.join()
 
 
+def test_critical_timeline():
+    """
+    Verify that critical windows respect the weekday and that the scheduler wakes up at a window start.
+    """
+    scheduler = Scheduler(mock_task, critical_times=[
+        {"day": "wednesday", "time": "21:59:50"},
+        {"day": "friday", "time": "17:00:00"},
+    ])
+
+    wednesday = datetime(2024, 12, 4, 22, 0, 0)  # Wednesday, inside the window
+    thursday = datetime(2024, 12, 5, 22, 0, 0)   # Same time on Thursday, not critical
+    assert scheduler.is_critical_time(wednesday)
+    assert not scheduler.is_critical_time(thursday)
+    assert scheduler.next_window(thursday)[0] == datetime(2024, 12, 6, 17, 0, 0)
+
+    # A default-interval sleep that would pass the window start is cut short
+    before = datetime(2024, 12, 6, 16, 59, 58)
+    deadline = scheduler.next_deadline(time.monotonic(), 10, before, time.monotonic())
+    assert deadline - time.monotonic() <= 2
+    print("Critical timeline OK")
+
+def test_drift_free_ticks():
+    """
+    Verify that task runtime does not add drift to the interval.
+    """
+    ticks = []
+
+    def slow_task():
+        ticks.append(time.monotonic())
+        time.sleep(0.1)
+        if len(ticks) == 6:
+            scheduler.stop()
+
+    scheduler = Scheduler(slow_task, critical_times=[])
+    scheduler.default_interval, scheduler.default_unit = 0.25, "seconds"
+    scheduler.start()
+
+    spacing = [b - a for a, b in zip(ticks, ticks[1:])]
+    print(f"Tick spacing: {[round(s, 3) for s in spacing]}")
+    assert all(abs(s - 0.25) < 0.05 for s in spacing)
+
+def test_warmup_before_window():
+    """
+    Verify that the warm-up runs once, ahead of the critical window, and that the
+    first critical run happens at the window start instead of after the default interval.
+    """
+    events = []
+    start = datetime.now().replace(microsecond=0) + timedelta(seconds=3)
+    critical_times = [{"day": start.strftime("%A").lower(), "time": start.strftime("%H:%M:%S")}]
+
+    def task():
+        events.append(("task", datetime.now()))
+        if len(events) >= 4:
+            scheduler.stop()
+
+    def warm_up():
+        events.append(("warmup", datetime.now()))
+
+    scheduler = Scheduler(task, critical_times=critical_times, warmup_function=warm_up)
+    scheduler.default_interval, scheduler.default_unit = 60, "seconds"
+    scheduler.critical_interval, scheduler.critical_unit = 0.5, "seconds"
+    scheduler.warmup_lead = timedelta(seconds=1)
+    scheduler.start()
+
+    kinds = [kind for kind, _ in events]
+    print(f"Events: {[(kind, at.strftime('%H:%M:%S.%f')) for kind, at in events]}")
+    assert kinds == ["task", "warmup", "task", "task"]
+    assert start - timedelta(seconds=1.1) <= events[1][1] < start
+    assert start <= events[2][1] < start + timedelta(seconds=0.2)
+
+def release_row(release, importance=3, actual=None, forecast=0.3):
+    """
+    Build a calendar row released at a local datetime, published in the base timezone.
+    """
+    published = release.astimezone(get_timezone(Config.BASE_TIMEZONE)).strftime("%Y/%m/%d %H:%M:%S")
+    return Data(time=published[11:16], currency="USD", event="CPI (MoM)", id="cpi-733", importance=importance,
+                actual=Value(actual, "%", "neutral"), forecast=Value(forecast, "%", "neutral"),
+                previous=Value(0.2, "%", "neutral"), datetime=published)
+
+def test_release_windows():
+    """
+    Verify that pending releases in the dataset open fast-polling windows that close once the actual appears.
+    """
+    scheduler = Scheduler(mock_task, critical_times=[], adaptive=True)
+    scheduler.release_lead = timedelta(seconds=5)
+    scheduler.release_timeout = timedelta(minutes=3)
+    now = datetime.now().replace(microsecond=0)
+    release = now + timedelta(minutes=10)
+
+    dataset = [
+        release_row(release),
+        release_row(release - timedelta(minutes=5), importance=0),     # Below IMPORTANCE_FILTER
+        release_row(release - timedelta(minutes=4), forecast=None),    # Speech: no values expected
+        release_row(now - timedelta(minutes=30)),                      # Gave up waiting long ago
+    ]
+    dataset[2].previous = None
+    scheduler.update_releases(dataset, now)
+
+    assert scheduler.release_windows == [(release - timedelta(seconds=5), release + timedelta(minutes=3))]
+    assert not scheduler.is_critical_time(now)
+    assert scheduler.is_critical_time(release)
+    assert scheduler.get_current_interval(release) == scheduler.get_interval_in_seconds(
+        scheduler.critical_interval, scheduler.critical_unit)
+
+    # The default-interval sleep is cut short at the window start
+    before = release - timedelta(seconds=7)
+    deadline = scheduler.next_deadline(time.monotonic(), 60, before, time.monotonic())
+    assert deadline - time.monotonic() <= 2
+
+    # Once the actual is published the window closes and polling backs off
+    scheduler.update_releases([release_row(release, actual=0.4)], release + timedelta(seconds=3))
+    assert scheduler.release_windows == []
+    assert not scheduler.is_critical_time(release + timedelta(seconds=3))
+
+    # A failed fetch keeps the windows of the last good dataset
+    scheduler.update_releases(dataset, now)
+    scheduler.handle_result([])
+    assert scheduler.release_windows
+    print("Release windows OK")
+
 if __name__ == "__main__":
+    test_release_windows()
+    test_critical_timeline()
+    test_drift_free_ticks()
+    test_warmup_before_window()
     test_scheduler()
@@ -0,0 +1,103 @@
+import sys
+import os
+import time
+from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sources import HedgedFetcher
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "sample", "economic_calendar_20241205_152616.html")
+
+with open(SAMPLE_FILE, "rb") as f:
+    SAMPLE_HTML = f.read()
+
+
+def start_server(delay=0.0, status=200, body=SAMPLE_HTML):
+    """
+    Start a local stand-in for a calendar endpoint.
+    :param delay: Seconds to wait before answering.
+    :param status: HTTP status to answer with.
+    :param body: Response body.
+    :return: The server; its URL is http://127.0.0.1:<server_port>/
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.handle_error = lambda request, client_address: None  # Abandoned requests reset the connection
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def url(server):
+    return f"http://127.0.0.1:{server.server_port}/"
+
+
+def test_hedged_fetch():
+    """
+    A slow primary is hedged after the delay; the fast mirror wins and becomes the primary.
+    """
+    slow, fast = start_server(delay=1.0), start_server()
+    fetcher = HedgedFetcher([url(slow), url(fast)], parser_mode="table", hedge_delay=0.05)
+    try:
+        start = time.monotonic()
+        dataset = fetcher.fetch_data()
+        elapsed = time.monotonic() - start
+        assert len(dataset) == 60
+        assert fetcher.last_source.name == url(fast)
+        assert elapsed < 1.0
+        print(f"Hedged fetch answered by the mirror in {elapsed * 1000:.0f} ms")
+
+        # The slow source is measured once it answers, then ranked behind the mirror
+        time.sleep(1.2)
+        assert fetcher.ranked_sources()[0].name == url(fast)
+        # Abandoned once, not recorded again when its late answer arrives
+        assert fetcher.sources[0].successes == 0 and not fetcher.sources[0].recent
+        assert fetcher.http is None and fetcher.cache is None
+        dataset = fetcher.fetch_data()
+        assert fetcher.last_source.name == url(fast) and not fetcher.content_changed
+        print(fetcher.stats())
+    finally:
+        fetcher.close()
+        slow.shutdown()
+        fast.shutdown()
+
+
+def test_failed_and_invalid_sources():
+    """
+    HTTP errors and pages without the calendar table trigger an immediate hedge.
+    """
+    broken = start_server(status=500, body=b"error")
+    invalid = start_server(body=b"<html><body>Just a moment...</body></html>")
+    fast = start_server()
+    fetcher = HedgedFetcher([url(broken), url(invalid), url(fast)], parser_mode="table", hedge_delay=5.0)
+    try:
+        start = time.monotonic()
+        html = fetcher.fetch_raw_html()
+        assert html == SAMPLE_HTML
+        assert time.monotonic() - start < 1.0
+        assert [source.failures for source in fetcher.sources] == [1, 1, 0]
+        assert fetcher.ranked_sources()[0].name == url(fast)
+    finally:
+        fetcher.close()
+        for server in (broken, invalid, fast):
+            server.shutdown()
+
+if __name__ == "__main__":
+    test_hedged_fetch()
+    test_failed_and_invalid_sources()
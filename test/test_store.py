@@ -0,0 +1,49 @@
+import sys
+import os
+import tempfile
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetcher import Fetcher
+from processor import SignalProcessor
+from differ import RowDiffer
+from data import ChangeType
+from store import EventStore
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+SNAPSHOTS = [
+    ("economic_calendar_20241206_171128.html", 1733504688.0),
+    ("economic_calendar_20241206_203831.html", 1733517511.0),
+]
+
+def test_store():
+    """
+    Record two polls of the same day and query when an actual value first appeared.
+    """
+    fetcher = Fetcher(None, parser_mode="table")
+    differ = RowDiffer(SignalProcessor())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = EventStore(os.path.join(temp_dir, "history.db"))
+        released = []
+        for file_name, polled_at in SNAPSHOTS:
+            changes = differ.update(fetcher.read_data(os.path.join(SAMPLE_DIR, file_name)))
+            store.record([c.data for c in changes if c.change_type != ChangeType.REMOVED], polled_at)
+            released = [c.data for c in changes if c.change_type == ChangeType.RELEASED]
+        store.flush()
+
+        assert released
+        d = released[0]
+        first = store.first_actual(d.id, d.datetime)
+        assert first["polled_at"] == SNAPSHOTS[1][1]
+        assert first["actual"] == d.actual.value and first["signal"] == d.signal
+        assert len(store.history(d.id, d.datetime)) == 2
+
+        day = store.releases_between("2024/12/06 00:00:00", "2024/12/07 00:00:00")
+        assert day and all(row["release_time"].startswith("2024/12/06") for row in day)
+        print(f"{d.id} first released at poll {first['polled_at']}: {first['actual']}{first['actual_unit']}")
+        store.close()
+
+if __name__ == "__main__":
+    test_store()
@@ -0,0 +1,56 @@
+import sys
+import os
+from datetime import date, datetime, timedelta
+from pytz import timezone
+
+# Add the parent directory (project folder) to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import TimezoneConverter
+from fetcher import Fetcher
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "sample", "economic_calendar_2024_1125_1129.html")
+
+def reference(time_str, day, base, target):
+    """
+    Convert a time string the slow way, with fresh pytz objects per call.
+    """
+    naive = datetime.strptime(f"{day} {time_str}", "%Y-%m-%d %H:%M")
+    return timezone(base).localize(naive, is_dst=False).astimezone(timezone(target)).strftime("%H:%M")
+
+def test_timezone_converter():
+    """
+    Verify cached per-day conversion against per-row pytz conversion, including DST changeover days.
+    """
+    days = [date(2024, 3, 9) + timedelta(days=i) for i in range(3)]
+    days += [date(2024, 3, 30) + timedelta(days=i) for i in range(3)]
+    days += [date(2024, 10, 26) + timedelta(days=i) for i in range(10)]
+
+    for base, target in [("US/Eastern", "Asia/Ho_Chi_Minh"), ("US/Eastern", "Europe/London"), ("Europe/Berlin", "US/Pacific")]:
+        converter = TimezoneConverter(base, target)
+        for day in days:
+            for hour in range(24):
+                for minute in (0, 30):
+                    time_str = f"{hour:02d}:{minute:02d}"
+                    assert converter.convert(time_str, day) == reference(time_str, day, base, target), (base, target, day, time_str)
+    assert converter.convert("All Day") == "All Day"
+    print("Timezone converter OK")
+
+def test_fetcher_timezone():
+    """
+    Verify that extracted times are converted to the target timezone using each row's date.
+    """
+    published = Fetcher(None, parser_mode="table", base_timezone="US/Eastern").read_data(SAMPLE_FILE)
+    converted = Fetcher(None, target_timezone="Asia/Ho_Chi_Minh", parser_mode="table",
+                        base_timezone="US/Eastern").read_data(SAMPLE_FILE)
+    for before, after in zip(published, converted):
+        if len(before.time) == 5:
+            assert after.time == reference(before.time, before.datetime[:10].replace("/", "-"), "US/Eastern", "Asia/Ho_Chi_Minh")
+        else:
+            assert after.time == before.time
+    print(f"Converted {len(converted)} rows, e.g. {published[0].time} -> {converted[0].time}")
+
+if __name__ == "__main__":
+    test_timezone_converter()
+    test_fetcher_timezone()
@@ -1,5 +1,6 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from bs4 import BeautifulSoup
 from tabulate import tabulate
 from colorama import Fore, Style
@@ -40,118 +41,221 @@ def parse_time(time_str, format="%H:%M"):
         log_error(f"Time parsing error: {e}")
         return None
 
+@lru_cache(maxsize=None)
+def get_timezone(name):
+    """
+    Get a pytz timezone object, cached by name.
+    :param name: The timezone name (e.g., "US/Eastern").
+    :return: A pytz timezone.
+    """
+    return timezone(name)
+
+class TimezoneConverter:
+    def __init__(self, base_timezone, target_timezone):
+        """
+        Convert event times from the base timezone to the target timezone.
+        UTC offsets are computed once per calendar day and cached; days that contain a
+        DST transition in either timezone are converted row by row.
+        :param base_timezone: The timezone of the published times (e.g., "US/Eastern").
+        :param target_timezone: The timezone for output times (e.g., "Asia/Ho_Chi_Minh").
+        """
+        self.base_tz = get_timezone(base_timezone)
+        self.target_tz = get_timezone(target_timezone)
+        # Date -> offset between target and base, or None if the day has a DST transition
+        self.day_offsets = {}
+
+    def day_offset(self, date):
+        """
+        Get the difference between target and base local time for a whole day.
+        :param date: The date in the base timezone.
+        :return: A timedelta, or None if the offset changes during that day.
+        """
+        if date in self.day_offsets:
+            return self.day_offsets[date]
+
+        offsets = set()
+        for day in (date, date + timedelta(days=1)):
+            localized = self.base_tz.localize(datetime.combine(day, datetime.min.time()))
+            offsets.add((localized.utcoffset(), localized.astimezone(self.target_tz).utcoffset()))
+        if len(offsets) == 1:
+            base_offset, target_offset = offsets.pop()
+            offset = target_offset - base_offset
+        else:
+            offset = None
+        self.day_offsets[date] = offset
+        return offset
+
+    def convert(self, time_str, date=None):
+        """
+        Convert one "HH:MM" time string.
+        :param time_str: Time string in the base timezone (e.g., "15:30").
+        :param date: The date of the time in the base timezone, defaults to today.
+        :return: Converted "HH:MM" string, or the original string if it is not a time (e.g., "All Day").
+        """
+        if not time_str or len(time_str) != 5 or time_str[2] != ":":
+            return time_str
+        try:
+            base_time = datetime.combine(date or datetime.now().date(), datetime.min.time()).replace(
+                hour=int(time_str[:2]), minute=int(time_str[3:])
+            )
+            offset = self.day_offset(base_time.date())
+            if offset is not None:
+                target_time = base_time + offset
+            else:
+                # Ambiguous or skipped wall times (DST changeover) resolve to standard time
+                localized_time = self.base_tz.localize(base_time, is_dst=False)
+                target_time = localized_time.astimezone(self.target_tz)
+            return f"{target_time.hour:02d}:{target_time.minute:02d}"
+        except Exception as e:
+            log_error(f"Error in time conversion: {e}")
+            return time_str
+
+    def convert_dataset(self, dataset):
+        """
+        Convert the time of every row in place, using each row's release date.
+        :param dataset: List of Data objects.
+        :return: The same dataset.
+        """
+        today = datetime.now().date()
+        dates = {}
+        for d in dataset:
+            # data-event-datetime looks like "2024/12/05 08:30:00"
+            date = today
+            if d.datetime:
+                date = dates.get(d.datetime[:10])
+                if date is None:
+                    date = dates[d.datetime[:10]] = datetime.strptime(d.datetime[:10], "%Y/%m/%d").date()
+            d.time = self.convert(d.time, date)
+        return dataset
+
+@lru_cache(maxsize=None)
+def get_converter(base_timezone, target_timezone):
+    """
+    Get a shared TimezoneConverter, so its per-day offset cache is reused across calls.
+    :param base_timezone: The timezone of the published times.
+    :param target_timezone: The timezone for output times.
+    :return: A TimezoneConverter.
+    """
+    return TimezoneConverter(base_timezone, target_timezone)
+
 def convert_time_to_timezone(time_str):
     """
     Convert a time string from the base timezone to the target timezone specified in Config.
     :param time_str: Time string (e.g., "15:30").
     :return: Converted time string in the target timezone.
     """
-    try:
-        base_tz = timezone(Config.BASE_TIMEZONE)  # Use BASE_TIMEZONE from .env
-        target_tz = timezone(Config.TARGET_TIMEZONE) # Use TARGET_TIMEZONE from .env
+    return get_converter(Config.BASE_TIMEZONE, Config.TARGET_TIMEZONE).convert(time_str)
 
-        # Add today's date to the time string to avoid year 1900 issues
-        today = datetime.now().date()
-        datetime_with_date = datetime.strptime(f"{today} {time_str}", "%Y-%m-%d %H:%M")
+def select_rows(dataset, currencies, importance):
+    """
+    Keep the rows of the given currencies and minimum importance.
+    :param dataset: List of Data objects.
+    :param currencies: Collection of currency codes, or None for every currency.
+    :param importance: Minimum importance.
+    :return: Filtered list of Data objects.
+    """
+    return [
+        d for d in dataset
+        if (currencies is None or d.currency in currencies) and d.importance >= importance
+    ]
+
+def filter_rows(dataset):
+    """
+    Keep the rows selected for display by PRINT_CURRENCIES and IMPORTANCE_FILTER.
+    :param dataset: List of Data objects.
+    :return: Filtered list of Data objects.
+    """
+    return select_rows(dataset, Config.PRINT_CURRENCIES, Config.IMPORTANCE_FILTER)
+
+def format_row(d, use_colors=None, time=None):
+    """
+    Format a row for the output table, including color handling for Value objects.
+    :param d: The Data object.
+    :param use_colors: Add color codes, defaults to Config.USE_COLORS.
+    :param time: Time to display instead of d.time (e.g., converted to another timezone).
+    :return: A tuple (plain, styled) of cell lists; plain cells carry no color codes and give the display width.
+    """
+    use_colors = Config.USE_COLORS if use_colors is None else use_colors
+    time = d.time if time is None else time
+
+    # Style importance
+    importance = "*" * d.importance
+    styled_importance = importance
+    if use_colors:
+        if importance == 3:
+            styled_importance = Fore.RED + importance + Style.RESET_ALL
+        elif importance == 2:
+            styled_importance = Fore.YELLOW + importance + Style.RESET_ALL
+        elif importance == 1:
+            styled_importance = Fore.GREEN + importance + Style.RESET_ALL
+
+    # Style signal
+    signal = d.signal
+    styled_signal = signal
+    if use_colors:
+        if signal == "Strong Buy":
+            styled_signal = Fore.GREEN + signal + Style.RESET_ALL
+        elif signal == "Strong Sell":
+            styled_signal = Fore.RED + signal + Style.RESET_ALL
 
-        # Localize the datetime object to the base timezone
-        localized_time = base_tz.localize(datetime_with_date, is_dst=None)
+    # Style event
+    event = d.event
+    styled_event = event
+    if use_colors:
+        styled_event = Fore.CYAN + event + Style.RESET_ALL
 
-        # Convert to the target timezone
-        target_time = localized_time.astimezone(target_tz)
+    # Extract and style Actual, Forecast, and Previous values
+    def format_value(value_obj):
+        if not value_obj:
+            return "_", "_"
+        value = str(value_obj.value) + value_obj.unit if value_obj.value is not None else ""
+        styled_value = value
+        if use_colors:
+            if value_obj.color == "positive":
+                styled_value = Fore.GREEN + value + Style.RESET_ALL
+            elif value_obj.color == "negative":
+                styled_value = Fore.RED + value + Style.RESET_ALL
+            elif value_obj.color == "equal":
+                styled_value = Fore.YELLOW + value + Style.RESET_ALL
+        return value, styled_value
 
-        # Return formatted time string
-        return target_time.strftime("%H:%M")
-    except Exception as e:
-        print(f"Error in time conversion: {e}")
-        return time_str  # Return original time if conversion fails
+    actual, styled_actual = format_value(d.actual)
+    forecast, styled_forecast = format_value(d.forecast)
+    previous, styled_previous = format_value(d.previous)
+
+    pn_indicator = d.pn_indicator
+    styled_pn_indicator = pn_indicator
+    if use_colors:
+        # if pn_indicator == "positive":
+            # pn_indicator = Fore.GREEN + pn_indicator + Style.RESET_ALL
+        if pn_indicator == "negative":
+            styled_pn_indicator = Fore.RED + pn_indicator + Style.RESET_ALL
+
+    plain = [time, d.currency, importance, event, actual, forecast, previous, signal, pn_indicator]
+    styled = [time, d.currency, styled_importance, styled_event, styled_actual, styled_forecast,
+              styled_previous, styled_signal, styled_pn_indicator]
+    return [str(cell) if cell is not None else "" for cell in plain], [str(cell) if cell is not None else "" for cell in styled]
+
+# Headers of the output table
+TABLE_HEADERS = ["Time", "Curr", "Imp.", "Event", "Actual", "Forecast", "Previous", "Signal", "P/N"]
 
 def prettify_dataset(dataset):
     """
     Prettify and print dataset with alignment for console output, including color handling for Value objects.
+    Does nothing when PRINT_TABLE is False.
     :param dataset: List of dictionaries containing row data.
     """
-    # Apply currency filter
-    dataset = [
-        d for d in dataset
-        if (Config.PRINT_CURRENCIES and d.currency in Config.PRINT_CURRENCIES)
-            and (Config.IMPORTANCE_FILTER and d.importance >= Config.IMPORTANCE_FILTER)
-    ]
+    if not Config.PRINT_TABLE:
+        return
+
+    # Apply currency and importance filters
+    dataset = filter_rows(dataset)
 
     # If no dataset match the filter, exit early
     if not dataset:
         print("No rows to display after applying currency filter.")
         return
 
-    # Define headers
-    headers = ["Time", "Curr", "Imp.", "Event", "Actual", "Forecast", "Previous", "Signal", "P/N"]
-
-    # Prepare table data
-    table_data = []
-    for idx, d in enumerate(dataset):
-        # Style importance
-        importance = "*" * d.importance
-        if Config.USE_COLORS:
-            if importance == 3:
-                importance = Fore.RED + importance + Style.RESET_ALL
-            elif importance == 2:
-                importance = Fore.YELLOW + importance + Style.RESET_ALL
-            elif importance == 1:
-                importance = Fore.GREEN + importance + Style.RESET_ALL
-
-        # Style signal
-        signal = d.signal
-        if Config.USE_COLORS:
-            if signal == "Strong Buy":
-                signal = Fore.GREEN + signal + Style.RESET_ALL
-            elif signal == "Strong Sell":
-                signal = Fore.RED + signal + Style.RESET_ALL
-
-        # Style event
-        event = d.event
-        if Config.USE_COLORS:
-            event = Fore.CYAN + event + Style.RESET_ALL
-
-        # Extract and style Actual, Forecast, and Previous values
-        def format_value(value_obj):
-            if not value_obj:
-                return "_"
-            value = str(value_obj.value) + value_obj.unit if value_obj.value is not None else ""
-            if Config.USE_COLORS:
-                if value_obj.color == "positive":
-                    value = Fore.GREEN + value + Style.RESET_ALL
-                elif value_obj.color == "negative":
-                    value = Fore.RED + value + Style.RESET_ALL
-                elif value_obj.color == "equal":
-                    value = Fore.YELLOW + value + Style.RESET_ALL
-            return value
-
-        actual = format_value(d.actual)
-        forecast = format_value(d.forecast)
-        previous = format_value(d.previous)
-
-        pn_indicator = d.pn_indicator
-        if Config.USE_COLORS:
-            # if pn_indicator == "positive":
-                # pn_indicator = Fore.GREEN + pn_indicator + Style.RESET_ALL
-            if pn_indicator == "negative":
-                pn_indicator = Fore.RED + pn_indicator + Style.RESET_ALL
-
-        # Add d to table
-        table_data.append([
-            d.time,
-            d.currency,
-            importance,
-            event,
-            actual,
-            forecast,
-            previous,
-            signal,
-            pn_indicator
-
-        ])
-
-    # Print the formatted table if PRINT_TABLE is True
-    if Config.PRINT_TABLE:
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
-
+    # Prepare table data and print the formatted table
+    table_data = [format_row(d)[1] for d in dataset]
+    print(tabulate(table_data, headers=TABLE_HEADERS, tablefmt="grid"))